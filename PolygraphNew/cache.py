@@ -0,0 +1,144 @@
+"""
+Кеш-бекенди зі статистикою влучань/промахів.
+
+Обгортки стандартних бекендів Django (таблиця БД, файли, Redis, LocMem):
+кожен процес рахує hits/misses своїх get/get_many і пакетами додає їх
+у лічильники в самому кеші, тому статистика спільна для всіх воркерів
+gunicorn (python manage.py cache_stats). Для db/file incr не атомарний,
+тому при одночасному скиданні з кількох воркерів лічильники наближені.
+"""
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends import db, filebased, locmem, redis
+
+STATS_KEYS = ('hits', 'misses')
+STATS_KEY_TEMPLATE = 'cache-stats:{}'
+
+_MISSING = object()
+
+# Незбережені лічильники процесу: KEY_PREFIX аліасу → {'hits': n, 'misses': n}
+_pending = {}
+_pending_lock = threading.Lock()
+
+# Глибина вкладених викликів у потоці: DatabaseCache.get викликає get_many,
+# а incr - get, тому рахується лише зовнішній виклик
+_local = threading.local()
+
+
+class CacheStatsMixin:
+    """
+    Підрахунок влучань/промахів для бекенду кешу.
+
+    Аліас визначається за KEY_PREFIX (у CACHES він збігається з назвою аліасу).
+    Лічильники скидаються у кеш кожні CACHE_STATS_FLUSH_EVERY звернень.
+    """
+
+    def _enter(self):
+        _local.depth = getattr(_local, 'depth', 0) + 1
+        return _local.depth == 1
+
+    def _exit(self):
+        _local.depth -= 1
+
+    def _record(self, hits, misses):
+        with _pending_lock:
+            counters = _pending.setdefault(self.key_prefix, dict.fromkeys(STATS_KEYS, 0))
+            counters['hits'] += hits
+            counters['misses'] += misses
+            if counters['hits'] + counters['misses'] < settings.CACHE_STATS_FLUSH_EVERY:
+                return
+            flush = dict(counters)
+            counters.update(dict.fromkeys(STATS_KEYS, 0))
+        self.flush_stats(flush)
+
+    def flush_stats(self, counters=None):
+        """Додає лічильники процесу до спільних у кеші."""
+        if counters is None:
+            with _pending_lock:
+                counters = dict(_pending.get(self.key_prefix) or dict.fromkeys(STATS_KEYS, 0))
+                _pending[self.key_prefix] = dict.fromkeys(STATS_KEYS, 0)
+
+        _local.depth = getattr(_local, 'depth', 0) + 1
+        try:
+            for name, amount in counters.items():
+                if not amount:
+                    continue
+                key = STATS_KEY_TEMPLATE.format(name)
+                try:
+                    self.incr(key, amount)
+                except ValueError:
+                    # Ключа ще немає (або його витіснено): паралельний add від іншого воркера
+                    # може виграти, тоді ще одна спроба incr
+                    if not self.add(key, amount, timeout=None):
+                        self.incr(key, amount)
+        except Exception:
+            # Статистика не повинна ламати запит (Redis недоступний, таблиці ще немає)
+            pass
+        finally:
+            _local.depth -= 1
+
+    def get(self, key, default=None, version=None):
+        outer = self._enter()
+        try:
+            value = super().get(key, _MISSING, version=version)
+        finally:
+            self._exit()
+        if outer:
+            self._record(int(value is not _MISSING), int(value is _MISSING))
+        return default if value is _MISSING else value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        outer = self._enter()
+        try:
+            values = super().get_many(keys, version=version)
+        finally:
+            self._exit()
+        if outer:
+            self._record(len(values), len(keys) - len(values))
+        return values
+
+    def stats(self):
+        """Спільні лічильники: hits, misses, hit_ratio (частка 0..1 або None)."""
+        self.flush_stats()
+        _local.depth = getattr(_local, 'depth', 0) + 1
+        try:
+            values = super().get_many([STATS_KEY_TEMPLATE.format(name) for name in STATS_KEYS])
+        finally:
+            _local.depth -= 1
+        result = {name: values.get(STATS_KEY_TEMPLATE.format(name), 0) for name in STATS_KEYS}
+        total = result['hits'] + result['misses']
+        result['hit_ratio'] = result['hits'] / total if total else None
+        return result
+
+    def reset_stats(self):
+        with _pending_lock:
+            _pending[self.key_prefix] = dict.fromkeys(STATS_KEYS, 0)
+        self.delete_many([STATS_KEY_TEMPLATE.format(name) for name in STATS_KEYS])
+
+
+class DatabaseCache(CacheStatsMixin, db.DatabaseCache):
+    pass
+
+
+class FileBasedCache(CacheStatsMixin, filebased.FileBasedCache):
+    pass
+
+
+class LocMemCache(CacheStatsMixin, locmem.LocMemCache):
+    pass
+
+
+class RedisCache(CacheStatsMixin, redis.RedisCache):
+    pass
+
+
+def cache_stats():
+    """Статистика всіх аліасів CACHES, що підтримують лічильники."""
+    return {
+        alias: caches[alias].stats()
+        for alias in settings.CACHES
+        if isinstance(caches[alias], CacheStatsMixin)
+    }
@@ -0,0 +1,135 @@
+"""
+Неблокуюче логування: черга в пам'яті процесу та окремий потік запису.
+
+QueueStreamHandler лише кладе запис у чергу - потік запиту не чекає на stdout
+(пайп платформи може бути повільним або переповненим). Окремий потік
+(logging.handlers.QueueListener) форматує записи через JsonFormatter і пише
+їх у stream. Потік запускається при першому записі в кожному процесі, тому
+обробник коректно працює і після fork воркерів gunicorn. Якщо черга
+переповнена, запис відкидається, а кількість відкинутих повідомляється
+наступним записом.
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+
+class JsonFormatter(logging.Formatter):
+    """Один JSON об'єкт на рядок: ts, level, logger, message, process (+ exc, stack)."""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'process': record.process,
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # При зупинці черга може бути повною - чекаємо, доки потік звільнить місце
+        self.queue.put(self._sentinel)
+
+
+class QueueStreamHandler(QueueHandler):
+    """
+    Обробник для LOGGING: запис у чергу, форматування та вивід - в окремому потоці.
+
+    Formatter з конфігурації (formatter: 'json') застосовується в потоці запису.
+
+    Args:
+        stream: Потік виводу (за замовчуванням sys.stdout)
+        queue_size: Максимальна кількість записів у черзі (0 - без обмеження)
+    """
+
+    def __init__(self, stream=None, queue_size=10000):
+        super().__init__(queue.Queue(queue_size))
+        self.queue_size = queue_size
+        self.target = logging.StreamHandler(stream or sys.stdout)
+        self.dropped = 0
+        self._listener = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def setFormatter(self, fmt):
+        self.target.setFormatter(fmt)
+
+    def _ensure_listener(self):
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                # Дочірній процес після fork: потік батька тут не існує, а записи
+                # в успадкованій черзі виведе сам батько
+                self.queue = queue.Queue(self.queue_size)
+                self.dropped = 0
+            self._listener = _Listener(self.queue, self.target, respect_handler_level=True)
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def prepare(self, record):
+        """
+        Копія запису з уже підставленими аргументами.
+
+        Аргументи (request, моделі) можуть змінитися до того, як потік запису
+        дійде до запису, тому повідомлення формується тут; traceback, JSON та
+        вивід - у потоці запису.
+        """
+        # Поверхнева копія без copy.copy (__reduce_ex__ помітно повільніший)
+        prepared = object.__new__(type(record))
+        prepared.__dict__.update(record.__dict__)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        return prepared
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            warning = logging.makeLogRecord({
+                'name': __name__,
+                'levelno': logging.WARNING,
+                'levelname': 'WARNING',
+                'msg': 'Черга логування переповнена, відкинуто записів: %d',
+                'args': (dropped,),
+            })
+            try:
+                self.queue.put_nowait(self.prepare(warning))
+            except queue.Full:
+                self.dropped += dropped
+
+    def emit(self, record):
+        self._ensure_listener()
+        super().emit(record)
+
+    def flush(self):
+        self.target.flush()
+
+    def close(self):
+        """Дописує чергу та зупиняє потік (logging.shutdown при виході процесу)."""
+        with self._start_lock:
+            if self._listener is not None and self._pid == os.getpid():
+                self._listener.stop()
+            self._listener = None
+            self._pid = None
+        self.target.close()
+        super().close()
@@ -1,14 +1,43 @@
 """
-Middleware для діагностики та обробки помилок.
+Middleware для діагностики, обробки помилок, підказок браузеру (Early Hints),
+мініфікації/стиснення динамічних відповідей та профілювання пам'яті воркерів.
 """
+import json
 import logging
-import traceback
+import os
+import threading
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+from pages.assets.hints import template_preload_links
+from pages.utils.sql_log import SlowQueryLogger
+from pages.utils.html_minify import minify_html
+from pages.utils.memory import MemorySampler, install_dump_signal, profiler
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 logger = logging.getLogger(__name__)
 
+# Структурований access log: один JSON рядок на запит (читає replay_log)
+access_logger = logging.getLogger(f'{__name__}.access')
+ACCESS_LOG_PREFIX = 'access '
+
 
 class DiagnosticMiddleware:
-    """Middleware для діагностики Host header та помилок"""
+    """Middleware для діагностики Host header, помилок та access log (JSON рядок на запит)"""
     
     def __init__(self, get_response):
         self.get_response = get_response
@@ -16,17 +45,31 @@ class DiagnosticMiddleware:
     def __call__(self, request):
         # Логуємо Host header для діагностики ALLOWED_HOSTS
         host = request.get_host()
-        logger.info(f'Request Host header: {host}, Path: {request.path}')
+        logger.info('Request Host header: %s, Path: %s', host, request.path)
         
+        started = time.perf_counter()
         try:
             response = self.get_response(request)
+            self._log_access(request, response, time.perf_counter() - started)
             return response
         except Exception as e:
             # Логуємо всі необроблені помилки
-            logger.error(f'Unhandled exception: {e}')
-            logger.error(traceback.format_exc())
+            logger.exception('Unhandled exception: %s', e)
             raise
 
+    def _log_access(self, request, response, duration):
+        if not access_logger.isEnabledFor(logging.INFO):
+            return
+        entry = {
+            'ts': round(time.time() - duration, 3),
+            'method': request.method,
+            'path': request.get_full_path(),
+            'htmx': bool(request.headers.get('HX-Request')),
+            'status': response.status_code,
+            'duration_ms': round(1000 * duration, 1),
+        }
+        access_logger.info('%s%s', ACCESS_LOG_PREFIX, json.dumps(entry, ensure_ascii=False))
+
 
 class ErrorLoggingMiddleware:
     """Middleware для логування помилок у відповідях"""
@@ -39,15 +82,277 @@ class ErrorLoggingMiddleware:
         
         # Логуємо помилки 500
         if response.status_code == 500:
-            logger.error(f'HTTP 500 error for {request.path}')
-            logger.error(f'Host: {request.get_host()}')
+            logger.error('HTTP 500 error for %s', request.path)
+            logger.error('Host: %s', request.get_host())
         
         # Логуємо помилки 400 (ALLOWED_HOSTS)
         if response.status_code == 400:
-            logger.warning(f'HTTP 400 error for {request.path}')
-            logger.warning(f'Host: {request.get_host()}')
-            logger.warning(f'ALLOWED_HOSTS should include: {request.get_host()}')
+            logger.warning('HTTP 400 error for %s', request.path)
+            logger.warning('Host: %s', request.get_host())
+            logger.warning('ALLOWED_HOSTS should include: %s', request.get_host())
         
         return response
 
 
+class SessionPathsMixin:
+    """
+    Виконує middleware лише для шляхів з SESSION_MIDDLEWARE_PATHS (адмінка).
+
+    Публічні сторінки не використовують сесії, користувача та messages,
+    тому для них обробка пропускається повністю. Підкласи стандартних
+    middleware залишаються видимими для перевірок admin (admin.E408-E410).
+    """
+
+    sync_capable = True
+    async_capable = False
+
+    def __call__(self, request):
+        if request.path_info.startswith(tuple(settings.SESSION_MIDDLEWARE_PATHS)):
+            return super().__call__(request)
+        return self.skip(request)
+
+    def skip(self, request):
+        return self.get_response(request)
+
+
+class AdminSessionMiddleware(SessionPathsMixin, SessionMiddleware):
+    """SessionMiddleware лише для адмінки: публічні сторінки без читання django_session."""
+
+
+class AdminAuthenticationMiddleware(SessionPathsMixin, AuthenticationMiddleware):
+    """AuthenticationMiddleware лише для адмінки; на публічних сторінках - анонімний користувач."""
+
+    def skip(self, request):
+        request.user = AnonymousUser()
+        return self.get_response(request)
+
+
+class AdminMessageMiddleware(SessionPathsMixin, MessageMiddleware):
+    """MessageMiddleware лише для адмінки (публічні шаблони не показують messages)."""
+
+
+class MemoryProfilingMiddleware:
+    """
+    Профілювання пам'яті воркера (opt-in).
+
+    Middleware створюється один раз на процес при завантаженні застосунку
+    (у кожному воркері gunicorn), тому тут запускаються tracemalloc, обробник
+    сигналу для memory dump та семплер RSS. У ланцюжку запитів не бере участі:
+    після налаштування Django прибирає його через MiddlewareNotUsed.
+    """
+
+    def __init__(self, get_response):
+        if settings.MEMORY_PROFILING_ENABLED:
+            profiler.frames = settings.MEMORY_PROFILING_FRAMES
+            profiler.start()
+            install_dump_signal(settings.MEMORY_PROFILING_SIGNAL, settings.MEMORY_PROFILING_TOP)
+            logger.info(
+                'Профілювання пам\'яті увімкнено (PID %d, dump: kill -%s %d)',
+                os.getpid(), settings.MEMORY_PROFILING_SIGNAL.removeprefix('SIG'), os.getpid(),
+            )
+
+        if settings.MEMORY_SAMPLER_INTERVAL:
+            MemorySampler(settings.MEMORY_SAMPLER_INTERVAL).start()
+
+        raise MiddlewareNotUsed
+
+
+class SlowQueryLogMiddleware:
+    """
+    Логування SQL запитів, довших за SLOW_QUERY_THRESHOLD_MS, з місцем виклику.
+
+    Обгортає кожен запит через connection.execute_wrapper; з порогом 0
+    вимикається повністю (MiddlewareNotUsed). Звіт - python manage.py slow_queries.
+    """
+
+    def __init__(self, get_response):
+        if not settings.SLOW_QUERY_THRESHOLD_MS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+
+    def __call__(self, request):
+        wrapper = SlowQueryLogger(self.threshold_ms, request.path)
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(wrapper))
+            return self.get_response(request)
+
+
+class EarlyHintsMiddleware:
+    """
+    Link: rel=preload для критичних асетів сторінки та 103 Early Hints.
+
+    Набір асетів обчислюється статичним аналізом шаблону з EARLY_HINTS_TEMPLATES
+    (за view_name маршруту) і кешується на процес. Якщо сервер підтримує
+    wsgi.early_hints (gunicorn) і увімкнено EARLY_HINTS_SEND_103, підказки
+    надсилаються ще до виконання view, і браузер починає завантажувати CSS/JS,
+    поки сервер рендерить сторінку.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # view_name → список значень Link
+        self._links_cache = {}
+
+    def _get_links(self, view_name):
+        template_name = settings.EARLY_HINTS_TEMPLATES.get(view_name)
+        if not template_name:
+            return []
+
+        # У DEBUG шаблони та маніфести змінюються без перезапуску
+        links = None if settings.DEBUG else self._links_cache.get(view_name)
+        if links is None:
+            links = template_preload_links(template_name)
+            self._links_cache[view_name] = links
+        return links
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # HTMX partials не містять <head>, їм підказки не потрібні
+        if request.method not in ('GET', 'HEAD') or request.headers.get('HX-Request'):
+            return None
+
+        links = self._get_links(request.resolver_match.view_name)
+        request.preload_links = links
+
+        send_early_hints = request.META.get('wsgi.early_hints')
+        if links and send_early_hints and settings.EARLY_HINTS_SEND_103:
+            try:
+                send_early_hints([('Link', ', '.join(links))])
+            except Exception as e:
+                logger.warning('Не вдалося надіслати 103 Early Hints: %s', e)
+        return None
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        links = getattr(request, 'preload_links', None)
+        if (
+            links
+            and response.status_code == 200
+            and response.get('Content-Type', '').startswith('text/html')
+            and not response.has_header('Link')
+        ):
+            response['Link'] = ', '.join(links)
+        return response
+
+
+COMPRESSIBLE_TYPES = (
+    'text/',
+    'application/javascript',
+    'application/json',
+    'application/xml',
+    'image/svg+xml',
+)
+
+
+def _accepted_encodings(header):
+    """Кодування з Accept-Encoding, які клієнт приймає (q > 0)."""
+    encodings = set()
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        encodings.add(name.strip().lower())
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    Мініфікація HTML та gzip/Brotli для динамічних відповідей.
+
+    WhiteNoise стискає лише static файли, тому сторінки та HTMX partials
+    стискаються тут. Відповіді, що містять CSRF токен, стискаються лише gzip
+    з випадковою довжиною заголовка (як django GZipMiddleware) - захист від BREACH.
+    Стримінгові відповіді (файли з Range) не змінюються.
+
+    Сторінки з формами завжди містять CSRF токен, тому на практиці HTML
+    отримує gzip, а Brotli - лише відповіді без токена (JSON, partials без форм).
+    Мініфікований HTML не кешується: токен форми та CSRF роблять кожну
+    відповідь унікальною.
+    """
+
+    # Випадкові байти в gzip заголовку для CSRF відповідей (BREACH)
+    max_random_bytes = 100
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self._lock = threading.Lock()
+        self._stats = {'responses': 0, 'original': 0, 'minified': 0, 'sent': 0}
+
+    def _report(self, path, original, minified, sent):
+        logger.debug('Стиснення %s: %d → %d (HTML) → %d байт', path, original, minified, sent)
+        with self._lock:
+            stats = self._stats
+            stats['responses'] += 1
+            stats['original'] += original
+            stats['minified'] += minified
+            stats['sent'] += sent
+            if stats['responses'] % settings.COMPRESSION_REPORT_EVERY:
+                return
+            summary = dict(stats)
+        logger.info(
+            'Стиснення відповідей: %d шт, мініфікація зекономила %d байт, стиснення - ще %d байт (%.0f%% від початкового)',
+            summary['responses'],
+            summary['original'] - summary['minified'],
+            summary['minified'] - summary['sent'],
+            100 * summary['sent'] / max(summary['original'], 1),
+        )
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.streaming or response.status_code != 200 or response.has_header('Content-Encoding'):
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return response
+
+        original_length = len(response.content)
+        if settings.HTML_MINIFY and content_type == 'text/html':
+            response.content = minify_html(response.content.decode(response.charset)).encode(response.charset)
+        minified_length = len(response.content)
+
+        if minified_length >= settings.COMPRESSION_MIN_LENGTH:
+            patch_vary_headers(response, ('Accept-Encoding',))
+            self._compress(request, response)
+
+        response['Content-Length'] = str(len(response.content))
+        self._report(request.path, original_length, minified_length, len(response.content))
+        return response
+
+    def _compress(self, request, response):
+        accepted = _accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        # CsrfViewMiddleware ставить cookie лише якщо get_token() викликався,
+        # тобто токен є у відповіді (прапорець CSRF_COOKIE_NEEDS_UPDATE на цей момент вже скинуто)
+        uses_csrf = (
+            settings.CSRF_COOKIE_NAME in response.cookies
+            or request.META.get('CSRF_COOKIE_NEEDS_UPDATE', False)
+        )
+
+        if brotli is not None and 'br' in accepted and not uses_csrf:
+            compressed = brotli.compress(response.content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+            encoding = 'br'
+        elif 'gzip' in accepted:
+            compressed = compress_string(
+                response.content,
+                max_random_bytes=self.max_random_bytes if uses_csrf else None,
+            )
+            encoding = 'gzip'
+        else:
+            return
+
+        if len(compressed) >= len(response.content):
+            return
+        response.content = compressed
+        response['Content-Encoding'] = encoding
+
+        # Стиснене тіло відрізняється побайтово - ETag стає слабким (RFC 9110)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
@@ -25,19 +25,31 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.sitemaps',
     'pages',
 ]
 
 MIDDLEWARE = [
+    'PolygraphNew.middleware.MemoryProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'PolygraphNew.middleware.SlowQueryLogMiddleware',
+    'PolygraphNew.middleware.CompressionMiddleware',
+    'PolygraphNew.middleware.EarlyHintsMiddleware',
+    'PolygraphNew.middleware.AdminSessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    'PolygraphNew.middleware.AdminAuthenticationMiddleware',
+    'PolygraphNew.middleware.AdminMessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Шляхи, для яких працюють сесії, автентифікація та messages (Admin*Middleware).
+# Публічні сторінки їх не використовують і обходяться без читання django_session
+SESSION_MIDDLEWARE_PATHS = ['/admin/', '/debug/']
+
+# CSRF токен у cookie (не в сесії): форми публічних сторінок працюють без сесій
+CSRF_USE_SESSIONS = False
+
 ROOT_URLCONF = 'PolygraphNew.urls'
 
 TEMPLATES = [
@@ -61,11 +73,67 @@ WSGI_APPLICATION = 'PolygraphNew.wsgi.application'
 # Database
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': 'PolygraphNew.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
     }
 }
 
+# Профіль SQLite для кількох воркерів (PolygraphNew.sqlite3, перевірка - manage.py sqlite_stress):
+# WAL - читання не блокує запис; synchronous=NORMAL - у WAL безпечно для цілісності,
+# після збою живлення можуть загубитись лише останні коміти; busy_timeout (мс) - скільки
+# з'єднання чекає блокування запису замість "database is locked"; mmap_size - читання
+# сторінок через відображену пам'ять. IMMEDIATE - atomic() одразу бере блокування запису
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 64 * 1024 * 1024,
+}
+SQLITE_IMMEDIATE_TRANSACTIONS = True
+
+# Кеш, спільний для всіх воркерів gunicorn і з переживанням рестартів:
+# db - таблиці БД (за замовчуванням, без додаткової інфраструктури;
+#      створюються після migrate, pages.apps.create_cache_tables), file - файли в CACHE_DIR,
+# redis - REDIS_URL (потрібен пакет redis), locmem - лише в межах процесу.
+# Аліаси: default, pages (рендер сторінок/документів), throttle (ліміти, дедуплікація форм),
+# sessions (сесії при спільному швидкому бекенді)
+REDIS_URL = os.environ.get('REDIS_URL', '')
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'redis' if REDIS_URL else 'db')
+CACHE_DIR = os.environ.get('CACHE_DIR', str(BASE_DIR / '.cache'))
+CACHE_TIMEOUTS = {
+    'default': 300,
+    'pages': 60 * 10,
+    'throttle': 60 * 60,
+    'sessions': 60 * 60 * 24 * 14,
+}
+
+
+def _cache_config(alias, timeout):
+    config = {'TIMEOUT': timeout, 'KEY_PREFIX': alias}
+    if CACHE_BACKEND == 'redis':
+        config.update(BACKEND='PolygraphNew.cache.RedisCache', LOCATION=REDIS_URL or 'redis://127.0.0.1:6379/0')
+    elif CACHE_BACKEND == 'file':
+        config.update(BACKEND='PolygraphNew.cache.FileBasedCache', LOCATION=os.path.join(CACHE_DIR, alias))
+    elif CACHE_BACKEND == 'locmem':
+        config.update(BACKEND='PolygraphNew.cache.LocMemCache', LOCATION=alias)
+    else:
+        config.update(BACKEND='PolygraphNew.cache.DatabaseCache', LOCATION=f'cache_{alias}')
+    return config
+
+
+CACHES = {alias: _cache_config(alias, timeout) for alias, timeout in CACHE_TIMEOUTS.items()}
+CACHE_MIDDLEWARE_ALIAS = 'pages'
+
+# Сесії через кеш лише з Redis або файлами: з кешем у БД це ті самі запити,
+# а з locmem кеш сесії у воркерах розходився б
+if CACHE_BACKEND in ('redis', 'file'):
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+    SESSION_CACHE_ALIAS = 'sessions'
+
+# Статистика кешу (python manage.py cache_stats): як часто процес додає
+# свої лічильники hits/misses до спільних
+CACHE_STATS_FLUSH_EVERY = 50
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -91,8 +159,14 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = '/static/'
 
+# Вихідні static файли та згенеровані build-кроком асети (python manage.py build_assets)
+ASSET_SOURCE_DIR = BASE_DIR / 'static'
+ASSET_BUILD_DIR = BASE_DIR / 'build'
+ASSET_BUILD_STATIC_DIR = ASSET_BUILD_DIR / 'static'
+
 STATICFILES_DIRS = [
-    BASE_DIR / 'static',
+    ASSET_SOURCE_DIR,
+    ASSET_BUILD_STATIC_DIR,
 ]
 
 STATIC_ROOT = BASE_DIR / 'staticfiles'
@@ -102,6 +176,193 @@ STATICFILES_FINDERS = [
     'django.contrib.staticfiles.finders.AppDirectoriesFinder',
 ]
 
+# Адаптивні зображення: ширини та формати варіантів для {% responsive_img %}
+RESPONSIVE_IMAGE_DIRS = ['img']
+RESPONSIVE_IMAGE_WIDTHS = [160, 320, 480, 640, 960, 1280]
+RESPONSIVE_IMAGE_FORMATS = ['avif', 'webp']
+
+# Відео: кадр для постера (секунди) та його максимальна ширина. Саме відео віддає
+# WhiteNoise (Range та immutable кешування), а не view
+VIDEO_POSTER_TIMESTAMP = 0.0
+VIDEO_POSTER_MAX_WIDTH = 1280
+
+# Іконки сайту (build_assets --only icons): вихідне зображення в static/, тло для
+# вписування в квадрат (і theme_color у /site.webmanifest) та кешування /favicon.ico -
+# адреса без хешу, тому не immutable
+ICON_SOURCE = 'img/poli.png'
+ICON_BACKGROUND = '#000000'
+ICON_CACHE_MAX_AGE = 60 * 60 * 24 * 7
+WEB_MANIFEST_NAME = 'Поліграф Львів'
+
+# robots.txt та sitemap.xml кешуються цілими відповідями (cache_page, CACHE_MIDDLEWARE_ALIAS).
+# SITEMAP_PROTOCOL - схема абсолютних адрес (None - як у запиту; за проксі Render - https)
+ROBOTS_CACHE_TIMEOUT = 60 * 60 * 24
+SITEMAP_CACHE_TIMEOUT = 60 * 60
+SITEMAP_PROTOCOL = None
+
+# Шрифти для сабсетингу у WOFF2: font-family → вихідний файл у static/.
+# У сабсет потрапляють символи з шаблонів, що рендеряться цим шрифтом, + FONT_SUBSET_EXTRA_TEXT
+FONT_SUBSETS = {
+    'Electronica Display Stencil': 'fonts/Electronica Display Stencil.otf',
+}
+FONT_SUBSET_EXTRA_TEXT = '0123456789.,:;!?-–—«»"\'()'
+
+# Service worker (/sw.js): сторінки, які кешуються для офлайну
+# (повна сторінка + HTMX partial; з мережею завжди віддається відповідь сервера)
+SERVICE_WORKER_ROUTES = ['pages:index', 'pages:about', 'pages:contacts']
+SERVICE_WORKER_OFFLINE_ROUTE = 'pages:offline'
+
+# Early Hints / Link: rel=preload: view_name → шаблон повної сторінки, з якого
+# статично визначаються критичні асети (PolygraphNew.middleware.EarlyHintsMiddleware)
+EARLY_HINTS_TEMPLATES = {
+    'pages:index': 'index.html',
+    'pages:about': 'about.html',
+    'pages:contacts': 'contacts.html',
+    'pages:legal': 'legal_document.html',
+    'pages:offline': 'offline.html',
+    'pages:infidelity_landing': 'infidelity_landing.html',
+    'pages:infidelity_thanks': 'infidelity_thanks.html',
+    'pages:corporate_landing': 'corporate_landing.html',
+    'pages:corporate_thanks': 'corporate_thanks.html',
+}
+# 103 Early Hints: браузери приймають їх лише по HTTP/2+, а частина HTTP/1.1 клієнтів
+# (python http.client, старі проксі) сприймає 103 як остаточну відповідь.
+# Вмикати, коли фронтовий проксі працює по HTTP/2 і пропускає 1xx відповіді.
+# Заголовок Link надсилається завжди (CDN на кшталт Cloudflare самі перетворюють його на 103)
+EARLY_HINTS_SEND_103 = False
+
+# Мініфікація HTML та gzip/Brotli для динамічних відповідей (PolygraphNew.middleware.CompressionMiddleware)
+HTML_MINIFY = True
+COMPRESSION_MIN_LENGTH = 200
+# Швидкий рівень Brotli для стиснення на льоту (static стискається максимально під час collectstatic)
+COMPRESSION_BROTLI_QUALITY = 5
+# Як часто (кількість відповідей) писати в лог підсумок зекономлених байтів
+COMPRESSION_REPORT_EVERY = 500
+
+# Мікробенчмарки (python manage.py bench): локальний baseline та допустиме сповільнення
+BENCH_BASELINE_PATH = BASE_DIR / '.benchmarks' / 'baseline.json'
+BENCH_REGRESSION_THRESHOLD = 0.2
+# Різниця менше за цю (мікросекунд на виклик) не вважається регресією
+BENCH_NOISE_FLOOR_US = 2.0
+
+# Профілювання пам'яті воркерів (opt-in): tracemalloc, звіт /debug/memory/ для
+# персоналу та dump у лог по сигналу (kill -USR2 <pid воркера>).
+# tracemalloc сповільнює алокації в рази - вмикати лише на час розслідування
+MEMORY_PROFILING_ENABLED = False
+MEMORY_PROFILING_FRAMES = 10
+MEMORY_PROFILING_TOP = 20
+MEMORY_PROFILING_SIGNAL = 'SIGUSR2'
+# Семплер RSS/GC: рядок у лог раз на N секунд з PID воркера (0 - вимкнено)
+MEMORY_SAMPLER_INTERVAL = 0
+
+# Повільні SQL запити (мс): логуються з місцем виклику, звіт - python manage.py slow_queries.
+# 0 - вимкнено (за замовчуванням); вмикається на час діагностики
+SLOW_QUERY_THRESHOLD_MS = 0
+
+# Сповіщення про заявки (pages.utils.notifications): канали та їх бекенди,
+# маршрути form_type → канали ('default' - для решти форм) і розмір спільного
+# пулу потоків, в якому канали відправляються паралельно. TIMEOUT - скільки
+# секунд запит форми чекає на канал. Telegram без OPTIONS бере TELEGRAM_* з оточення
+NOTIFIERS = {
+    'telegram': {
+        'BACKEND': 'pages.utils.notifications.TelegramNotifier',
+        'TIMEOUT': 10,
+    },
+}
+NOTIFICATION_ROUTES = {
+    'default': ['telegram'],
+}
+NOTIFICATION_MAX_WORKERS = 8
+
+# Стрічка змін заявок для CRM (/api/leads/changes/): Bearer токени клієнтів
+# (порожньо - стрічку вимкнено), розмір сторінки та затримка, після якої зміна
+# вважається закоміченою і потрапляє в стрічку (pages.utils.change_feed)
+CRM_FEED_TOKENS = []
+CRM_FEED_PAGE_SIZE = 100
+CRM_FEED_MAX_PAGE_SIZE = 500
+CRM_FEED_SETTLE_SECONDS = 5
+
+# Фільтр ботів у формах заявок (pages.utils.form_guard): мінімальний та
+# максимальний вік підписаного токена форми (секунди від рендерингу) і кеш,
+# де запам'ятовуються використані токени (захист від повторної відправки)
+FORM_GUARD_MIN_AGE = 2
+FORM_GUARD_MAX_AGE = 60 * 60 * 12
+FORM_GUARD_CACHE_ALIAS = 'throttle'
+
+# Правові документи (/legal/<slug>/, pages.utils.legal): кеш з HTML, заголовком та версією.
+# Запис скидається при збереженні документа в адмінці, тому термін може бути довгим
+LEGAL_DOCUMENT_CACHE_ALIAS = 'pages'
+LEGAL_DOCUMENT_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Readiness (/health/ready, pages.utils.health): загальний таймаут проб (секунди),
+# скільки секунд процес віддає збережений результат замість нового прогону,
+# кеш для проби запису/читання та розмір черги неповідомлених заявок для статусу warn
+HEALTH_PROBE_TIMEOUT = 2.0
+HEALTH_CACHE_SECONDS = 5
+HEALTH_CACHE_ALIAS = 'default'
+HEALTH_NOTIFICATION_BACKLOG_WARN = 20
+
+# Бюджет SQL запитів (python manage.py check_query_budget): файл у репозиторії,
+# запас для часу (залежить від машини) та мінімальний бюджет часу в мс
+QUERY_BUDGET_PATH = BASE_DIR / 'query_budget.json'
+QUERY_BUDGET_TIME_FACTOR = 5
+QUERY_BUDGET_MIN_TIME_MS = 25
+
+# HTMX: build_assets завантажує цю версію локально і перевіряє SRI хеш
+HTMX_VERSION = '2.0.8'
+HTMX_CDN_URL = f'https://cdn.jsdelivr.net/npm/htmx.org@{HTMX_VERSION}/dist/htmx.min.js'
+HTMX_INTEGRITY = 'sha384-/TgkGk7p307TH7EXJDuUlgG3Ce1UVolAOFopFekQkkXihi5u/6OCvVKyz1W+idaz'
+
+# CSS/JS бандли ({% bundle_css %} / {% bundle_js %}).
+# ⚠️ Порядок файлів = порядок підключення (normalize.css ЗАВЖДИ перший).
+# critical_css: для кожної сторінки (url_name) префікси селекторів першого екрану.
+# Відповідні правила бандла інлайняться в <head> (див. pages.assets.bundles.extract_critical_css)
+_SITE_CRITICAL_SELECTORS = [
+    '*', ':root', 'html', 'body', 'main', 'h1', 'button', 'img', 'picture', 'video', '[hidden]',
+    '.header', '.header__', '.htmx-indicator', '.responsive-picture',
+]
+
+ASSET_BUNDLES = {
+    'site': {
+        'css': [
+            'css/normalize.css',
+            'css/base.css',
+            'css/components/header.css',
+            'css/components/footer.css',
+            'css/components/hero.css',
+            'css/components/why-us.css',
+            'css/components/cta.css',
+            'css/components/accordion.css',
+            'css/components/contacts.css',
+            'css/components/page.css',
+        ],
+        'js': [
+            'js/utils/htmx-check.js',
+            'js/header.js',
+            'js/accordion.js',
+            'js/footer-accordion.js',
+            'js/hero.js',
+            'js/app-init.js',
+        ],
+        'critical_css': {
+            'index': _SITE_CRITICAL_SELECTORS + ['.hero', '.hero__'],
+            'about': _SITE_CRITICAL_SELECTORS + [
+                '.about-accordions', '.accordion', '.accordion__header', '.accordion__title', '.accordion__subtitle',
+            ],
+            'contacts': _SITE_CRITICAL_SELECTORS + ['.contacts__top', '.contacts__container', '.contacts__title'],
+            'default': _SITE_CRITICAL_SELECTORS + ['.page', '.page__container', '.page__title', '.page__header'],
+        },
+    },
+    'infidelity': {
+        'css': ['css/infidelity-landing.css'],
+        'js': ['js/infidelity-landing.js'],
+    },
+    'corporate': {
+        'css': ['css/corporate-landing.css'],
+        'js': ['js/corporate-landing.js'],
+    },
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
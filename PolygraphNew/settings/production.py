@@ -64,7 +64,7 @@ if USE_SQLITE:
     # Використовуємо SQLite (ТІЛЬКИ ЯКЩО ЯВНО ВКАЗАНО)
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
+            'ENGINE': 'PolygraphNew.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
         }
     }
@@ -89,7 +89,7 @@ else:
         # Для collectstatic можна тимчасово використати sqlite, щоб білд пройшов
         DATABASES = {
             'default': {
-                'ENGINE': 'django.db.backends.sqlite3',
+                'ENGINE': 'PolygraphNew.sqlite3',
                 'NAME': BASE_DIR / 'db.sqlite3',
             }
         }
@@ -110,16 +110,63 @@ else:
             'default': database_config
         }
 
-# WhiteNoise для статичних файлів
-MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')
+# WhiteNoise для статичних файлів - одразу після SecurityMiddleware (документація
+# WhiteNoise): static відповіді теж отримують nosniff, Referrer-Policy, COOP
+MIDDLEWARE.insert(
+    MIDDLEWARE.index('django.middleware.security.SecurityMiddleware') + 1,
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+)
 
 # Діагностичні middleware
 MIDDLEWARE.insert(0, 'PolygraphNew.middleware.DiagnosticMiddleware')
 MIDDLEWARE.append('PolygraphNew.middleware.ErrorLoggingMiddleware')
 
-# Використовуємо CompressedStaticFilesStorage без manifest
-# Це виключає потребу в manifest файлі, але все ще компресує файли
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedStaticFilesStorage'
+# Хешовані імена файлів + gzip/Brotli компресія.
+# Відсутні файли (CSS url(), {% static %}) не ламають collectstatic і рендеринг,
+# а файли з хешем WhiteNoise віддає з Cache-Control: immutable
+STATICFILES_STORAGE = 'PolygraphNew.storage.ForgivingManifestStaticFilesStorage'
+
+# Render термінує HTTPS на проксі: абсолютні адреси в sitemap.xml та robots.txt - https
+SITEMAP_PROTOCOL = 'https'
+
+# 103 Early Hints (див. base.py): лише якщо проксі перед gunicorn підтримує HTTP/2 та 1xx
+EARLY_HINTS_SEND_103 = os.environ.get('EARLY_HINTS_SEND_103', 'False').lower() == 'true'
+
+# Профілювання пам'яті (див. base.py): вмикається змінними оточення без деплою коду
+MEMORY_PROFILING_ENABLED = os.environ.get('MEMORY_PROFILING', 'False').lower() == 'true'
+MEMORY_SAMPLER_INTERVAL = int(os.environ.get('MEMORY_SAMPLER_INTERVAL', '0'))
+
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get('SLOW_QUERY_THRESHOLD_MS', '0'))
+
+# Додаткові канали сповіщень (див. base.py): лист через SMTP та webhook.
+# Кожен налаштований канал отримує заявки всіх форм
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', '587'))
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'True').lower() == 'true'
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@polygraph.website')
+
+notify_email_to = [address.strip() for address in os.environ.get('NOTIFY_EMAIL_TO', '').split(',') if address.strip()]
+if notify_email_to:
+    NOTIFIERS['email'] = {
+        'BACKEND': 'pages.utils.notifications.EmailNotifier',
+        'TIMEOUT': 10,
+        'OPTIONS': {'recipients': notify_email_to},
+    }
+    NOTIFICATION_ROUTES['default'].append('email')
+
+notify_webhook_url = os.environ.get('NOTIFY_WEBHOOK_URL', '')
+if notify_webhook_url:
+    NOTIFIERS['webhook'] = {
+        'BACKEND': 'pages.utils.notifications.WebhookNotifier',
+        'TIMEOUT': 5,
+        'OPTIONS': {'url': notify_webhook_url, 'secret': os.environ.get('NOTIFY_WEBHOOK_SECRET', '')},
+    }
+    NOTIFICATION_ROUTES['default'].append('webhook')
+
+# Токени CRM для стрічки змін заявок, через кому (див. base.py)
+CRM_FEED_TOKENS = [token.strip() for token in os.environ.get('CRM_FEED_TOKENS', '').split(',') if token.strip()]
 
 # Security settings for production
 if not DEBUG:
@@ -132,24 +179,21 @@ if not DEBUG:
     SECURE_CONTENT_TYPE_NOSNIFF = True
     X_FRAME_OPTIONS = 'DENY'
 
-# Logging для діагностики
+# Logging: JSON рядок на запис, вивід у stdout з окремого потоку (PolygraphNew/log.py),
+# тому запити не чекають на запис логів
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {message}',
-            'style': '{',
-        },
-        'detailed': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
-            'style': '{',
+        'json': {
+            '()': 'PolygraphNew.log.JsonFormatter',
         },
     },
     'handlers': {
         'console': {
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose',
+            'class': 'PolygraphNew.log.QueueStreamHandler',
+            'formatter': 'json',
+            'queue_size': int(os.environ.get('LOG_QUEUE_SIZE', 10000)),
         },
     },
     'root': {
@@ -202,34 +246,34 @@ if not ALLOWED_HOSTS:
 try:
     # Логуємо всі змінні оточення (без секретів)
     logger.info('=== Django Production Settings ===')
-    logger.info(f'ALLOWED_HOSTS env: {os.environ.get("ALLOWED_HOSTS", "NOT SET")}')
-    logger.info(f'RENDER_EXTERNAL_HOSTNAME: {os.environ.get("RENDER_EXTERNAL_HOSTNAME", "NOT SET")}')
-    logger.info(f'RENDER_SERVICE_NAME: {os.environ.get("RENDER_SERVICE_NAME", "NOT SET")}')
-    logger.info(f'Final ALLOWED_HOSTS: {ALLOWED_HOSTS}')
-    logger.info(f'DEBUG: {DEBUG}')
-    logger.info(f'USE_SQLITE: {USE_SQLITE}')
+    logger.info('ALLOWED_HOSTS env: %s', os.environ.get("ALLOWED_HOSTS", "NOT SET"))
+    logger.info('RENDER_EXTERNAL_HOSTNAME: %s', os.environ.get("RENDER_EXTERNAL_HOSTNAME", "NOT SET"))
+    logger.info('RENDER_SERVICE_NAME: %s', os.environ.get("RENDER_SERVICE_NAME", "NOT SET"))
+    logger.info('Final ALLOWED_HOSTS: %s', ALLOWED_HOSTS)
+    logger.info('DEBUG: %s', DEBUG)
+    logger.info('USE_SQLITE: %s', USE_SQLITE)
     
     try:
-        logger.info(f'Database engine: {DATABASES["default"]["ENGINE"]}')
-        logger.info(f'Database name: {DATABASES["default"].get("NAME", "NOT SET")}')
+        logger.info('Database engine: %s', DATABASES["default"]["ENGINE"])
+        logger.info('Database name: %s', DATABASES["default"].get("NAME", "NOT SET"))
     except (KeyError, NameError) as e:
-        logger.error(f'DATABASES error: {e}')
+        logger.error('DATABASES error: %s', e)
         logger.error(traceback.format_exc())
     
-    logger.info(f'SECRET_KEY is set: {bool(SECRET_KEY)}')
-    logger.info(f'STATIC_ROOT: {STATIC_ROOT}')
-    logger.info(f'STATIC_URL: {STATIC_URL}')
+    logger.info('SECRET_KEY is set: %s', bool(SECRET_KEY))
+    logger.info('STATIC_ROOT: %s', STATIC_ROOT)
+    logger.info('STATIC_URL: %s', STATIC_URL)
     
     # Перевірка static files
     try:
         static_root_path = Path(STATIC_ROOT)
         if not static_root_path.exists():
-            logger.warning(f'STATIC_ROOT directory does not exist: {STATIC_ROOT}')
+            logger.warning('STATIC_ROOT directory does not exist: %s', STATIC_ROOT)
             logger.warning('Run: python manage.py collectstatic --noinput')
         else:
-            logger.info(f'STATIC_ROOT exists: {STATIC_ROOT}')
+            logger.info('STATIC_ROOT exists: %s', STATIC_ROOT)
     except Exception as e:
-        logger.error(f'Error checking STATIC_ROOT: {e}')
+        logger.error('Error checking STATIC_ROOT: %s', e)
     
     # Критична перевірка
     if not ALLOWED_HOSTS or ALLOWED_HOSTS == ['*']:
@@ -238,7 +282,7 @@ try:
         else:
             logger.error('⚠️ CRITICAL: ALLOWED_HOSTS is empty! All requests will be rejected with 400!')
     else:
-        logger.info(f'✅ ALLOWED_HOSTS configured: {ALLOWED_HOSTS}')
+        logger.info('✅ ALLOWED_HOSTS configured: %s', ALLOWED_HOSTS)
     
     logger.info('==================================')
 except Exception as e:
@@ -0,0 +1,37 @@
+"""
+SQLite backend для кількох воркерів gunicorn (ENGINE: 'PolygraphNew.sqlite3').
+
+Стандартний backend Django 4.2 працює з rollback journal і відкладеними
+транзакціями: під час запису читачі блокують коміт, а транзакція atomic(),
+що спочатку читає, а потім пише, при конкуренції отримує "database is locked"
+одразу, без очікування busy_timeout (SQLite не чекає, щоб уникнути deadlock).
+
+Тут при створенні з'єднання (connection_created) вмикаються SQLITE_PRAGMAS
+(WAL - читачі не блокують запис, synchronous=NORMAL, busy_timeout, mmap),
+а atomic() починає транзакцію з BEGIN IMMEDIATE: блокування запису береться
+на початку і конкуренти чекають його в межах busy_timeout.
+"""
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.db.backends.sqlite3 import base
+from django.dispatch import receiver
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    def _start_transaction_under_autocommit(self):
+        if settings.SQLITE_IMMEDIATE_TRANSACTIONS:
+            self.cursor().execute('BEGIN IMMEDIATE')
+        else:
+            super()._start_transaction_under_autocommit()
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """SQLITE_PRAGMAS для кожного нового з'єднання цього backend."""
+    if not isinstance(connection, DatabaseWrapper):
+        return
+    # Напряму через sqlite3: без обгорток курсора, логування запитів та execute_wrapper
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        connection.connection.execute(f'PRAGMA {name} = {value}')
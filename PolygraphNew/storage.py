@@ -0,0 +1,35 @@
+"""
+Storage для статичних файлів з хешованими іменами та компресією.
+"""
+import logging
+
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+logger = logging.getLogger(__name__)
+
+
+class ForgivingManifestStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Manifest storage WhiteNoise (хеш у імені + gzip/Brotli), що не ламає деплой.
+
+    Стандартний ManifestStaticFilesStorage падає з ValueError, якщо CSS або шаблон
+    посилається на відсутній файл (наприклад img/about.png). Тут такий файл
+    логується і віддається під оригінальним іменем без хешу, а всі наявні
+    файли отримують хешовані імена, які WhiteNoise кешує назавжди (immutable).
+    """
+
+    manifest_strict = False
+
+    # Імена, про які вже попередили (щоб не засмічувати логи на кожен рендер)
+    _reported_missing = set()
+
+    def hashed_name(self, name, content=None, filename=None):
+        try:
+            return super().hashed_name(name, content, filename)
+        except ValueError as e:
+            if 'could not be found' not in str(e):
+                raise
+            if name not in self._reported_missing:
+                self._reported_missing.add(name)
+                logger.warning('Static файл не знайдено, використовуємо ім\'я без хешу: %s', name)
+            return name
@@ -7,6 +7,9 @@ python -m pip install --upgrade pip
 # Встановлюємо залежності
 pip install -r requirements.txt
 
+# Генеруємо оптимізовані асети (адаптивні зображення тощо)
+python manage.py build_assets
+
 # Видаляємо старі static files для чистого build
 rm -rf staticfiles
 
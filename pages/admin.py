@@ -1,11 +1,13 @@
 """
-Django admin налаштування для збереженої заявок.
+Django admin налаштування для збереженої заявок та правових документів.
 """
 
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from django.urls import reverse
-from .models import LeadSubmission
+from .models import LeadSubmission, LegalDocument
 
 
 @admin.register(LeadSubmission)
@@ -152,26 +154,61 @@ class LeadSubmissionAdmin(admin.ModelAdmin):
     updated_at_display.admin_order_field = 'updated_at'
     
     # Actions
+    # queryset.update не викликає save(), тому auto_now для updated_at не спрацьовує:
+    # час ставиться явно, інакше зміна статусу не потрапить у стрічку змін для CRM
     @admin.action(description='Позначити як "Зв\'язалися"')
     def mark_as_contacted(self, request, queryset):
         """Позначити вибрані заявки як 'Зв\'язалися'"""
-        count = queryset.update(status='contacted')
+        count = queryset.update(status='contacted', updated_at=timezone.now())
         self.message_user(request, f'{count} заявок позначено як "Зв\'язалися".')
     
     @admin.action(description='Позначити як "В роботі"')
     def mark_as_in_progress(self, request, queryset):
         """Позначити вибрані заявки як 'В роботі'"""
-        count = queryset.update(status='in_progress')
+        count = queryset.update(status='in_progress', updated_at=timezone.now())
         self.message_user(request, f'{count} заявок позначено як "В роботі".')
     
     @admin.action(description='Позначити як "Завершено"')
     def mark_as_completed(self, request, queryset):
         """Позначити вибрані заявки як 'Завершено'"""
-        count = queryset.update(status='completed')
+        count = queryset.update(status='completed', updated_at=timezone.now())
         self.message_user(request, f'{count} заявок позначено як "Завершено".')
     
     @admin.action(description='Позначити як "Скасовано"')
     def mark_as_cancelled(self, request, queryset):
         """Позначити вибрані заявки як 'Скасовано'"""
-        count = queryset.update(status='cancelled')
+        count = queryset.update(status='cancelled', updated_at=timezone.now())
         self.message_user(request, f'{count} заявок позначено як "Скасовано".')
+
+
+@admin.register(LegalDocument)
+class LegalDocumentAdmin(admin.ModelAdmin):
+    """
+    Адмін-панель для правових документів: текст у Markdown,
+    HTML та версія оновлюються при збереженні.
+    """
+
+    list_display = ('title', 'slug', 'version', 'updated_at_display')
+    search_fields = ('title', 'slug', 'body')
+    readonly_fields = ('version', 'updated_at_display', 'html_preview')
+    fields = ('title', 'slug', 'body', 'version', 'updated_at_display', 'html_preview')
+
+    def get_readonly_fields(self, request, obj=None):
+        # slug - частина адреси, на яку вже посилаються footer і пошукові системи
+        if obj is not None:
+            return ('slug', *self.readonly_fields)
+        return self.readonly_fields
+
+    def updated_at_display(self, obj):
+        """Красиво форматує дату оновлення"""
+        if obj.updated_at is None:
+            return '—'
+        return obj.updated_at.strftime('%d.%m.%Y о %H:%M:%S')
+    updated_at_display.short_description = 'Оновлено'
+    updated_at_display.admin_order_field = 'updated_at'
+
+    def html_preview(self, obj):
+        """Збережений HTML - так документ виглядатиме на сайті"""
+        # html вже очищений render_markdown при збереженні
+        return mark_safe(obj.html) if obj.html else '—'
+    html_preview.short_description = 'Попередній перегляд'
@@ -1,10 +1,21 @@
 from django.apps import AppConfig
+from django.core.management import call_command
+from django.db.models.signals import post_migrate
+
+
+def create_cache_tables(sender, using, verbosity=1, **kwargs):
+    """
+    Таблиці DatabaseCache після migrate: на новому checkout кеш (а з ним /legal/,
+    /robots.txt, /sitemap.xml, /health/ready) працює без окремого createcachetable.
+    Для інших бекендів кешу та вже створених таблиць нічого не робить.
+    """
+    # На рівень тихіше за migrate: 'already exists' для кожного аліасу лише з -v 2
+    call_command('createcachetable', database=using, verbosity=max(verbosity - 1, 0))
 
 
 class PagesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'pages'
 
-
-
-
+    def ready(self):
+        post_migrate.connect(create_cache_tables, sender=self)
@@ -0,0 +1,9 @@
+"""
+Build-крок статичних асетів.
+
+Кожен модуль пакета генерує похідні файли у ASSET_BUILD_STATIC_DIR
+(звідки їх забирає collectstatic) та JSON-маніфест у ASSET_BUILD_DIR,
+який читають template tags під час рендерингу.
+
+Запуск: python manage.py build_assets
+"""
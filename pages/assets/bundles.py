@@ -0,0 +1,260 @@
+"""
+Склеювання та мініфікація CSS/JS у бандли.
+
+Бандли описуються в ASSET_BUNDLES. Для кожного бандла генеруються
+bundles/<name>.css та bundles/<name>.js, а також критичний CSS
+для інлайну в <head>: правила бандла, чиї селектори належать першому
+екрану сторінки (critical_css - префікси селекторів для кожної сторінки). Порядок файлів у бандлі
+зберігає порядок підключення з base.html (normalize.css завжди перший).
+
+Хеш вмісту в імені додає static storage під час collectstatic
+(PolygraphNew.storage.ForgivingManifestStaticFilesStorage).
+"""
+
+import functools
+import logging
+import os
+import posixpath
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+
+from .manifest import save_manifest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'bundles'
+BUNDLES_DIR = 'bundles'
+
+CSS_URL_RE = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+# url() критичного CSS зберігаються як static шлях і розв'язуються при рендерингу
+STATIC_REF_PREFIX = 'static:'
+STATIC_REF_RE = re.compile(r'''url\((['"]?)static:([^'")]+)\1\)''')
+# Групові at-правила: критичний CSS відбирається з їхнього вмісту
+CSS_GROUP_AT_RULES = ('@media', '@supports', '@layer', '@container')
+# At-правила, що копіюються в критичний CSS цілими
+CSS_KEPT_AT_RULES = ('@font-face', '@keyframes', '@-webkit-keyframes')
+
+
+def minify_css(source: str) -> str:
+    """Мініфікація CSS (rcssmin): рядки та вміст url() не змінюються."""
+    import rcssmin
+    return rcssmin.cssmin(source).strip()
+
+
+def minify_js(source: str) -> str:
+    """Мініфікація JS (rjsmin): рядки, шаблонні рядки та regex-літерали не змінюються."""
+    import rjsmin
+    return rjsmin.jsmin(source).strip()
+
+
+def _css_blocks(css: str):
+    """
+    Верхній рівень мініфікованого CSS: пари (прелюдія, тіло).
+
+    Для правил без тіла (@import ...;) тіло - None. Дужки всередині
+    рядків не враховуються.
+    """
+    i = 0
+    start = 0
+    depth = 0
+    body_start = None
+    length = len(css)
+    while i < length:
+        char = css[i]
+        if char in '"\'':
+            end = i + 1
+            while end < length and css[end] != char:
+                end += 2 if css[end] == '\\' else 1
+            i = end + 1
+            continue
+        if char == '{':
+            if depth == 0:
+                body_start = i
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                yield css[start:body_start].strip(), css[body_start + 1:i]
+                start = i + 1
+        elif char == ';' and depth == 0:
+            yield css[start:i].strip(), None
+            start = i + 1
+        i += 1
+
+
+def _split_selectors(prelude: str) -> list:
+    """Список селекторів правила (коми всередині :is(), :not() не розділяють)."""
+    selectors = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(prelude):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def _selector_matches(selector: str, prefixes) -> bool:
+    """
+    Чи починається селектор з одного з префіксів першого екрану.
+
+    Префікс закінчується на межі імені: '.hero' відповідає '.hero',
+    '.hero:hover', '.hero .title', але не '.hero__video' чи '.heroes';
+    'a' - не 'abbr'. Префікс, що закінчується на '_' або '-', відкритий:
+    '.hero__' - усі елементи блоку.
+    """
+    for prefix in prefixes:
+        if selector.startswith(prefix):
+            rest = selector[len(prefix):]
+            if not rest or prefix.endswith(('_', '-')) or not (rest[0].isalnum() or rest[0] in '_-'):
+                return True
+    return False
+
+
+def extract_critical_css(css: str, prefixes) -> str:
+    """
+    Правила мініфікованого CSS, що стосуються першого екрану.
+
+    Залишаються селектори, які починаються з prefixes (з правила відкидаються
+    решта селекторів), вміст @media/@supports відбирається так само,
+    @font-face та @keyframes копіюються цілими.
+
+    Args:
+        css: Мініфікований CSS бандла
+        prefixes: Префікси селекторів першого екрану ('html', '.header', '.hero')
+    """
+    parts = []
+    for prelude, body in _css_blocks(css):
+        if body is None:
+            continue
+        at_rule = prelude.split('(', 1)[0].split(' ', 1)[0].lower()
+        if at_rule in CSS_GROUP_AT_RULES:
+            inner = extract_critical_css(body, prefixes)
+            if inner:
+                parts.append(f'{prelude}{{{inner}}}')
+        elif at_rule in CSS_KEPT_AT_RULES:
+            parts.append(f'{prelude}{{{body}}}')
+        elif not prelude.startswith('@'):
+            selectors = [selector for selector in _split_selectors(prelude) if _selector_matches(selector, prefixes)]
+            if selectors:
+                parts.append(f'{",".join(selectors)}{{{body}}}')
+    return ''.join(parts)
+
+
+def _rewrite_css_urls(css: str, source_path: str, make_url) -> str:
+    """
+    Переписує відносні url() з урахуванням нового розташування CSS.
+
+    Args:
+        css: Вміст CSS файлу
+        source_path: static шлях вихідного файлу (css/components/hero.css)
+        make_url: Функція static шлях → новий URL
+    """
+    base_dir = posixpath.dirname(source_path)
+
+    def replace(match):
+        quote, url = match.groups()
+        if url.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return match.group(0)
+        target = posixpath.normpath(posixpath.join(base_dir, url))
+        return f'url({quote}{make_url(target)}{quote})'
+
+    return CSS_URL_RE.sub(replace, css)
+
+
+def _read_static(path: str) -> str:
+    """Вміст static файлу (з static/ або ASSET_BUILD_STATIC_DIR)."""
+    absolute_path = finders.find(path)
+    if not absolute_path:
+        raise FileNotFoundError(f'Static файл для бандла не знайдено: {path}')
+    with open(absolute_path, encoding='utf-8') as f:
+        return f.read()
+
+
+def _write_bundle(output_root, name: str, extension: str, content: str) -> str:
+    """Записує вміст у bundles/<name>.<ext> і повертає static шлях."""
+    path = f'{BUNDLES_DIR}/{name}.{extension}'
+    target = os.path.join(output_root, path)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+def _build_css(paths, make_url) -> str:
+    parts = []
+    for path in paths:
+        css = _rewrite_css_urls(_read_static(path), path, make_url)
+        parts.append(minify_css(css))
+    return '\n'.join(parts)
+
+
+def build_bundles(output_root) -> dict:
+    """
+    Генерує CSS/JS бандли з ASSET_BUNDLES та маніфест.
+
+    Args:
+        output_root: Корінь згенерованих static файлів (ASSET_BUILD_STATIC_DIR)
+
+    Returns:
+        Маніфест: ім'я бандла → шляхи css/js та критичний CSS за сторінками
+    """
+    # Видаляємо бандли, яких більше немає в ASSET_BUNDLES
+    bundles_dir = os.path.join(output_root, BUNDLES_DIR)
+    if os.path.isdir(bundles_dir):
+        for filename in os.listdir(bundles_dir):
+            os.remove(os.path.join(bundles_dir, filename))
+
+    manifest = {}
+
+    for name, config in settings.ASSET_BUNDLES.items():
+        entry = {}
+
+        if config.get('css'):
+            css = _build_css(
+                config['css'],
+                lambda target: posixpath.relpath(target, BUNDLES_DIR),
+            )
+            entry['css'] = _write_bundle(output_root, name, 'css', css)
+
+        if config.get('js'):
+            js = ';\n'.join(minify_js(_read_static(path)) for path in config['js'])
+            entry['js'] = _write_bundle(output_root, name, 'js', js)
+
+        # Критичний CSS інлайниться в HTML, а collectstatic його не бачить: url() - це
+        # static шляхи, які resolve_static_urls перетворює на URL з хешем при рендерингу
+        if config.get('critical_css'):
+            source = _build_css(config['css'], lambda target: f'{STATIC_REF_PREFIX}{target}')
+            entry['critical_css'] = {
+                page: extract_critical_css(source, prefixes)
+                for page, prefixes in config['critical_css'].items()
+            }
+
+        manifest[name] = entry
+        logger.info('Бандл зібрано: %s', name)
+
+    save_manifest(MANIFEST_NAME, manifest)
+    return manifest
+
+
+@functools.lru_cache(maxsize=32)
+def resolve_static_urls(css: str) -> str:
+    """
+    url(static:<шлях>) критичного CSS → URL зі staticfiles_storage.
+
+    У production це ім'я з хешем вмісту, тому асети з інлайн CSS отримують
+    той самий immutable кеш, що й решта static файлів.
+    """
+    def replace(match):
+        quote, path = match.groups()
+        return f'url({quote}{staticfiles_storage.url(path)}{quote})'
+
+    return STATIC_REF_RE.sub(replace, css)
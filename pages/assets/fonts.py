@@ -0,0 +1,260 @@
+"""
+Сабсетинг власних шрифтів у WOFF2.
+
+Для кожного шрифту з FONT_SUBSETS крок знаходить CSS селектори, що
+використовують font-family (напряму або через CSS змінну), збирає текст
+елементів з цими класами в шаблонах і залишає у шрифті лише ці гліфи.
+Результат - fonts/<family>.woff2, на який посилається @font-face у base.css.
+
+Шрифт, який жоден селектор не використовує, конвертується у WOFF2 повністю
+і не отримує preload (браузер все одно його не завантажить).
+"""
+
+import logging
+import os
+import re
+from html.parser import HTMLParser
+
+from django.conf import settings
+from django.utils.text import slugify
+from fontTools import subset
+from fontTools.ttLib import TTFont
+
+from .bundles import minify_css
+from .manifest import save_manifest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'fonts'
+FONTS_DIR = 'fonts'
+
+# Найглибші блоки "селектор { декларації }" (вкладеність @media ігнорується)
+CSS_RULE_RE = re.compile(r'([^{}]+)\{([^{}]*)\}')
+CSS_VAR_DECL_RE = re.compile(r'(--[\w-]+)\s*:\s*([^;]+)')
+CSS_FONT_FAMILY_RE = re.compile(r'font(?:-family)?\s*:\s*([^;]+)')
+CSS_VAR_USE_RE = re.compile(r'var\(\s*(--[\w-]+)')
+# Теги/змінні/коментарі Django не потрапляють у текст
+TEMPLATE_SYNTAX_RE = re.compile(r'\{%.*?%\}|\{\{.*?\}\}|\{#.*?#\}', re.S)
+
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr',
+}
+
+
+def _mentions_family(value: str, family: str) -> bool:
+    names = (name.strip().strip('\'"').lower() for name in value.split(','))
+    return family.lower() in names
+
+
+def _css_files():
+    root = settings.ASSET_SOURCE_DIR
+    for directory, _, filenames in os.walk(os.path.join(root, 'css')):
+        for filename in filenames:
+            if filename.endswith('.css'):
+                yield os.path.join(directory, filename)
+
+
+def find_font_selectors(family: str) -> list:
+    """
+    Знаходить селектори, що застосовують font-family.
+
+    Враховує як 'font-family: <family>', так і var(--змінна), значення
+    якої містить family.
+
+    Args:
+        family: Ім'я font-family з @font-face
+
+    Returns:
+        Список простих селекторів (останній складений селектор кожного правила)
+    """
+    rules = []
+    for path in _css_files():
+        with open(path, encoding='utf-8') as f:
+            css = minify_css(f.read())
+        rules += CSS_RULE_RE.findall(css)
+
+    variables = set()
+    for _, declarations in rules:
+        for name, value in CSS_VAR_DECL_RE.findall(declarations):
+            if _mentions_family(value, family):
+                variables.add(name)
+
+    selectors = []
+    for selector_list, declarations in rules:
+        if selector_list.strip().startswith('@'):
+            continue
+        for value in CSS_FONT_FAMILY_RE.findall(declarations):
+            used_vars = set(CSS_VAR_USE_RE.findall(value))
+            if _mentions_family(value, family) or used_vars & variables:
+                for selector in selector_list.split(','):
+                    # Цікавить лише елемент, до якого застосовується правило
+                    compound = re.split(r'[\s>+~]+', selector.strip())[-1]
+                    compound = re.sub(r'::?[\w-]+(\([^)]*\))?', '', compound)
+                    if compound:
+                        selectors.append(compound)
+    return selectors
+
+
+def _parse_compound(compound: str):
+    tag = re.match(r'^[a-zA-Z][\w-]*', compound)
+    return (
+        tag.group(0).lower() if tag else None,
+        set(re.findall(r'\.([\w-]+)', compound)),
+        set(re.findall(r'#([\w-]+)', compound)),
+    )
+
+
+class _TextCollector(HTMLParser):
+    """Збирає текст усередині елементів, що відповідають селекторам."""
+
+    def __init__(self, selectors):
+        super().__init__(convert_charrefs=True)
+        self.selectors = [_parse_compound(selector) for selector in selectors]
+        self.stack = []
+        self.active = 0
+        self.text = []
+
+    def _matches(self, tag, attrs):
+        classes = set((attrs.get('class') or '').split())
+        element_id = attrs.get('id')
+        for selector_tag, selector_classes, selector_ids in self.selectors:
+            if selector_tag and selector_tag != tag:
+                continue
+            if not selector_classes <= classes:
+                continue
+            if selector_ids and element_id not in selector_ids:
+                continue
+            if selector_tag or selector_classes or selector_ids:
+                return True
+        return False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+        matched = self._matches(tag, dict(attrs))
+        self.stack.append((tag, matched))
+        self.active += matched
+
+    def handle_endtag(self, tag):
+        # Відновлення після незакритих тегів: знімаємо до відповідного
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index][0] == tag:
+                for _, matched in self.stack[index:]:
+                    self.active -= matched
+                del self.stack[index:]
+                return
+
+    def handle_data(self, data):
+        if self.active:
+            self.text.append(data)
+
+
+def collect_font_text(selectors) -> str:
+    """
+    Текст з шаблонів, що рендериться елементами з вказаними селекторами.
+
+    Args:
+        selectors: Прості селектори з find_font_selectors
+
+    Returns:
+        Рядок з усіма знайденими символами (без повторів, відсортований)
+    """
+    chars = set()
+    if not selectors:
+        return ''
+
+    for template_dir in settings.TEMPLATES[0]['DIRS']:
+        for directory, _, filenames in os.walk(template_dir):
+            for filename in filenames:
+                if not filename.endswith('.html'):
+                    continue
+                with open(os.path.join(directory, filename), encoding='utf-8') as f:
+                    source = TEMPLATE_SYNTAX_RE.sub(' ', f.read())
+                collector = _TextCollector(selectors)
+                collector.feed(source)
+                collector.close()
+                text = ''.join(collector.text)
+                # text-transform може змінити регістр - беремо обидва варіанти
+                chars.update(text, text.upper(), text.lower())
+
+    chars = {char for char in chars if not char.isspace()}
+    if not chars:
+        return ''
+    return ''.join(sorted(chars)) + ' '
+
+
+def subset_font(source_path: str, target_path: str, text: str) -> None:
+    """
+    Зберігає WOFF2 копію шрифту; якщо text не порожній - лише з цими гліфами.
+
+    Args:
+        source_path: Вихідний OTF/TTF
+        target_path: Шлях до .woff2
+        text: Символи, які треба залишити
+    """
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+
+    font = TTFont(source_path)
+    if text:
+        subsetter = subset.Subsetter(options=options)
+        subsetter.populate(text=text)
+        subsetter.subset(font)
+    font.flavor = 'woff2'
+
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    font.save(target_path)
+    font.close()
+
+
+def build_font_subsets(source_root, output_root) -> dict:
+    """
+    Генерує WOFF2 сабсети шрифтів з FONT_SUBSETS та маніфест.
+
+    Args:
+        source_root: Корінь вихідних static файлів (ASSET_SOURCE_DIR)
+        output_root: Корінь згенерованих static файлів (ASSET_BUILD_STATIC_DIR)
+
+    Returns:
+        Маніфест: font-family → шлях woff2, символи, розміри, чи потрібен preload
+    """
+    manifest = {}
+
+    for family, source in settings.FONT_SUBSETS.items():
+        source_path = os.path.join(source_root, source)
+        if not os.path.exists(source_path):
+            logger.warning('Шрифт для сабсетингу не знайдено: %s', source)
+            continue
+
+        selectors = find_font_selectors(family)
+        text = collect_font_text(selectors)
+        if text:
+            text += settings.FONT_SUBSET_EXTRA_TEXT
+        else:
+            logger.warning(
+                'Шрифт "%s" не використовується жодним селектором - конвертуємо без сабсетингу',
+                family,
+            )
+
+        name = f'{FONTS_DIR}/{slugify(family)}.woff2'
+        target_path = os.path.join(output_root, name)
+        subset_font(source_path, target_path, text)
+
+        manifest[family] = {
+            'path': name,
+            'text': text,
+            'preload': bool(text),
+            'source_size': os.path.getsize(source_path),
+            'size': os.path.getsize(target_path),
+        }
+        logger.info(
+            'Шрифт %s: %d → %d байт',
+            family, manifest[family]['source_size'], manifest[family]['size'],
+        )
+
+    save_manifest(MANIFEST_NAME, manifest)
+    return manifest
@@ -0,0 +1,159 @@
+"""
+Критичні асети сторінки для Link: rel=preload та 103 Early Hints.
+
+Шаблон аналізується статично, без рендерингу: обходиться ланцюжок
+{% extends %} / {% include %} з урахуванням перевизначених {% block %},
+і збираються виклики тегів {% load assets %} та {% static %} з літеральними
+аргументами. URL береться з тих самих маніфестів, що й у template tags,
+тож preload завжди збігається з тим, що потім з'явиться в HTML.
+"""
+
+import logging
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist
+from django.template.library import SimpleNode
+from django.template.loader import get_template
+from django.template.loader_tags import BlockNode, ExtendsNode, IncludeNode
+from django.templatetags.static import StaticNode, static
+from django.utils.encoding import iri_to_uri
+
+from .bundles import MANIFEST_NAME as BUNDLES_MANIFEST
+from .fonts import MANIFEST_NAME as FONTS_MANIFEST
+from .manifest import load_manifest
+from .vendor import MANIFEST_NAME as VENDOR_MANIFEST
+from .video import MANIFEST_NAME as POSTERS_MANIFEST
+
+logger = logging.getLogger(__name__)
+
+STATIC_EXTENSIONS = {
+    '.css': 'style',
+    '.js': 'script',
+}
+
+
+def _literal(expression):
+    """Значення FilterExpression, якщо це рядковий літерал без фільтрів."""
+    if expression.filters or not isinstance(expression.var, str):
+        return None
+    return expression.var
+
+
+def _walk(nodelist, blocks, visited):
+    """
+    Повертає вузли шаблону в порядку рендерингу.
+
+    Args:
+        nodelist: NodeList для обходу
+        blocks: Перевизначені блоки нащадків: ім'я → BlockNode
+        visited: Імена шаблонів у поточному ланцюжку (захист від циклів)
+    """
+    for node in nodelist:
+        if isinstance(node, ExtendsNode):
+            parent_name = _literal(node.parent_name)
+            if parent_name is None or parent_name in visited:
+                continue
+            child_blocks = dict(node.blocks)
+            child_blocks.update(blocks)
+            yield from _walk_template(parent_name, child_blocks, visited)
+            # Усе поза блоками в дочірньому шаблоні не рендериться
+            return
+        if isinstance(node, BlockNode):
+            block = blocks.get(node.name, node)
+            yield from _walk(block.nodelist, blocks, visited)
+            continue
+        if isinstance(node, IncludeNode):
+            name = _literal(node.template)
+            if name and name not in visited:
+                yield from _walk_template(name, {}, visited)
+            continue
+
+        yield node
+        for attr in node.child_nodelists:
+            yield from _walk(getattr(node, attr, None) or [], blocks, visited)
+
+
+def _walk_template(name, blocks, visited):
+    try:
+        template = get_template(name).template
+    except TemplateDoesNotExist:
+        logger.warning('Шаблон для Early Hints не знайдено: %s', name)
+        return
+    yield from _walk(template.nodelist, blocks, visited | {name})
+
+
+def _link(url, as_type, **params):
+    parts = [f'<{iri_to_uri(url)}>', 'rel=preload', f'as={as_type}']
+    for key, value in params.items():
+        parts.append(key if value is True else f'{key}="{value}"')
+    return '; '.join(parts)
+
+
+def _bundle_links(name, kind, as_type):
+    entry = load_manifest(BUNDLES_MANIFEST).get(name)
+    if entry and entry.get(kind):
+        return [_link(static(entry[kind]), as_type)]
+    # Без build_assets - окремі файли бандла
+    return [_link(static(path), as_type) for path in settings.ASSET_BUNDLES.get(name, {}).get(kind, [])]
+
+
+def _htmx_links():
+    entry = load_manifest(VENDOR_MANIFEST).get('htmx')
+    if entry:
+        return [_link(static(entry['path']), 'script')]
+    # CDN: preload крос-доменного скрипту з integrity ненадійний, тому лише з'єднання
+    parts = urlsplit(settings.HTMX_CDN_URL)
+    return [f'<{parts.scheme}://{parts.netloc}>; rel=preconnect; crossorigin']
+
+
+def _font_links():
+    return [
+        _link(static(entry['path']), 'font', type='font/woff2', crossorigin=True)
+        for entry in load_manifest(FONTS_MANIFEST).values()
+        if entry.get('preload')
+    ]
+
+
+def _poster_links(path):
+    entry = load_manifest(POSTERS_MANIFEST).get(path)
+    return [_link(static(entry['poster']), 'image')] if entry else []
+
+
+def _simple_tag_links(node):
+    name = getattr(node.func, '__name__', '')
+    args = [_literal(arg) for arg in node.args]
+
+    if name == 'bundle_css' and args and args[0]:
+        return _bundle_links(args[0], 'css', 'style')
+    if name == 'bundle_js' and args and args[0]:
+        return _bundle_links(args[0], 'js', 'script')
+    if name == 'htmx_script':
+        return _htmx_links()
+    if name == 'font_preloads':
+        return _font_links()
+    if name == 'video_poster' and args and args[0]:
+        return _poster_links(args[0])
+    return []
+
+
+def template_preload_links(template_name: str) -> list:
+    """
+    Значення заголовків Link для критичних асетів шаблону.
+
+    Args:
+        template_name: Ім'я шаблону повної сторінки (index.html)
+
+    Returns:
+        Список значень Link без дублікатів, у порядку появи в HTML
+    """
+    links = []
+    for node in _walk_template(template_name, {}, frozenset()):
+        if isinstance(node, SimpleNode):
+            links += _simple_tag_links(node)
+        elif isinstance(node, StaticNode):
+            path = _literal(node.path)
+            extension = path and path[path.rfind('.'):]
+            if extension in STATIC_EXTENSIONS:
+                links.append(_link(static(path), STATIC_EXTENSIONS[extension]))
+    return list(dict.fromkeys(links))
@@ -0,0 +1,99 @@
+"""
+Генерація іконок сайту з одного вихідного зображення через Pillow.
+
+З ICON_SOURCE створюються favicon.ico (кілька розмірів в одному файлі),
+apple-touch-icon (непрозорий фон - iOS замінює прозорість чорним) та PNG
+іконки для web app manifest. Неквадратне зображення вписується в квадрат
+на тлі ICON_BACKGROUND. Результат описується маніфестом 'icons', з якого
+{% icon_links %}, /favicon.ico та /site.webmanifest беруть шляхи.
+"""
+
+import logging
+import os
+
+from django.conf import settings
+
+from .manifest import save_manifest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'icons'
+ICONS_DIR = 'icons'
+
+FAVICON_SIZES = (16, 32, 48)
+ICO_BASE_SIZE = 256
+APPLE_TOUCH_SIZE = 180
+MANIFEST_ICON_SIZES = (192, 512)
+PNG_COLORS = 256
+
+
+def _is_stale(source: str, target: str) -> bool:
+    """Чи потрібно перегенерувати іконку (немає або старша за оригінал)."""
+    try:
+        return os.stat(target).st_mtime < os.stat(source).st_mtime
+    except OSError:
+        return True
+
+
+def _square(image, size: int, background: str):
+    """Зображення, вписане в квадрат size×size на непрозорому тлі."""
+    from PIL import Image, ImageOps
+
+    fitted = ImageOps.contain(image.convert('RGBA'), (size, size), Image.LANCZOS)
+    square = Image.new('RGBA', (size, size), background)
+    square.alpha_composite(fitted, ((size - fitted.width) // 2, (size - fitted.height) // 2))
+    return square.convert('RGB')
+
+
+def build_icons(source_root, output_root, force: bool = False) -> dict:
+    """
+    Генерує favicon.ico, apple-touch-icon та іконки manifest.
+
+    Args:
+        source_root: Корінь вихідних static файлів (static/)
+        output_root: Корінь згенерованих static файлів (ASSET_BUILD_STATIC_DIR)
+        force: Перегенерувати іконки, навіть актуальні
+
+    Returns:
+        Маніфест: favicon, apple_touch_icon, icons ([розмір, static шлях]) або {},
+        якщо ICON_SOURCE не знайдено
+    """
+    from PIL import Image
+
+    source = os.path.join(source_root, settings.ICON_SOURCE)
+    if not os.path.isfile(source):
+        logger.warning('Вихідне зображення іконок не знайдено: %s', source)
+        save_manifest(MANIFEST_NAME, {})
+        return {}
+
+    background = settings.ICON_BACKGROUND
+    manifest = {
+        'favicon': f'{ICONS_DIR}/favicon.ico',
+        'apple_touch_icon': f'{ICONS_DIR}/apple-touch-icon.png',
+        'icons': [[size, f'{ICONS_DIR}/icon-{size}.png'] for size in MANIFEST_ICON_SIZES],
+    }
+    targets = [manifest['favicon'], manifest['apple_touch_icon'], *(name for _, name in manifest['icons'])]
+
+    if force or any(_is_stale(source, os.path.join(output_root, name)) for name in targets):
+        os.makedirs(os.path.join(output_root, ICONS_DIR), exist_ok=True)
+        with Image.open(source) as image:
+            image.load()
+            # ICO містить усі FAVICON_SIZES, Pillow зменшує їх з одного більшого зображення
+            _square(image, ICO_BASE_SIZE, background).save(
+                os.path.join(output_root, manifest['favicon']),
+                format='ICO',
+                sizes=[(size, size) for size in FAVICON_SIZES],
+            )
+            png_icons = [(APPLE_TOUCH_SIZE, manifest['apple_touch_icon']), *manifest['icons']]
+            for size, name in png_icons:
+                # Палітра 256 кольорів: для іконки різниці не видно, файл удвічі менший
+                _square(image, size, background).quantize(PNG_COLORS).save(
+                    os.path.join(output_root, name),
+                    format='PNG',
+                    optimize=True,
+                )
+        logger.info('Іконки згенеровано з %s', settings.ICON_SOURCE)
+
+    manifest['sizes'] = {name: os.path.getsize(os.path.join(output_root, name)) for name in targets}
+    save_manifest(MANIFEST_NAME, manifest)
+    return manifest
@@ -0,0 +1,137 @@
+"""
+Генерація адаптивних варіантів зображень (AVIF/WebP) через Pillow.
+
+Для кожного зображення з RESPONSIVE_IMAGE_DIRS створюються зменшені копії
+шириною з RESPONSIVE_IMAGE_WIDTHS у форматах RESPONSIVE_IMAGE_FORMATS
+плюс один fallback в оригінальному форматі. Результат описується маніфестом
+'responsive-images', з якого {% responsive_img %} будує srcset.
+"""
+
+import logging
+import os
+
+from django.conf import settings
+from django.utils.text import slugify
+
+from .manifest import save_manifest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'responsive-images'
+VARIANTS_DIR = 'img/responsive'
+
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Параметри кодування: build-час не критичний, тому максимальне стиснення
+SAVE_OPTIONS = {
+    'avif': {'quality': 55, 'speed': 4},
+    'webp': {'quality': 78, 'method': 6},
+    'jpeg': {'quality': 80, 'optimize': True, 'progressive': True},
+    'png': {'optimize': True},
+}
+
+# Ширина fallback-зображення для браузерів без AVIF/WebP
+FALLBACK_MAX_WIDTH = 960
+
+
+def _variant_stem(relative_path: str) -> str:
+    """Безпечне ім'я файлу варіанту (латиниця, без пробілів)."""
+    stem = os.path.splitext(os.path.basename(relative_path))[0]
+    return slugify(stem) or 'image'
+
+
+def _target_widths(original_width: int, widths) -> list:
+    """Ширини варіантів без збільшення понад оригінал."""
+    targets = sorted({w for w in widths if w < original_width})
+    targets.append(original_width)
+    return targets
+
+
+def _is_stale(source: str, target: str) -> bool:
+    """Чи потрібно перегенерувати варіант (немає або старший за оригінал)."""
+    try:
+        return os.stat(target).st_mtime < os.stat(source).st_mtime
+    except OSError:
+        return True
+
+
+def _save_variant(image, width: int, fmt: str, target: str) -> None:
+    """Зменшує зображення до ширини width і зберігає у форматі fmt."""
+    from PIL import Image
+
+    height = round(image.height * width / image.width)
+    resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+    if fmt == 'jpeg' and resized.mode != 'RGB':
+        resized = resized.convert('RGB')
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    resized.save(target, format=fmt.upper(), **SAVE_OPTIONS[fmt])
+
+
+def build_responsive_images(source_root, output_root, force: bool = False) -> dict:
+    """
+    Генерує адаптивні варіанти зображень та маніфест.
+
+    Args:
+        source_root: Корінь вихідних static файлів (static/)
+        output_root: Корінь згенерованих static файлів (ASSET_BUILD_STATIC_DIR)
+        force: Перегенерувати всі варіанти, навіть актуальні
+
+    Returns:
+        Маніфест: static шлях оригіналу → розміри, fallback та варіанти за форматом
+    """
+    from PIL import Image, features
+
+    widths = getattr(settings, 'RESPONSIVE_IMAGE_WIDTHS', [320, 640, 960, 1280])
+    formats = [
+        fmt for fmt in getattr(settings, 'RESPONSIVE_IMAGE_FORMATS', ['avif', 'webp'])
+        if features.check(fmt)
+    ]
+    manifest = {}
+
+    for directory in getattr(settings, 'RESPONSIVE_IMAGE_DIRS', ['img']):
+        source_dir = os.path.join(source_root, directory)
+        if not os.path.isdir(source_dir):
+            continue
+
+        for filename in sorted(os.listdir(source_dir)):
+            if not filename.lower().endswith(SOURCE_EXTENSIONS):
+                continue
+
+            relative_path = f'{directory}/{filename}'
+            source = os.path.join(source_dir, filename)
+            stem = _variant_stem(relative_path)
+
+            with Image.open(source) as image:
+                image.load()
+                original_width, original_height = image.size
+                has_alpha = image.mode in ('RGBA', 'LA', 'P')
+                fallback_format = 'png' if has_alpha else 'jpeg'
+                fallback_ext = 'png' if has_alpha else 'jpg'
+
+                entry = {
+                    'width': original_width,
+                    'height': original_height,
+                    'variants': {},
+                }
+
+                for fmt in formats:
+                    entry['variants'][fmt] = []
+                    for width in _target_widths(original_width, widths):
+                        name = f'{VARIANTS_DIR}/{stem}-{width}.{fmt}'
+                        target = os.path.join(output_root, name)
+                        if force or _is_stale(source, target):
+                            _save_variant(image, width, fmt, target)
+                        entry['variants'][fmt].append([width, name])
+
+                fallback_width = min(original_width, FALLBACK_MAX_WIDTH)
+                fallback_name = f'{VARIANTS_DIR}/{stem}-{fallback_width}.{fallback_ext}'
+                fallback_target = os.path.join(output_root, fallback_name)
+                if force or _is_stale(source, fallback_target):
+                    _save_variant(image, fallback_width, fallback_format, fallback_target)
+                entry['fallback'] = fallback_name
+
+            manifest[relative_path] = entry
+            logger.info('Адаптивні варіанти згенеровано: %s', relative_path)
+
+    save_manifest(MANIFEST_NAME, manifest)
+    return manifest
@@ -0,0 +1,72 @@
+"""
+Читання та запис JSON-маніфестів build-кроку.
+"""
+
+import json
+import logging
+import os
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Кеш маніфестів: name → (mtime, data). Перечитуємо лише якщо файл змінився.
+_manifest_cache = {}
+
+
+def manifest_path(name: str) -> str:
+    """Повертає шлях до маніфесту з вказаним ім'ям у ASSET_BUILD_DIR."""
+    return os.path.join(settings.ASSET_BUILD_DIR, f'{name}.json')
+
+
+def load_manifest(name: str) -> dict:
+    """
+    Завантажує маніфест build-кроку.
+
+    Якщо build ще не запускався (наприклад, локальна розробка),
+    повертає порожній словник - template tags мають fallback на оригінальні файли.
+
+    Args:
+        name: Ім'я маніфесту без розширення
+
+    Returns:
+        Вміст маніфесту або {}
+    """
+    path = manifest_path(name)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return {}
+
+    cached = _manifest_cache.get(name)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error('Не вдалося прочитати маніфест %s: %s', path, e)
+        return {}
+
+    _manifest_cache[name] = (mtime, data)
+    return data
+
+
+def save_manifest(name: str, data: dict) -> str:
+    """
+    Записує маніфест build-кроку.
+
+    Args:
+        name: Ім'я маніфесту без розширення
+        data: Вміст маніфесту
+
+    Returns:
+        Шлях до записаного файлу
+    """
+    path = manifest_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+    _manifest_cache.pop(name, None)
+    return path
@@ -0,0 +1,78 @@
+"""
+Локальна копія сторонніх бібліотек (HTMX) замість CDN.
+
+Файл завантажується під час build і перевіряється за SRI хешем з налаштувань,
+тож у static потрапляє рівно та версія, яку раніше підключали з CDN.
+Якщо мережа недоступна - крок пропускається, шаблон використовує CDN.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+
+import requests
+from django.conf import settings
+
+from .manifest import save_manifest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'vendor'
+VENDOR_DIR = 'js/vendor'
+
+
+def sri_hash(content: bytes, algorithm: str = 'sha384') -> str:
+    """Subresource Integrity хеш у форматі 'sha384-...'."""
+    digest = hashlib.new(algorithm, content).digest()
+    return f'{algorithm}-{base64.b64encode(digest).decode()}'
+
+
+def _matches_integrity(content: bytes, integrity: str) -> bool:
+    algorithm = integrity.split('-', 1)[0]
+    return sri_hash(content, algorithm) == integrity
+
+
+def build_vendor(output_root, force: bool = False) -> dict:
+    """
+    Завантажує HTMX у ASSET_BUILD_STATIC_DIR та записує маніфест.
+
+    Args:
+        output_root: Корінь згенерованих static файлів
+        force: Завантажити повторно, навіть якщо локальна копія актуальна
+
+    Returns:
+        Маніфест: бібліотека → static шлях та integrity
+    """
+    name = f'{VENDOR_DIR}/htmx-{settings.HTMX_VERSION}.min.js'
+    target = os.path.join(output_root, name)
+    integrity = settings.HTMX_INTEGRITY
+    manifest = {}
+
+    content = None
+    if not force and os.path.exists(target):
+        with open(target, 'rb') as f:
+            content = f.read()
+        if not _matches_integrity(content, integrity):
+            content = None
+
+    if content is None:
+        try:
+            response = requests.get(settings.HTMX_CDN_URL, timeout=30)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.warning('Не вдалося завантажити HTMX, залишаємо CDN: %s', e)
+            save_manifest(MANIFEST_NAME, manifest)
+            return manifest
+
+        content = response.content
+        if not _matches_integrity(content, integrity):
+            raise ValueError(f'HTMX з {settings.HTMX_CDN_URL} не відповідає HTMX_INTEGRITY')
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(content)
+
+    manifest['htmx'] = {'path': name, 'integrity': integrity}
+    save_manifest(MANIFEST_NAME, manifest)
+    return manifest
@@ -0,0 +1,112 @@
+"""
+Генерація постерів (першого кадру) для відео через ffmpeg + Pillow.
+
+ffmpeg береться з imageio-ffmpeg (статичний бінарник з pip), або з PATH.
+Постер показується до завантаження відео, що дозволяє preload="metadata"
+замість завантаження всього файлу.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+
+from django.conf import settings
+
+from .manifest import save_manifest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'video-posters'
+POSTERS_DIR = 'video/posters'
+
+SOURCE_EXTENSIONS = ('.mp4', '.webm', '.mov')
+
+
+def find_ffmpeg():
+    """Шлях до ffmpeg або None якщо недоступний."""
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        return shutil.which('ffmpeg')
+
+
+def _extract_frame(ffmpeg: str, source: str, target: str, timestamp: float) -> None:
+    """Зберігає кадр відео на позиції timestamp у PNG."""
+    subprocess.run(
+        [
+            ffmpeg, '-v', 'error', '-y',
+            '-ss', str(timestamp),
+            '-i', source,
+            '-frames:v', '1',
+            target,
+        ],
+        check=True,
+        timeout=60,
+    )
+
+
+def build_video_posters(source_root, output_root, force: bool = False) -> dict:
+    """
+    Генерує WebP постери для відео та маніфест.
+
+    Args:
+        source_root: Корінь вихідних static файлів (static/)
+        output_root: Корінь згенерованих static файлів (ASSET_BUILD_STATIC_DIR)
+        force: Перегенерувати всі постери, навіть актуальні
+
+    Returns:
+        Маніфест: static шлях відео → шлях постера та його розміри
+    """
+    from PIL import Image
+
+    ffmpeg = find_ffmpeg()
+    if not ffmpeg:
+        logger.warning('ffmpeg не знайдено - постери для відео не згенеровано')
+        return {}
+
+    timestamp = getattr(settings, 'VIDEO_POSTER_TIMESTAMP', 0.0)
+    max_width = getattr(settings, 'VIDEO_POSTER_MAX_WIDTH', 1280)
+    manifest = {}
+
+    source_dir = os.path.join(source_root, 'video')
+    if not os.path.isdir(source_dir):
+        save_manifest(MANIFEST_NAME, manifest)
+        return manifest
+
+    for filename in sorted(os.listdir(source_dir)):
+        if not filename.lower().endswith(SOURCE_EXTENSIONS):
+            continue
+
+        source = os.path.join(source_dir, filename)
+        name = f'{POSTERS_DIR}/{os.path.splitext(filename)[0]}.webp'
+        target = os.path.join(output_root, name)
+
+        stale = force or not os.path.exists(target) or (
+            os.stat(target).st_mtime < os.stat(source).st_mtime
+        )
+        if stale:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with tempfile.TemporaryDirectory() as tmp:
+                frame_path = os.path.join(tmp, 'frame.png')
+                _extract_frame(ffmpeg, source, frame_path, timestamp)
+                with Image.open(frame_path) as frame:
+                    if frame.width > max_width:
+                        height = round(frame.height * max_width / frame.width)
+                        frame = frame.resize((max_width, height), Image.LANCZOS)
+                    frame.convert('RGB').save(target, format='WEBP', quality=70, method=6)
+
+        with Image.open(target) as poster:
+            width, height = poster.size
+
+        manifest[f'video/{filename}'] = {
+            'poster': name,
+            'width': width,
+            'height': height,
+        }
+        logger.info('Постер згенеровано: video/%s', filename)
+
+    save_manifest(MANIFEST_NAME, manifest)
+    return manifest
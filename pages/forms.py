@@ -2,12 +2,84 @@
 Форми для сторінок сайту.
 """
 
+import logging
 import re
 from django import forms
+from django.forms.utils import ErrorDict
 
+from .utils.form_guard import TOKEN_FIELD, FormGuardError, check_submission, claim_token, refresh_token
 
-class ConsultationForm(forms.Form):
+logger = logging.getLogger(__name__)
+
+# Повідомлення для відхилених фільтром відправок. Боти бачать загальну помилку,
+# а людина зі сторінкою з кешу (service worker, давно відкрита вкладка) - прохання
+# надіслати ще раз: відповідь містить новий токен
+GUARD_MESSAGES = {
+    'too_fast': 'Будь ласка, спробуйте ще раз.',
+    'missing': 'Сторінка застаріла. Натисніть «Надіслати» ще раз.',
+    'invalid': 'Сторінка застаріла. Натисніть «Надіслати» ще раз.',
+    'expired': 'Сторінка застаріла. Натисніть «Надіслати» ще раз.',
+    'replayed': 'Цю заявку вже надіслано.',
+}
+
+# Причини, з якими людина отримує новий токен (replayed - подвійне натискання
+# або сторінка з кешу service worker, з якої вже надсилали заявку)
+GUARD_REISSUE_REASONS = {'missing', 'invalid', 'expired', 'replayed'}
+
+
+class BotFilterMixin:
+    """
+    Фільтр ботів для форм заявок (pages.utils.form_guard).
+
+    Honeypot та підписаний час рендерингу перевіряються до валідації полів:
+    відхилена відправка коштує мікросекунди і не доходить до БД та сповіщень.
+    Токен прийнятої відправки позначається використаним, тому повтор відхиляється.
+    У шаблоні поля форми виводить {% form_guard '<guard_scope>' %}.
+    """
+
+    # Назва форми в токені (form_type заявки)
+    guard_scope = None
+
+    def full_clean(self):
+        self.guard_rejection = None
+        if not self.is_bound:
+            return super().full_clean()
+        try:
+            nonce = check_submission(self.guard_scope, self.data)
+        except FormGuardError as e:
+            self._reject(e.reason)
+            return
+
+        super().full_clean()
+        if self._errors:
+            # Відправку з помилками полів можна виправити і надіслати з тим самим токеном
+            return
+        try:
+            claim_token(nonce)
+        except FormGuardError as e:
+            self._reject(e.reason)
+
+    def _reject(self, reason):
+        logger.info('Форму %s відхилено фільтром ботів: %s', self.guard_scope, reason)
+        self.guard_rejection = reason
+        self._errors = ErrorDict()
+        self.cleaned_data = {}
+        self.add_error(None, GUARD_MESSAGES.get(reason, 'Помилка валідації'))
+
+    def fresh_token(self):
+        """
+        Новий токен, якщо відправку відхилено через застарілу сторінку, інакше None.
+        Час рендерингу сторінки зберігається - повторна відправка не буде too_fast.
+        """
+        if self.guard_rejection in GUARD_REISSUE_REASONS:
+            return refresh_token(self.guard_scope, self.data.get(TOKEN_FIELD))
+        return None
+
+
+class ConsultationForm(BotFilterMixin, forms.Form):
     """Форма для запиту консультації в footer"""
+
+    guard_scope = 'consultation'
     
     name = forms.CharField(
         label="Ім'я",
@@ -48,8 +120,10 @@ class ConsultationForm(forms.Form):
     )
 
 
-class CTAContactForm(forms.Form):
+class CTAContactForm(BotFilterMixin, forms.Form):
     """Форма для CTA секції на головній сторінці"""
+
+    guard_scope = 'cta'
     
     name = forms.CharField(
         label="Ім'я",
@@ -95,8 +169,10 @@ class CTAContactForm(forms.Form):
     )
 
 
-class InfidelityCheckForm(forms.Form):
+class InfidelityCheckForm(BotFilterMixin, forms.Form):
     """Форма для рекламного лендінгу - перевірка на зраду"""
+
+    guard_scope = 'infidelity'
     
     name = forms.CharField(
         label="Ім'я",
@@ -123,24 +199,9 @@ class InfidelityCheckForm(forms.Form):
         })
     )
     
-    honeypot = forms.CharField(
-        label="",
-        max_length=100,
-        required=False,
-        widget=forms.TextInput(attrs={
-            'style': 'display:none !important;',
-            'tabindex': '-1',
-            'autocomplete': 'off',
-        })
-    )
-    
     def clean(self):
         cleaned_data = super().clean()
         
-        # Перевірка honeypot
-        if cleaned_data.get('honeypot'):
-            raise forms.ValidationError('Помилка валідації')
-        
         # Валідація телефону
         phone = cleaned_data.get('phone', '')
         digits = re.sub(r'\D', '', phone)
@@ -154,8 +215,10 @@ class InfidelityCheckForm(forms.Form):
         return cleaned_data
 
 
-class CorporateServicesForm(forms.Form):
+class CorporateServicesForm(BotFilterMixin, forms.Form):
     """Форма для корпоративного лендінгу - професійні послуги"""
+
+    guard_scope = 'corporate'
     
     name = forms.CharField(
         label="Ім'я",
@@ -182,24 +245,9 @@ class CorporateServicesForm(forms.Form):
         })
     )
     
-    honeypot = forms.CharField(
-        label="",
-        max_length=100,
-        required=False,
-        widget=forms.TextInput(attrs={
-            'style': 'display:none !important;',
-            'tabindex': '-1',
-            'autocomplete': 'off',
-        })
-    )
-    
     def clean(self):
         cleaned_data = super().clean()
         
-        # Перевірка honeypot
-        if cleaned_data.get('honeypot'):
-            raise forms.ValidationError('Помилка валідації')
-        
         # Валідація телефону
         phone = cleaned_data.get('phone', '')
         digits = re.sub(r'\D', '', phone)
@@ -0,0 +1,141 @@
+"""
+Django management command для мікробенчмарків гарячого шляху запиту.
+Вимірює валідацію форм, форматування повідомлень Telegram, get_client_ip,
+рендеринг сторінок/partials та middleware stack (pages/perf/benchmarks.py)
+і порівнює з JSON baseline. Регресія понад поріг - ненульовий код виходу.
+
+Використання:
+    python manage.py bench --save              # записати baseline
+    python manage.py bench                     # порівняти з baseline
+    python manage.py bench --only render --threshold 0.3
+"""
+
+import json
+import os
+import platform
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.perf.benchmarks import BENCHMARKS, measure
+
+
+class Command(BaseCommand):
+    help = 'Мікробенчмарки форм, шаблонів та middleware з перевіркою регресій'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--only',
+            action='append',
+            help='Лише бенчмарки з цим префіксом імені (forms, render.index, ...); можна повторювати',
+        )
+        parser.add_argument(
+            '--save',
+            action='store_true',
+            help='Зберегти результати як новий baseline',
+        )
+        parser.add_argument(
+            '--baseline',
+            default=settings.BENCH_BASELINE_PATH,
+            help='Шлях до JSON baseline (за замовчуванням: BENCH_BASELINE_PATH)',
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=settings.BENCH_REGRESSION_THRESHOLD,
+            help='Допустиме сповільнення відносно baseline (0.2 = 20%%)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Кількість повторів кожного бенчмарку (за замовчуванням: 5)',
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='Лише показати доступні бенчмарки',
+        )
+
+    def handle(self, *args, **options):
+        names = sorted(BENCHMARKS)
+        if options['only']:
+            names = [name for name in names if name.startswith(tuple(options['only']))]
+        if not names:
+            raise CommandError('Жоден бенчмарк не відповідає --only')
+
+        if options['list']:
+            for name in names:
+                self.stdout.write(name)
+            return
+
+        baseline = self._load_baseline(options['baseline'])
+        results = {}
+        regressions = []
+
+        self.stdout.write(f'{"Бенчмарк":<36} {"best":>11} {"median":>11} {"baseline":>11} {"зміна":>8}')
+        for name in names:
+            try:
+                func = BENCHMARKS[name]()
+                result = measure(func, repeat=options['repeat'])
+            except Exception as e:
+                raise CommandError(f'Помилка бенчмарку "{name}": {str(e)}')
+            results[name] = result
+
+            line = f'{name:<36} {result["best_us"]:>9.1f}µs {result["median_us"]:>9.1f}µs'
+            previous = baseline.get('results', {}).get(name)
+            if not previous:
+                self.stdout.write(f'{line} {"-":>11} {"нове":>8}')
+                continue
+
+            change = result['best_us'] / previous['best_us'] - 1
+            # Для функцій у долі мікросекунди відносна зміна - це шум таймера
+            significant = abs(result['best_us'] - previous['best_us']) >= settings.BENCH_NOISE_FLOOR_US
+            line = f'{line} {previous["best_us"]:>9.1f}µs {change:>+7.0%}'
+            if not significant:
+                self.stdout.write(line)
+            elif change > options['threshold']:
+                regressions.append((name, change))
+                self.stdout.write(self.style.ERROR(line))
+            elif change < -options['threshold']:
+                self.stdout.write(self.style.SUCCESS(line))
+            else:
+                self.stdout.write(line)
+
+        if options['save']:
+            self._save_baseline(options['baseline'], baseline, results)
+            self.stdout.write(self.style.SUCCESS(f'✓ Baseline збережено: {options["baseline"]}'))
+            return
+
+        if regressions:
+            details = ', '.join(f'{name} {change:+.0%}' for name, change in regressions)
+            raise CommandError(f'Регресія понад {options["threshold"]:.0%}: {details}')
+
+        if baseline:
+            self.stdout.write(self.style.SUCCESS(f'✓ Регресій понад {options["threshold"]:.0%} немає'))
+        else:
+            self.stdout.write('  Baseline ще немає - запустіть з --save')
+
+    def _load_baseline(self, path):
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Не вдалося прочитати baseline {path}: {str(e)}')
+
+    def _save_baseline(self, path, baseline, results):
+        # Часткові прогони (--only) оновлюють лише виміряні бенчмарки
+        merged = dict(baseline.get('results', {}))
+        merged.update(results)
+        data = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': platform.platform(),
+            'results': merged,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
@@ -0,0 +1,104 @@
+"""
+Django management command для build-кроку статичних асетів.
+Генерує похідні файли (адаптивні зображення, іконки, постери відео, WOFF2 шрифти, CSS/JS бандли)
+у ASSET_BUILD_STATIC_DIR, звідки їх забирає collectstatic.
+
+Використання:
+    python manage.py build_assets
+    python manage.py build_assets --only images --force
+"""
+
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.assets.bundles import build_bundles
+from pages.assets.fonts import build_font_subsets
+from pages.assets.icons import build_icons
+from pages.assets.images import build_responsive_images
+from pages.assets.vendor import build_vendor
+from pages.assets.video import build_video_posters
+
+
+def build_images(force):
+    manifest = build_responsive_images(
+        settings.ASSET_SOURCE_DIR,
+        settings.ASSET_BUILD_STATIC_DIR,
+        force=force,
+    )
+    return f'{len(manifest)} зображень'
+
+
+def build_site_icons(force):
+    manifest = build_icons(settings.ASSET_SOURCE_DIR, settings.ASSET_BUILD_STATIC_DIR, force=force)
+    if not manifest:
+        return f'{settings.ICON_SOURCE} не знайдено'
+    return ', '.join(f'{os.path.basename(name)} {size} байт' for name, size in manifest['sizes'].items())
+
+
+def build_posters(force):
+    manifest = build_video_posters(
+        settings.ASSET_SOURCE_DIR,
+        settings.ASSET_BUILD_STATIC_DIR,
+        force=force,
+    )
+    return f'{len(manifest)} постерів'
+
+
+def build_fonts(force):
+    manifest = build_font_subsets(settings.ASSET_SOURCE_DIR, settings.ASSET_BUILD_STATIC_DIR)
+    return ', '.join(
+        f"{family} {entry['source_size']} → {entry['size']} байт" for family, entry in manifest.items()
+    ) or 'немає шрифтів'
+
+
+def build_vendor_libs(force):
+    manifest = build_vendor(settings.ASSET_BUILD_STATIC_DIR, force=force)
+    return 'HTMX локально' if manifest else 'HTMX з CDN (завантаження не вдалося)'
+
+
+def build_css_js_bundles(force):
+    manifest = build_bundles(settings.ASSET_BUILD_STATIC_DIR)
+    return f'{len(manifest)} бандлів'
+
+
+# Порядок кроків важливий: пізніші кроки можуть використовувати результати ранніх
+STEPS = {
+    'images': build_images,
+    'icons': build_site_icons,
+    'posters': build_posters,
+    'fonts': build_fonts,
+    'vendor': build_vendor_libs,
+    # Бандли після images: base.css посилається на згенеровані варіанти
+    'bundles': build_css_js_bundles,
+}
+
+
+class Command(BaseCommand):
+    help = 'Генерує оптимізовані статичні асети перед collectstatic'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--only',
+            action='append',
+            choices=list(STEPS),
+            help='Виконати лише вказаний крок (можна повторювати)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Перегенерувати всі файли, навіть актуальні',
+        )
+
+    def handle(self, *args, **options):
+        selected = options['only'] or list(STEPS)
+
+        for name, step in STEPS.items():
+            if name not in selected:
+                continue
+            try:
+                summary = step(options['force'])
+            except Exception as e:
+                raise CommandError(f'Помилка build-кроку "{name}": {str(e)}')
+            self.stdout.write(self.style.SUCCESS(f'✓ {name}: {summary}'))
@@ -0,0 +1,49 @@
+"""
+Django management command для статистики кешу.
+Показує бекенд, таймаут та спільні для всіх воркерів лічильники
+влучань/промахів кожного аліасу CACHES (PolygraphNew.cache).
+
+Використання:
+    python manage.py cache_stats
+    python manage.py cache_stats --reset
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+
+from PolygraphNew.cache import CacheStatsMixin
+
+
+class Command(BaseCommand):
+    help = 'Статистика влучань/промахів аліасів кешу (спільна для всіх воркерів)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Обнулити лічильники після виводу',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'Бекенд: {settings.CACHE_BACKEND}')
+        self.stdout.write(f'{"Аліас":<12} {"таймаут":>9} {"hits":>9} {"misses":>9} {"hit ratio":>10}  location')
+        for alias, config in settings.CACHES.items():
+            cache = caches[alias]
+            if not isinstance(cache, CacheStatsMixin):
+                self.stdout.write(f'{alias:<12} {"":>9} {"-":>9} {"-":>9} {"-":>10}  {config.get("BACKEND")}')
+                continue
+            try:
+                stats = cache.stats()
+            except Exception as e:
+                raise CommandError(f'Кеш "{alias}" недоступний: {str(e)}')
+            ratio = f'{stats["hit_ratio"]:.1%}' if stats['hit_ratio'] is not None else '-'
+            self.stdout.write(
+                f'{alias:<12} {config.get("TIMEOUT", 300):>8}s {stats["hits"]:>9} {stats["misses"]:>9} {ratio:>10}  '
+                f'{config.get("LOCATION", "")}'
+            )
+            if options['reset']:
+                cache.reset_stats()
+
+        if options['reset']:
+            self.stdout.write(self.style.SUCCESS('✓ Лічильники обнулено'))
@@ -0,0 +1,274 @@
+"""
+Django management command для перевірки бюджету SQL запитів.
+Проходить усі маршрути pages/urls.py та сторінки адмінки заявок (changelist,
+changeform, actions) на тестовій БД з фікстурами, записує виконаний SQL
+і порівнює кількість запитів та сумарний час із query_budget.json.
+При перевищенні виводить запити з місцем виклику в коді.
+
+Використання:
+    python manage.py check_query_budget
+    python manage.py check_query_budget --update     # оновити бюджет після свідомої зміни
+"""
+
+import json
+import math
+import os
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.urls import reverse
+
+from pages.admin import LeadSubmissionAdmin
+from pages.models import LeadSubmission
+from pages.perf.endpoints import build_endpoints, signed_form_data
+from pages.perf.fake_telegram import FakeTelegramServer
+from pages.perf.sql import record_queries
+from pages.utils.sql_log import normalize_sql
+
+# Кількість заявок у фікстурах: N+1 у changelist стає помітним
+FIXTURE_LEADS = 60
+
+# Запити, що показуються при перевищенні бюджету
+MAX_REPORTED_QUERIES = 30
+
+# Токен стрічки змін для CRM на час перевірки
+API_TOKEN = 'budget-crm-token'
+
+
+@contextmanager
+def fake_telegram_env():
+    """Канал сповіщень Telegram працює з локальним фейковим API замість справжнього бота."""
+    overrides = {'TELEGRAM_BOT_TOKEN': 'budget-token', 'TELEGRAM_CHAT_ID': '100000001'}
+    with FakeTelegramServer() as fake:
+        overrides['TELEGRAM_API_URL'] = fake.url
+        previous = {name: os.environ.get(name) for name in [*overrides, 'TELEGRAM_CHAT_ID_2', 'TELEGRAM_CHAT_IDS']}
+        os.environ.update(overrides)
+        os.environ.pop('TELEGRAM_CHAT_ID_2', None)
+        os.environ.pop('TELEGRAM_CHAT_IDS', None)
+        try:
+            yield
+        finally:
+            for name, value in previous.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+def create_fixtures():
+    """Суперюзер та заявки всіх типів і статусів."""
+    form_types = [choice for choice, _ in LeadSubmission.FORM_TYPES]
+    statuses = [choice for choice, _ in LeadSubmission.STATUS_CHOICES]
+    LeadSubmission.objects.bulk_create([
+        LeadSubmission(
+            form_type=form_types[index % len(form_types)],
+            status=statuses[index % len(statuses)],
+            name=f'Клієнт {index}',
+            phone=f'+38067{index:07d}',
+            email=f'client{index}@example.com',
+            message='Повідомлення',
+            telegram_sent=index % 2 == 0,
+        )
+        for index in range(FIXTURE_LEADS)
+    ])
+    return get_user_model().objects.create_superuser('budget-admin', 'budget@example.com', 'budget-password')
+
+
+def build_admin_scenarios(lead):
+    """Сценарії адмінки заявок: changelist, пошук, фільтри, changeform, actions."""
+    changelist = reverse('admin:pages_leadsubmission_changelist')
+    change = reverse('admin:pages_leadsubmission_change', args=[lead.pk])
+    selected = list(LeadSubmission.objects.values_list('pk', flat=True)[:20])
+
+    scenarios = [
+        {'label': 'ADMIN changelist', 'method': 'GET', 'path': changelist, 'data': None},
+        {'label': 'ADMIN changelist ?q=', 'method': 'GET', 'path': f'{changelist}?q=Клієнт', 'data': None},
+        {'label': 'ADMIN changelist ?status=', 'method': 'GET', 'path': f'{changelist}?status__exact=new', 'data': None},
+        {'label': 'ADMIN add', 'method': 'GET', 'path': reverse('admin:pages_leadsubmission_add'), 'data': None},
+        {'label': 'ADMIN change', 'method': 'GET', 'path': change, 'data': None},
+        {'label': 'ADMIN change POST', 'method': 'POST', 'path': change, 'data': {
+            'form_type': lead.form_type,
+            'status': 'contacted',
+            'name': lead.name,
+            'phone': lead.phone,
+            'email': lead.email,
+            'contact': '',
+            'message': lead.message,
+            'telegram_sent': 'on',
+            'admin_notes': 'Перевірено',
+        }},
+    ]
+    for action in LeadSubmissionAdmin.actions:
+        scenarios.append({
+            'label': f'ADMIN action {action}',
+            'method': 'POST',
+            'path': changelist,
+            'data': {'action': action, '_selected_action': selected, 'index': 0, 'select_across': 0},
+        })
+    return scenarios
+
+
+def build_api_scenarios(client):
+    """Сценарії стрічки змін для CRM: перша сторінка, наступна за курсором, 304 за ETag."""
+    path = reverse('pages:lead_changes')
+    headers = {'Authorization': f'Bearer {API_TOKEN}'}
+    first = client.get(f'{path}?limit=20', HTTP_AUTHORIZATION=headers['Authorization'])
+    cursor = first.json()['next_cursor']
+    return [
+        {'label': 'API lead_changes', 'method': 'GET', 'path': f'{path}?limit=20', 'data': None, 'headers': headers},
+        {'label': 'API lead_changes ?cursor=', 'method': 'GET', 'path': f'{path}?limit=20&cursor={cursor}',
+         'data': None, 'headers': headers},
+        {'label': 'API lead_changes 304', 'method': 'GET', 'path': f'{path}?limit=20', 'data': None,
+         'headers': dict(headers, **{'If-None-Match': first['ETag']})},
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Перевіряє кількість та час SQL запитів кожного view і адмінки проти бюджету'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--budget',
+            default=settings.QUERY_BUDGET_PATH,
+            help='Шлях до файлу бюджету (за замовчуванням: QUERY_BUDGET_PATH)',
+        )
+        parser.add_argument(
+            '--update',
+            action='store_true',
+            help='Записати поточні значення як новий бюджет',
+        )
+
+    def handle(self, *args, **options):
+        budget = self._load_budget(options['budget'])
+
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'})
+        try:
+            with fake_telegram_env(), override_settings(CRM_FEED_TOKENS=[API_TOKEN], CRM_FEED_SETTLE_SECONDS=0):
+                measurements = self._measure()
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        if options['update']:
+            self._save_budget(options['budget'], measurements)
+            self.stdout.write(self.style.SUCCESS(f'✓ Бюджет оновлено: {options["budget"]} ({len(measurements)} сценаріїв)'))
+            return
+
+        failures = self._report(measurements, budget)
+        if failures:
+            raise CommandError(
+                f'Бюджет запитів перевищено у {len(failures)} сценаріях: {", ".join(failures)}. '
+                f'Якщо зміна свідома - запустіть з --update'
+            )
+        self.stdout.write(self.style.SUCCESS(f'✓ Усі {len(measurements)} сценаріїв у межах бюджету'))
+
+    def _measure(self):
+        admin_user = create_fixtures()
+        lead = LeadSubmission.objects.order_by('pk').first()
+
+        client = Client()
+        admin_client = Client()
+        admin_client.force_login(admin_user)
+
+        scenarios = [(client, endpoint) for endpoint in build_endpoints()]
+        scenarios += [(client, scenario) for scenario in build_api_scenarios(client)]
+        scenarios += [(admin_client, scenario) for scenario in build_admin_scenarios(lead)]
+
+        measurements = {}
+        for scenario_client, scenario in scenarios:
+            headers = {
+                f'HTTP_{name.upper().replace("-", "_")}': value
+                for name, value in scenario.get('headers', {}).items()
+            }
+            request = getattr(scenario_client, scenario['method'].lower())
+            # Перший прохід прогріває кеші (ContentType, сесія), вимірюється другий.
+            # Токен фільтра ботів одноразовий - кожна відправка форми отримує свій
+            url_name = scenario.get('url_name')
+            request(scenario['path'], signed_form_data(url_name, scenario['data']), **headers)
+            with record_queries() as recorder:
+                response = request(scenario['path'], signed_form_data(url_name, scenario['data']), **headers)
+            measurements[scenario['label']] = {
+                'status': response.status_code,
+                'recorder': recorder,
+            }
+        return measurements
+
+    def _report(self, measurements, budget):
+        failures = []
+        self.stdout.write(f'{"Сценарій":<48} {"запити":>12} {"SQL час":>16}')
+        for label, measurement in measurements.items():
+            recorder = measurement['recorder']
+            count = len(recorder.queries)
+            time_ms = 1000 * recorder.total_time
+            limits = budget.get(label)
+
+            # Зламаний сценарій (помилка форми, 404, 500) вимірює не той шлях коду
+            if measurement['status'] >= 400:
+                failures.append(label)
+                self.stdout.write(self.style.ERROR(f'{label:<48} HTTP {measurement["status"]}'))
+                continue
+
+            if not limits:
+                failures.append(label)
+                self.stdout.write(self.style.ERROR(f'{label:<48} {count:>5} / немає бюджету'))
+                continue
+
+            over = count > limits['queries'] or time_ms > limits['time_ms']
+            line = f'{label:<48} {count:>5} / {limits["queries"]:<4} {time_ms:>7.1f} / {limits["time_ms"]:<5}ms'
+            if not over:
+                self.stdout.write(line)
+                continue
+
+            failures.append(label)
+            self.stdout.write(self.style.ERROR(line))
+            self._print_queries(recorder)
+        return failures
+
+    def _print_queries(self, recorder):
+        duplicates = recorder.duplicates()
+        for sql, repeats in sorted(duplicates.items(), key=lambda item: -item[1]):
+            self.stdout.write(self.style.WARNING(f'    ×{repeats} (можливий N+1): {sql[:200]}'))
+
+        for query in recorder.queries[:MAX_REPORTED_QUERIES]:
+            repeats = duplicates.get(normalize_sql(query['sql']))
+            marker = f' ×{repeats}' if repeats else ''
+            self.stdout.write(f'    {1000 * query["duration"]:6.2f}ms{marker} {query["sql"][:200]}')
+            for frame in query['origin']:
+                self.stdout.write(f'        ↳ {frame}')
+        if len(recorder.queries) > MAX_REPORTED_QUERIES:
+            self.stdout.write(f'    ... ще {len(recorder.queries) - MAX_REPORTED_QUERIES} запитів')
+
+    def _load_budget(self, path):
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Не вдалося прочитати бюджет {path}: {str(e)}')
+
+    def _save_budget(self, path, measurements):
+        budget = {}
+        for label, measurement in measurements.items():
+            recorder = measurement['recorder']
+            # Кількість запитів детермінована - бюджет точний.
+            # Час залежить від машини, тому із запасом
+            time_ms = 1000 * recorder.total_time * settings.QUERY_BUDGET_TIME_FACTOR
+            budget[label] = {
+                'queries': len(recorder.queries),
+                'time_ms': max(math.ceil(time_ms), settings.QUERY_BUDGET_MIN_TIME_MS),
+            }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(budget, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
@@ -0,0 +1,199 @@
+"""
+Django management command для аудиту індексів таблиць застосунку pages.
+Показує кожен індекс з розміром, використанням (pg_stat_user_indexes на
+PostgreSQL) та умовою часткового індексу, позначає невикористані та
+надлишкові (колонки - префікс іншого індексу) і виводить плани типових
+запитів адмінки та черг заявок.
+
+Використання:
+    python manage.py index_audit
+    python manage.py index_audit --no-explain
+"""
+
+import re
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection
+
+from pages.models import LeadSubmission
+
+# Типові запити: список адмінки (з pk для стабільного порядку), фільтри,
+# черга нових заявок та повторної відправки в Telegram
+QUERY_PATTERNS = {
+    'admin: список': lambda: LeadSubmission.objects.order_by('-created_at', '-id')[:100],
+    'admin: фільтр status': lambda: LeadSubmission.objects.filter(status='contacted').order_by('-created_at', '-id')[:100],
+    'admin: фільтр form_type': lambda: LeadSubmission.objects.filter(form_type='corporate').order_by('-created_at', '-id')[:100],
+    'triage: нові заявки': lambda: LeadSubmission.objects.awaiting_triage().order_by('-created_at', '-id')[:100],
+    'triage: id нових': lambda: LeadSubmission.objects.awaiting_triage().values_list('id', flat=True),
+    'retry: не відправлені в Telegram': lambda: LeadSubmission.objects.pending_telegram().order_by('-created_at', '-id')[:50],
+    'health: розмір черги': lambda: LeadSubmission.objects.pending_telegram().values('id'),
+}
+
+WHERE_RE = re.compile(r'\bWHERE\b(.*)$', re.IGNORECASE | re.DOTALL)
+
+
+def _format_size(size):
+    if size is None:
+        return '-'
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.0f}{unit}'
+        size /= 1024
+    return f'{size:.1f}GB'
+
+
+class Command(BaseCommand):
+    help = 'Аудит індексів: розмір, використання, надлишкові індекси та плани типових запитів'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-explain',
+            action='store_true',
+            help='Не виводити плани типових запитів',
+        )
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        self.stdout.write(f'База даних: {vendor}')
+        if vendor == 'postgresql':
+            self._print_stats_reset()
+        else:
+            self.stdout.write('  Статистика використання індексів доступна лише на PostgreSQL')
+
+        tables = sorted({model._meta.db_table for model in apps.get_app_config('pages').get_models()})
+        for table in tables:
+            try:
+                self._audit_table(table, vendor)
+            except DatabaseError as e:
+                raise CommandError(f'Не вдалося прочитати індекси {table}: {str(e)}')
+
+        if not options['no_explain']:
+            self._explain_patterns()
+
+    def _print_stats_reset(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()')
+            row = cursor.fetchone()
+        since = row[0].strftime('%d.%m.%Y %H:%M') if row and row[0] else 'створення БД'
+        self.stdout.write(f'  Лічильники pg_stat_user_indexes з: {since}')
+
+    def _audit_table(self, table, vendor):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+        definitions = self._definitions(table, vendor)
+        usage = self._usage(table) if vendor == 'postgresql' else {}
+        sizes = self._sizes(table, vendor)
+
+        indexes = []
+        for name, info in constraints.items():
+            if not (info['index'] or info['primary_key'] or info['unique']) or not info['columns']:
+                continue
+            where = WHERE_RE.search(definitions.get(name, '') or '')
+            indexes.append({
+                'name': name,
+                'columns': info['columns'],
+                'unique': info['unique'] or info['primary_key'],
+                'condition': where.group(1).strip() if where else '',
+                'scans': usage.get(name),
+                'size': sizes.get(name),
+            })
+        indexes.sort(key=lambda index: index['name'])
+
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'✓ {table}: {len(indexes)} індексів'))
+        self._print_table_stats(table, vendor)
+        self.stdout.write(f'  {"Індекс":<44} {"розмір":>8} {"сканів":>9}  колонки / умова')
+        for index in indexes:
+            problems = self._problems(index, indexes, vendor)
+            scans = '-' if index['scans'] is None else index['scans']
+            columns = ', '.join(index['columns'])
+            if index['condition']:
+                columns += f'  WHERE {index["condition"]}'
+            line = f'  {index["name"]:<44} {_format_size(index["size"]):>8} {scans:>9}  {columns}'
+            self.stdout.write(self.style.WARNING(line) if problems else line)
+            for problem in problems:
+                self.stdout.write(self.style.WARNING(f'      ⚠ {problem}'))
+
+    def _problems(self, index, indexes, vendor):
+        problems = []
+        if index['unique'] or index['condition']:
+            return problems
+        for other in indexes:
+            if other is index or other['condition']:
+                continue
+            longer = len(other['columns']) > len(index['columns'])
+            if other['columns'][:len(index['columns'])] == index['columns'] and (longer or other['name'] < index['name']):
+                problems.append(f'надлишковий: колонки - префікс {other["name"]}')
+                break
+        if vendor == 'postgresql' and index['scans'] == 0:
+            problems.append('не використовувався жодного разу')
+        return problems
+
+    def _definitions(self, table, vendor):
+        """Назва індексу → SQL визначення (для умови часткового індексу)."""
+        with connection.cursor() as cursor:
+            if vendor == 'postgresql':
+                cursor.execute('SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s', [table])
+            elif vendor == 'sqlite':
+                cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = %s", [table])
+            else:
+                return {}
+            return dict(cursor.fetchall())
+
+    def _usage(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT indexrelname, idx_scan FROM pg_stat_user_indexes WHERE relname = %s',
+                [table],
+            )
+            return dict(cursor.fetchall())
+
+    def _sizes(self, table, vendor):
+        with connection.cursor() as cursor:
+            if vendor == 'postgresql':
+                cursor.execute(
+                    'SELECT indexrelname, pg_relation_size(indexrelid) FROM pg_stat_user_indexes WHERE relname = %s',
+                    [table],
+                )
+                return dict(cursor.fetchall())
+            if vendor == 'sqlite':
+                # dbstat є не в кожній збірці SQLite
+                try:
+                    cursor.execute('SELECT name, SUM(pgsize) FROM dbstat GROUP BY name')
+                    return dict(cursor.fetchall())
+                except DatabaseError:
+                    return {}
+        return {}
+
+    def _print_table_stats(self, table, vendor):
+        if vendor != 'postgresql':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT n_live_tup, n_tup_ins, n_tup_upd, seq_scan, idx_scan, '
+                'pg_relation_size(relid), pg_indexes_size(relid) '
+                'FROM pg_stat_user_tables WHERE relname = %s',
+                [table],
+            )
+            row = cursor.fetchone()
+        if not row:
+            return
+        rows, inserts, updates, seq_scans, idx_scans, table_size, indexes_size = row
+        self.stdout.write(
+            f'  рядків {rows}, вставок {inserts}, оновлень {updates}, '
+            f'seq scan {seq_scans}, index scan {idx_scans or 0}; '
+            f'таблиця {_format_size(table_size)}, індекси {_format_size(indexes_size)}'
+        )
+
+    def _explain_patterns(self):
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS('✓ Плани типових запитів'))
+        for label, build in QUERY_PATTERNS.items():
+            try:
+                plan = build().explain()
+            except DatabaseError as e:
+                raise CommandError(f'EXPLAIN "{label}" не вдався: {str(e)}')
+            self.stdout.write(f'  {label}')
+            for line in plan.splitlines():
+                self.stdout.write(f'      {line}')
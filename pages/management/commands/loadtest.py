@@ -0,0 +1,191 @@
+"""
+Django management command для навантажувального тестування.
+Запускає фейковий Telegram Bot API та gunicorn (як на Render), направляє
+сповіщення Telegram на фейковий API і паралельно надсилає GET та POST
+форм на всі маршрути pages/urls.py. Звітує throughput та p50/p95/p99.
+
+Використання:
+    python manage.py loadtest
+    python manage.py loadtest --duration 30 --concurrency 32 --telegram-latency 2
+    python manage.py loadtest --telegram-rate-limit 5 --telegram-error-rate 0.1
+    python manage.py loadtest --target http://127.0.0.1:8000   # вже запущений сервер
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.models import LeadSubmission
+from pages.perf.endpoints import build_endpoints, signed_form_data
+from pages.perf.fake_telegram import FakeTelegramServer
+from pages.perf.server import (
+    LOADTEST_USER_AGENT,
+    csrf_headers,
+    start_gunicorn,
+    stop_server,
+    wait_ready,
+)
+from pages.perf.stats import summarize
+
+
+class Command(BaseCommand):
+    help = 'Навантажувальний тест усіх маршрутів з фейковим Telegram API'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--duration', type=float, default=20, help='Тривалість вимірювання, секунд (за замовчуванням: 20)')
+        parser.add_argument('--concurrency', type=int, default=16, help='Кількість паралельних клієнтів (за замовчуванням: 16)')
+        parser.add_argument('--workers', type=int, default=4, help='Воркери gunicorn (за замовчуванням: 4, як WEB_CONCURRENCY на Render)')
+        parser.add_argument('--threads', type=int, default=1, help='Потоки на воркер gunicorn (>1 - gthread)')
+        parser.add_argument('--target', help='URL вже запущеного сервера (gunicorn не запускається)')
+        parser.add_argument('--host-header', default='localhost', help='Заголовок Host (має бути в ALLOWED_HOSTS)')
+        parser.add_argument('--telegram-latency', type=float, default=0.2, help='Затримка фейкового Telegram, секунд')
+        parser.add_argument('--telegram-jitter', type=float, default=0.1, help='Випадкова додаткова затримка Telegram, секунд')
+        parser.add_argument('--telegram-error-rate', type=float, default=0.0, help='Частка відповідей 500 від Telegram (0..1)')
+        parser.add_argument('--telegram-rate-limit', type=int, default=0, help='Запитів/с до Telegram, понад ліміт - 429 (0 = без ліміту)')
+        parser.add_argument('--telegram-retry-after', type=int, default=1, help='retry_after у відповіді 429')
+        parser.add_argument('--json', dest='json_path', help='Зберегти результати у JSON файл')
+        parser.add_argument('--keep-leads', action='store_true', help='Не видаляти заявки, створені тестом')
+
+    def handle(self, *args, **options):
+        endpoints = build_endpoints()
+        if not endpoints:
+            raise CommandError('Не знайдено жодного маршруту для тестування')
+
+        fake = FakeTelegramServer(
+            latency=options['telegram_latency'],
+            jitter=options['telegram_jitter'],
+            error_rate=options['telegram_error_rate'],
+            rate_limit=options['telegram_rate_limit'],
+            retry_after=options['telegram_retry_after'],
+        ).start()
+        self.stdout.write(self.style.SUCCESS(f'✓ Фейковий Telegram API: {fake.url}'))
+
+        server = None
+        try:
+            if options['target']:
+                base_url = options['target'].rstrip('/')
+                self.stdout.write(
+                    f'  Сервер {base_url} має бути запущений з TELEGRAM_API_URL={fake.url}, '
+                    f'TELEGRAM_BOT_TOKEN та TELEGRAM_CHAT_ID'
+                )
+            else:
+                server, base_url = start_gunicorn(fake.url, options['workers'], options['threads'])
+                self.stdout.write(self.style.SUCCESS(
+                    f'✓ gunicorn: {options["workers"]} воркерів × {options["threads"]} потоків ({base_url})'
+                ))
+
+            wait_ready(base_url, options['host_header'])
+            results, elapsed = self._run(base_url, endpoints, options)
+        finally:
+            if server:
+                stop_server(server)
+            fake.stop()
+
+        report = self._report(results, elapsed, fake.stats)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'✓ Результати збережено: {options["json_path"]}'))
+
+        if not options['keep_leads']:
+            deleted, _ = LeadSubmission.objects.filter(user_agent=LOADTEST_USER_AGENT).delete()
+            self.stdout.write(f'  Видалено тестових заявок: {deleted}')
+
+    def _run(self, base_url, endpoints, options):
+        host_header = options['host_header']
+        base_headers = {'Host': host_header, 'User-Agent': LOADTEST_USER_AGENT}
+        post_headers = csrf_headers(base_url, host_header)
+
+        schedule = itertools.cycle(endpoints)
+        schedule_lock = threading.Lock()
+        results = defaultdict(lambda: {'durations': [], 'errors': 0, 'statuses': defaultdict(int)})
+        results_lock = threading.Lock()
+        deadline = time.monotonic() + options['duration']
+
+        def worker():
+            session = requests.Session()
+            while time.monotonic() < deadline:
+                with schedule_lock:
+                    endpoint = next(schedule)
+                headers = dict(base_headers, **endpoint['headers'])
+                if endpoint['method'] == 'POST':
+                    headers.update(post_headers)
+
+                started = time.perf_counter()
+                try:
+                    response = session.request(
+                        endpoint['method'],
+                        base_url + endpoint['path'],
+                        # Токен підписується SECRET_KEY цих налаштувань - як у сервера, що тестується
+                        data=signed_form_data(endpoint['url_name'], endpoint['data']),
+                        headers=headers,
+                        allow_redirects=False,
+                        timeout=60,
+                    )
+                    status = response.status_code
+                except requests.exceptions.RequestException:
+                    status = 'error'
+                duration = time.perf_counter() - started
+
+                with results_lock:
+                    entry = results[endpoint['label']]
+                    entry['durations'].append(duration)
+                    entry['statuses'][status] += 1
+                    if status == 'error' or status >= 400:
+                        entry['errors'] += 1
+
+        self.stdout.write(
+            f'  {len(endpoints)} сценаріїв, {options["concurrency"]} клієнтів, {options["duration"]:.0f} с...'
+        )
+        started = time.monotonic()
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(options['concurrency'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, time.monotonic() - started
+
+    def _report(self, results, elapsed, telegram_stats):
+        rows = []
+        total = 0
+        for label in sorted(results):
+            entry = results[label]
+            summary = summarize(entry['durations'])
+            total += summary['count']
+            rows.append({
+                'endpoint': label,
+                'rps': summary['count'] / elapsed,
+                'errors': entry['errors'],
+                'statuses': {str(status): count for status, count in entry['statuses'].items()},
+                **summary,
+            })
+
+        self.stdout.write('')
+        self.stdout.write(
+            f'{"Endpoint":<42} {"req":>6} {"rps":>7} {"err":>5} {"p50":>8} {"p95":>8} {"p99":>8} {"max":>8}'
+        )
+        for row in rows:
+            line = (
+                f'{row["endpoint"][:42]:<42} {row["count"]:>6} {row["rps"]:>7.1f} {row["errors"]:>5} '
+                f'{row["p50_ms"]:>6.0f}ms {row["p95_ms"]:>6.0f}ms {row["p99_ms"]:>6.0f}ms {row["max_ms"]:>6.0f}ms'
+            )
+            self.stdout.write(self.style.ERROR(line) if row['errors'] else line)
+
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'✓ Всього: {total} запитів за {elapsed:.1f} с ({total / elapsed:.1f} req/s)'))
+        self.stdout.write(
+            f'  Telegram: {telegram_stats["messages"]} повідомлень, '
+            f'{telegram_stats["rate_limited"]} × 429, {telegram_stats["errors"]} × 500'
+        )
+        return {
+            'elapsed_s': elapsed,
+            'total_requests': total,
+            'rps': total / elapsed,
+            'endpoints': rows,
+            'telegram': dict(telegram_stats),
+        }
@@ -0,0 +1,267 @@
+"""
+Django management command для відтворення production трафіку.
+Розбирає логи DiagnosticMiddleware (структурований access log або старі рядки
+'Request Host header: ..., Path: ...') у навантаження і відтворює його на
+локальному gunicorn з фейковим Telegram API - з оригінальною, масштабованою
+або максимальною швидкістю. Звітує розподіл затримок та помилки по маршрутах.
+
+Використання:
+    python manage.py replay_log render.log
+    python manage.py replay_log render.log --speed 10          # у 10 разів швидше
+    python manage.py replay_log render.log --speed max --concurrency 32
+    cat render.log | python manage.py replay_log - --target http://127.0.0.1:8000
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import Resolver404, resolve
+
+from pages.models import LeadSubmission
+from pages.perf.endpoints import form_payloads, signed_form_data
+from pages.perf.fake_telegram import FakeTelegramServer
+from pages.perf.replay import load_workload, read_log_lines, route_label
+from pages.perf.server import (
+    LOADTEST_USER_AGENT,
+    csrf_headers,
+    start_gunicorn,
+    stop_server,
+    wait_ready,
+)
+from pages.perf.stats import summarize
+
+
+def _speed(value):
+    if value == 'max':
+        return None
+    try:
+        speed = float(value)
+    except ValueError:
+        raise CommandError(f'--speed: очікується число або "max", отримано "{value}"')
+    if speed <= 0:
+        raise CommandError('--speed має бути більше 0')
+    return speed
+
+
+class Command(BaseCommand):
+    help = 'Відтворює production трафік з логів на локальному сервері'
+
+    def add_arguments(self, parser):
+        parser.add_argument('logs', nargs='+', help='Файли логів (- для stdin)')
+        parser.add_argument(
+            '--speed',
+            default='1',
+            help='Швидкість: 1 - оригінальна, 10 - у 10 разів швидше, max - без пауз (за замовчуванням: 1)',
+        )
+        parser.add_argument('--concurrency', type=int, default=32, help='Максимум одночасних запитів (за замовчуванням: 32)')
+        parser.add_argument('--limit', type=int, help='Відтворити лише перші N запитів')
+        parser.add_argument('--exclude', action='append', default=[], help='Пропускати шляхи з цим префіксом; можна повторювати')
+        parser.add_argument('--workers', type=int, default=4, help='Воркери gunicorn (за замовчуванням: 4)')
+        parser.add_argument('--threads', type=int, default=1, help='Потоки на воркер gunicorn (>1 - gthread)')
+        parser.add_argument('--target', help='URL вже запущеного сервера (gunicorn не запускається)')
+        parser.add_argument('--host-header', default='localhost', help='Заголовок Host (має бути в ALLOWED_HOSTS)')
+        parser.add_argument('--telegram-latency', type=float, default=0.2, help='Затримка фейкового Telegram, секунд')
+        parser.add_argument('--json', dest='json_path', help='Зберегти результати у JSON файл')
+        parser.add_argument('--keep-leads', action='store_true', help='Не видаляти заявки, створені відтворенням')
+
+    def handle(self, *args, **options):
+        speed = _speed(options['speed'])
+        workload = [
+            entry for entry in load_workload(read_log_lines(options['logs']))
+            if not entry['path'].startswith(tuple(options['exclude']))
+        ]
+        if options['limit']:
+            workload = workload[:options['limit']]
+        if not workload:
+            raise CommandError('У логах не знайдено жодного запиту')
+
+        if speed and any(entry['ts'] is None for entry in workload):
+            self.stdout.write(self.style.WARNING('  Не всі рядки мають час - відтворення з максимальною швидкістю'))
+            speed = None
+
+        requests_plan, skipped = self._plan(workload)
+        span = workload[-1]['ts'] - workload[0]['ts'] if speed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Навантаження: {len(requests_plan)} запитів'
+            + (f' за {span:.0f} с оригінального часу' if speed else '')
+            + (f', пропущено {skipped} POST без відомої форми' if skipped else '')
+        ))
+
+        fake = FakeTelegramServer(latency=options['telegram_latency']).start()
+        server = None
+        try:
+            if options['target']:
+                base_url = options['target'].rstrip('/')
+            else:
+                server, base_url = start_gunicorn(fake.url, options['workers'], options['threads'])
+                self.stdout.write(self.style.SUCCESS(
+                    f'✓ gunicorn: {options["workers"]} воркерів × {options["threads"]} потоків ({base_url})'
+                ))
+            wait_ready(base_url, options['host_header'])
+            results, lags, elapsed = self._replay(base_url, requests_plan, speed, options)
+        finally:
+            if server:
+                stop_server(server)
+            fake.stop()
+
+        report = self._report(results, lags, elapsed, speed)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'✓ Результати збережено: {options["json_path"]}'))
+
+        if not options['keep_leads']:
+            deleted, _ = LeadSubmission.objects.filter(user_agent=LOADTEST_USER_AGENT).delete()
+            self.stdout.write(f'  Видалено тестових заявок: {deleted}')
+
+    def _plan(self, workload):
+        """Записи логу → запити. POST отримують валідні дані форми свого маршруту."""
+        payloads = form_payloads()
+        start = workload[0]['ts'] or 0
+        plan = []
+        skipped = 0
+        for entry in workload:
+            data = None
+            url_name = None
+            if entry['method'] == 'POST':
+                try:
+                    url_name = resolve(entry['path'].split('?', 1)[0]).url_name
+                except Resolver404:
+                    url_name = None
+                if url_name not in payloads:
+                    skipped += 1
+                    continue
+                data = payloads[url_name][0]
+            plan.append({
+                'offset': (entry['ts'] or start) - start,
+                'method': entry['method'],
+                'path': entry['path'],
+                'url_name': url_name,
+                'data': data,
+                'headers': {'HX-Request': 'true'} if entry['htmx'] else {},
+                'label': route_label(entry['method'], entry['path']),
+                'original_ms': entry['duration_ms'],
+            })
+        return plan, skipped
+
+    def _replay(self, base_url, plan, speed, options):
+        host_header = options['host_header']
+        base_headers = {'Host': host_header, 'User-Agent': LOADTEST_USER_AGENT}
+        post_headers = csrf_headers(base_url, host_header) if any(item['data'] for item in plan) else {}
+
+        results = defaultdict(lambda: {'durations': [], 'original': [], 'errors': 0, 'statuses': defaultdict(int)})
+        results_lock = threading.Lock()
+        local = threading.local()
+
+        def send(item):
+            session = getattr(local, 'session', None)
+            if session is None:
+                session = local.session = requests.Session()
+            headers = dict(base_headers, **item['headers'])
+            if item['method'] == 'POST':
+                headers.update(post_headers)
+
+            started = time.perf_counter()
+            try:
+                response = session.request(
+                    item['method'],
+                    base_url + item['path'],
+                    data=signed_form_data(item['url_name'], item['data']),
+                    headers=headers,
+                    allow_redirects=False,
+                    timeout=60,
+                )
+                status = response.status_code
+            except requests.exceptions.RequestException:
+                status = 'error'
+            duration = time.perf_counter() - started
+
+            with results_lock:
+                entry = results[item['label']]
+                entry['durations'].append(duration)
+                entry['statuses'][status] += 1
+                if item['original_ms'] is not None:
+                    entry['original'].append(item['original_ms'] / 1000)
+                if status == 'error' or status >= 500:
+                    entry['errors'] += 1
+
+        # Відставання від розкладу: сервер або клієнт не встигають за оригінальним темпом
+        lags = []
+        mode = 'максимальна швидкість' if speed is None else f'швидкість ×{speed:g}'
+        self.stdout.write(f'  Відтворення: {mode}, до {options["concurrency"]} одночасних запитів...')
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            if speed is None:
+                list(executor.map(send, plan))
+            else:
+                slots = threading.BoundedSemaphore(options['concurrency'])
+
+                def run(item):
+                    try:
+                        send(item)
+                    finally:
+                        slots.release()
+
+                for item in plan:
+                    due = started + item['offset'] / speed
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    slots.acquire()
+                    lags.append(max(time.monotonic() - due, 0.0))
+                    executor.submit(run, item)
+        return results, lags, time.monotonic() - started
+
+    def _report(self, results, lags, elapsed, speed):
+        rows = []
+        total = 0
+        errors = 0
+        for label in sorted(results, key=lambda name: -len(results[name]['durations'])):
+            entry = results[label]
+            summary = summarize(entry['durations'])
+            original = summarize(entry['original']) if entry['original'] else None
+            total += summary['count']
+            errors += entry['errors']
+            rows.append({
+                'route': label,
+                'errors': entry['errors'],
+                'statuses': {str(status): count for status, count in entry['statuses'].items()},
+                'original_p95_ms': original['p95_ms'] if original else None,
+                **summary,
+            })
+
+        self.stdout.write('')
+        self.stdout.write(
+            f'{"Маршрут":<40} {"req":>6} {"5xx":>5} {"p50":>8} {"p95":>8} {"p99":>8} {"max":>8} {"prod p95":>9}'
+        )
+        for row in rows:
+            original = f'{row["original_p95_ms"]:>7.0f}ms' if row['original_p95_ms'] is not None else f'{"-":>9}'
+            line = (
+                f'{row["route"][:40]:<40} {row["count"]:>6} {row["errors"]:>5} '
+                f'{row["p50_ms"]:>6.0f}ms {row["p95_ms"]:>6.0f}ms {row["p99_ms"]:>6.0f}ms {row["max_ms"]:>6.0f}ms {original}'
+            )
+            self.stdout.write(self.style.ERROR(line) if row['errors'] else line)
+            other = {status: count for status, count in row['statuses'].items() if status not in ('200', '206', '304')}
+            if other:
+                self.stdout.write(f'    статуси: {", ".join(f"{status} ×{count}" for status, count in sorted(other.items()))}')
+
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'✓ Всього: {total} запитів за {elapsed:.1f} с ({total / elapsed:.1f} req/s)'))
+        lag = summarize(lags)
+        if speed is not None:
+            self.stdout.write(f'  Відставання від розкладу: p95 {lag["p95_ms"]:.0f}ms, max {lag["max_ms"]:.0f}ms')
+        if errors:
+            self.stdout.write(self.style.ERROR(f'  Помилок (5xx та з\'єднання): {errors}'))
+        return {
+            'elapsed_s': elapsed,
+            'total_requests': total,
+            'rps': total / elapsed,
+            'speed': speed or 'max',
+            'schedule_lag': lag if speed is not None else None,
+            'routes': rows,
+        }
@@ -0,0 +1,63 @@
+"""
+Django management command для повторної відправки сповіщень про заявки,
+що не дійшли в жоден канал (LeadSubmission.objects.pending_telegram()).
+Черга читається частковим індексом pages_lead_unsent_idx: його розмір -
+лише невідправлені заявки, а не вся таблиця.
+
+Використання:
+    python manage.py retry_notifications
+    python manage.py retry_notifications --limit 20 --max-age 24
+    python manage.py retry_notifications --dry-run
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from pages.models import LeadSubmission
+from pages.utils.notifications import notify_lead
+
+
+class Command(BaseCommand):
+    help = 'Повторна відправка сповіщень про заявки, що не дійшли в жоден канал'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=50, help='Максимум заявок за запуск (за замовчуванням: 50)')
+        parser.add_argument(
+            '--max-age',
+            type=float,
+            default=72,
+            help='Лише заявки, молодші за стільки годин (за замовчуванням: 72)',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Лише показати заявки, без відправки')
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(hours=options['max_age'])
+        # Порядок збігається з індексом (-created_at, -id): спершу найсвіжіші заявки
+        leads = list(
+            LeadSubmission.objects.pending_telegram()
+            .filter(created_at__gte=since)
+            .order_by('-created_at', '-id')[:options['limit']]
+        )
+        if not leads:
+            self.stdout.write(self.style.SUCCESS('✓ Невідправлених заявок немає'))
+            return
+
+        sent = 0
+        for lead in leads:
+            if options['dry_run']:
+                self.stdout.write(f'  #{lead.pk} {lead.get_form_type_display()} {lead.created_at:%d.%m.%Y %H:%M}')
+                continue
+            if notify_lead(lead):
+                sent += 1
+                self.stdout.write(f'  #{lead.pk}: відправлено')
+            else:
+                self.stdout.write(self.style.WARNING(f'  #{lead.pk}: канали недоступні, заявка лишається в черзі'))
+
+        if options['dry_run']:
+            self.stdout.write(f'Заявок у черзі: {len(leads)}')
+        elif sent == len(leads):
+            self.stdout.write(self.style.SUCCESS(f'✓ Відправлено {sent} з {len(leads)}'))
+        else:
+            self.stdout.write(self.style.WARNING(f'Відправлено {sent} з {len(leads)}'))
@@ -0,0 +1,99 @@
+"""
+Django management command для звіту по повільних SQL запитах.
+Читає рядки 'slow_query {...}' (SlowQueryLogMiddleware) з логів Render,
+групує за нормалізованим SQL та місцем виклику і виводить top-N.
+
+Використання:
+    python manage.py slow_queries render.log
+    python manage.py slow_queries render.log --top 10 --sort max
+    cat render.log | python manage.py slow_queries - --json slow.json
+"""
+
+import json
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.perf.replay import parse_json_line, read_log_lines
+from pages.utils.sql_log import SLOW_QUERY_LOG_PREFIX
+from pages.perf.stats import summarize
+
+SORT_KEYS = {
+    'total': 'total_ms',
+    'count': 'count',
+    'mean': 'mean_ms',
+    'p95': 'p95_ms',
+    'max': 'max_ms',
+}
+
+
+class Command(BaseCommand):
+    help = 'Top-N повільних SQL запитів з логів, згрупованих за SQL та місцем виклику'
+
+    def add_arguments(self, parser):
+        parser.add_argument('logs', nargs='+', help='Файли логів (- для stdin)')
+        parser.add_argument('--top', type=int, default=20, help='Кількість груп у звіті (за замовчуванням: 20)')
+        parser.add_argument(
+            '--sort',
+            choices=sorted(SORT_KEYS),
+            default='total',
+            help='Сортування: сумарний час (за замовчуванням), кількість, середнє, p95, максимум',
+        )
+        parser.add_argument('--path', help='Лише запити з HTTP шляхів з цим префіксом')
+        parser.add_argument('--json', dest='json_path', help='Зберегти звіт у JSON файл')
+
+    def handle(self, *args, **options):
+        groups = defaultdict(lambda: {'durations': [], 'paths': defaultdict(int), 'params': 0})
+        for line in read_log_lines(options['logs']):
+            entry = parse_json_line(line, SLOW_QUERY_LOG_PREFIX)
+            if not entry or 'sql' not in entry:
+                continue
+            path = entry.get('path') or ''
+            if options['path'] and not path.startswith(options['path']):
+                continue
+            origin = entry.get('origin') or []
+            group = groups[(entry['sql'], tuple(origin))]
+            group['durations'].append(entry.get('duration_ms', 0) / 1000)
+            group['paths'][path] += 1
+            group['params'] = max(group['params'], entry.get('params', 0))
+
+        if not groups:
+            raise CommandError('У логах немає рядків slow_query (перевірте SLOW_QUERY_THRESHOLD_MS)')
+
+        rows = []
+        for (sql, origin), group in groups.items():
+            summary = summarize(group['durations'])
+            rows.append({
+                'sql': sql,
+                'origin': list(origin),
+                'params': group['params'],
+                'total_ms': sum(group['durations']) * 1000,
+                'paths': dict(sorted(group['paths'].items(), key=lambda item: -item[1])),
+                **summary,
+            })
+        rows.sort(key=lambda row: -row[SORT_KEYS[options['sort']]])
+        top = rows[:options['top']]
+
+        total_queries = sum(row['count'] for row in rows)
+        self.stdout.write(f'{"total":>10} {"count":>6} {"mean":>8} {"p95":>8} {"max":>8}  місце виклику / SQL')
+        for row in top:
+            self.stdout.write(
+                f'{row["total_ms"]:>8.0f}ms {row["count"]:>6} {row["mean_ms"]:>6.0f}ms '
+                f'{row["p95_ms"]:>6.0f}ms {row["max_ms"]:>6.0f}ms  '
+                + self.style.WARNING(row['origin'][0] if row['origin'] else '(невідомо)')
+            )
+            for frame in row['origin'][1:]:
+                self.stdout.write(f'{"":>45}↳ {frame}')
+            self.stdout.write(f'{"":>45}{row["sql"][:300]}')
+            paths = ', '.join(f'{path or "-"} ×{count}' for path, count in list(row['paths'].items())[:3])
+            self.stdout.write(f'{"":>45}параметрів: {row["params"]}; шляхи: {paths}')
+
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ {total_queries} повільних запитів у {len(rows)} групах, показано {len(top)}'
+        ))
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(top, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'✓ Звіт збережено: {options["json_path"]}'))
@@ -0,0 +1,172 @@
+"""
+Django management command для стрес-тесту конкурентного запису в SQLite.
+Кілька процесів (як воркери gunicorn) одночасно пишуть заявки в окрему
+тимчасову БД: відправка форми (INSERT + позначка сповіщення) та зміна
+статусу в адмінці (atomic: читання, потім запис). Порівнює профіль
+PolygraphNew.sqlite3 (WAL, IMMEDIATE) зі стандартним rollback journal
+і завершується помилкою, якщо з профілем були "database is locked".
+
+Використання:
+    python manage.py sqlite_stress
+    python manage.py sqlite_stress --workers 8 --requests 500 --profile wal
+"""
+
+import multiprocessing
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from pages.models import LeadSubmission
+from pages.perf.stats import summarize
+
+# Налаштування профілів на час тесту: 'default' - як стандартний backend Django
+PROFILES = {
+    'wal': {},
+    'default': {
+        'SQLITE_PRAGMAS': {'journal_mode': 'DELETE'},
+        'SQLITE_IMMEDIATE_TRANSACTIONS': False,
+    },
+}
+
+SEED_LEADS = 50
+
+
+def _submit_form(index, number):
+    """Як відправка форми: INSERT заявки, потім позначка про сповіщення."""
+    lead = LeadSubmission.objects.create(
+        form_type='cta',
+        name=f'Стрес-тест {index}-{number}',
+        phone='+380671234567',
+        user_agent='sqlite-stress',
+    )
+    lead.telegram_sent = True
+    lead.telegram_sent_at = timezone.now()
+    lead.save(update_fields=['telegram_sent', 'telegram_sent_at', 'updated_at'])
+
+
+def _change_status(index, number):
+    """Як зміна в адмінці: atomic з читанням і наступним записом (підвищення блокування)."""
+    with transaction.atomic():
+        lead = LeadSubmission.objects.awaiting_triage().order_by('-created_at', '-id').first()
+        if lead is None:
+            lead = LeadSubmission.objects.order_by('?').first()
+        lead.status = 'contacted' if lead.status == 'new' else 'new'
+        lead.save(update_fields=['status', 'updated_at'])
+
+
+OPERATIONS = (_submit_form, _change_status)
+
+
+def _worker(index, requests, overrides, start, results):
+    with override_settings(**overrides):
+        start.wait()
+        durations = []
+        lock_errors = 0
+        other_errors = []
+        for number in range(requests):
+            operation = OPERATIONS[number % len(OPERATIONS)]
+            started = time.perf_counter()
+            try:
+                operation(index, number)
+            except OperationalError as e:
+                if 'locked' in str(e) or 'busy' in str(e):
+                    lock_errors += 1
+                else:
+                    other_errors.append(str(e))
+            durations.append(time.perf_counter() - started)
+        connections.close_all()
+    results.put({'durations': durations, 'lock_errors': lock_errors, 'other_errors': other_errors})
+
+
+class Command(BaseCommand):
+    help = 'Стрес-тест конкурентного запису заявок у SQLite кількома процесами'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Кількість процесів (за замовчуванням: 4)')
+        parser.add_argument('--requests', type=int, default=200, help='Операцій на процес (за замовчуванням: 200)')
+        parser.add_argument(
+            '--profile',
+            choices=['both', *PROFILES],
+            default='both',
+            help='wal - профіль PolygraphNew.sqlite3, default - стандартний backend, both - порівняння',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError(f'Тест лише для SQLite, поточна БД: {connection.vendor}')
+
+        profiles = list(PROFILES) if options['profile'] == 'both' else [options['profile']]
+        reports = {profile: self._run(profile, options['workers'], options['requests']) for profile in profiles}
+
+        self.stdout.write('')
+        self.stdout.write(f'{"Профіль":<10} {"операцій":>9} {"оп/с":>8} {"locked":>7} {"p50":>8} {"p95":>8} {"max":>8}')
+        for profile, report in reports.items():
+            line = (
+                f'{profile:<10} {report["count"]:>9} {report["ops"]:>8.0f} {report["lock_errors"]:>7} '
+                f'{report["p50_ms"]:>6.1f}ms {report["p95_ms"]:>6.1f}ms {report["max_ms"]:>6.0f}ms'
+            )
+            self.stdout.write(self.style.ERROR(line) if report['lock_errors'] else line)
+            for error in report['other_errors'][:5]:
+                self.stdout.write(self.style.ERROR(f'    {error}'))
+
+        wal = reports.get('wal')
+        if wal and (wal['lock_errors'] or wal['other_errors']):
+            raise CommandError(
+                f'Профіль wal: {wal["lock_errors"]} помилок блокування, {len(wal["other_errors"])} інших помилок'
+            )
+        if wal:
+            self.stdout.write(self.style.SUCCESS('✓ Профіль wal: жодної помилки "database is locked"'))
+
+    def _run(self, profile, workers, requests):
+        """Один прогін у свіжій БД; повертає підсумок затримок та помилок."""
+        overrides = PROFILES[profile]
+        directory = tempfile.mkdtemp(prefix='sqlite-stress-')
+        original_name = connection.settings_dict['NAME']
+        connections.close_all()
+        connection.settings_dict['NAME'] = str(Path(directory) / 'stress.sqlite3')
+        try:
+            with override_settings(**overrides):
+                call_command('migrate', verbosity=0, interactive=False)
+                LeadSubmission.objects.bulk_create([
+                    LeadSubmission(form_type='cta', name=f'Заявка {index}', user_agent='sqlite-stress')
+                    for index in range(SEED_LEADS)
+                ])
+                connections.close_all()
+
+            # fork: дочірні процеси успадковують налаштування та змінену БД, з'єднання закриті
+            context = multiprocessing.get_context('fork')
+            start = context.Event()
+            results = context.Queue()
+            processes = [
+                context.Process(target=_worker, args=(index, requests, overrides, start, results))
+                for index in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            self.stdout.write(f'  {profile}: {workers} процесів × {requests} операцій...')
+            started = time.monotonic()
+            start.set()
+            collected = [results.get() for _ in processes]
+            elapsed = time.monotonic() - started
+            for process in processes:
+                process.join()
+        finally:
+            connections.close_all()
+            connection.settings_dict['NAME'] = original_name
+            shutil.rmtree(directory, ignore_errors=True)
+
+        durations = [duration for result in collected for duration in result['durations']]
+        summary = summarize(durations)
+        return {
+            **summary,
+            'ops': summary['count'] / elapsed,
+            'lock_errors': sum(result['lock_errors'] for result in collected),
+            'other_errors': [error for result in collected for error in result['other_errors']],
+        }
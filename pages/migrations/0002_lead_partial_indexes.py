@@ -0,0 +1,64 @@
+# Generated by Django 4.2.30 on 2026-10-19 19:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='leadsubmission',
+            name='pages_leads_created_f15cbd_idx',
+        ),
+        migrations.AlterField(
+            model_name='leadsubmission',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, help_text='Дата та час отримання заявки'),
+        ),
+        migrations.AlterField(
+            model_name='leadsubmission',
+            name='email',
+            field=models.EmailField(blank=True, help_text='Email адреса', max_length=254),
+        ),
+        migrations.AlterField(
+            model_name='leadsubmission',
+            name='form_type',
+            field=models.CharField(choices=[('corporate', 'Корпоративні послуги'), ('infidelity', 'Перевірка на зраду'), ('cta', 'CTA заявка'), ('consultation', 'Консультація')], help_text='Тип форми, з якої надійшла заявка', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='leadsubmission',
+            name='name',
+            field=models.CharField(help_text="Ім'я клієнта", max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='leadsubmission',
+            name='phone',
+            field=models.CharField(blank=True, help_text='Номер телефону', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='leadsubmission',
+            name='status',
+            field=models.CharField(choices=[('new', 'Нова'), ('contacted', "Зв'язалися"), ('in_progress', 'В роботі'), ('completed', 'Завершено'), ('cancelled', 'Скасовано')], default='new', help_text='Статус обробки заявки', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='leadsubmission',
+            name='telegram_sent',
+            field=models.BooleanField(default=False, help_text='Чи була заявка відправлена в Telegram'),
+        ),
+        migrations.AddIndex(
+            model_name='leadsubmission',
+            index=models.Index(fields=['-created_at', '-id'], name='pages_lead_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadsubmission',
+            index=models.Index(condition=models.Q(('telegram_sent', False)), fields=['-created_at', '-id'], name='pages_lead_unsent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadsubmission',
+            index=models.Index(condition=models.Q(('status', 'new')), fields=['-created_at', '-id'], name='pages_lead_new_idx'),
+        ),
+    ]
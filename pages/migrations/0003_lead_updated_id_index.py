@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 19:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0002_lead_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leadsubmission',
+            index=models.Index(fields=['updated_at', 'id'], name='pages_lead_updated_id_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-19 19:25
+
+from django.db import migrations, models
+
+# Документи, на які посилається footer: до заповнення в адмінці - заглушка
+PLACEHOLDER_BODY = 'Цей документ знаходиться в процесі підготовки. Будь ласка, перевірте пізніше.'
+PLACEHOLDER_HTML = f'<p>{PLACEHOLDER_BODY}</p>'
+DOCUMENTS = [
+    ('public-offer', 'Публічна оферта'),
+    ('privacy-policy', 'Політика конфіденційності'),
+    ('cookie-policy', 'Політика використання cookies'),
+    ('consent-pd', 'Згода на обробку персональних даних'),
+    ('disclaimer', 'Відмова від відповідальності'),
+]
+
+
+def create_documents(apps, schema_editor):
+    LegalDocument = apps.get_model('pages', 'LegalDocument')
+    LegalDocument.objects.bulk_create([
+        LegalDocument(slug=slug, title=title, body=PLACEHOLDER_BODY, html=PLACEHOLDER_HTML, version=1)
+        for slug, title in DOCUMENTS
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0003_lead_updated_id_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LegalDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.SlugField(help_text='Частина адреси: /legal/<slug>/. Посилання на документи в footer використовують її', unique=True)),
+                ('title', models.CharField(help_text='Заголовок документа', max_length=200)),
+                ('body', models.TextField(blank=True, help_text='Текст у Markdown: розділи - ## та ###, списки - "-" або "1.", посилання - [текст](https://...). HTML теги не підтримуються')),
+                ('html', models.TextField(blank=True, editable=False, help_text='HTML, згенерований з body при збереженні')),
+                ('version', models.PositiveIntegerField(default=0, editable=False, help_text='Номер редакції (збільшується з кожним збереженням, входить в ETag)')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Дата та час останньої зміни')),
+            ],
+            options={
+                'verbose_name': 'Правовий документ',
+                'verbose_name_plural': 'Правові документи',
+                'ordering': ['title'],
+            },
+        ),
+        migrations.RunPython(create_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 19:59
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0004_legal_document'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='leadsubmission',
+            name='pages_lead_new_idx',
+        ),
+    ]
@@ -1,10 +1,34 @@
 """
-Моделі для збереження заявок з форм.
+Моделі для збереження заявок з форм та правових документів сайту.
 """
 
-from django.db import models
+from django.db import models, transaction
+from django.urls import reverse
 from django.utils import timezone
 
+from .utils import legal
+
+
+class LeadSubmissionQuerySet(models.QuerySet):
+    """
+    Типові вибірки заявок.
+    Умова pending_telegram має збігатися з condition часткового індексу
+    pages_lead_unsent_idx, інакше PostgreSQL його не використає.
+    """
+
+    def pending_telegram(self):
+        """
+        Заявки, що не дійшли в жоден канал сповіщень.
+
+        Читають: retry_notifications (повторна відправка), /health/ready (розмір
+        черги) та фільтр Telegram в адмінці - усі через pages_lead_unsent_idx.
+        """
+        return self.filter(telegram_sent=False)
+
+    def awaiting_triage(self):
+        """Нові заявки, які ще ніхто не обробив (індекс status, -created_at)."""
+        return self.filter(status='new')
+
 
 class LeadSubmission(models.Model):
     """
@@ -31,19 +55,16 @@ class LeadSubmission(models.Model):
     form_type = models.CharField(
         max_length=20,
         choices=FORM_TYPES,
-        db_index=True,
         help_text='Тип форми, з якої надійшла заявка'
     )
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
         default='new',
-        db_index=True,
         help_text='Статус обробки заявки'
     )
     created_at = models.DateTimeField(
         auto_now_add=True,
-        db_index=True,
         help_text='Дата та час отримання заявки'
     )
     updated_at = models.DateTimeField(
@@ -54,18 +75,15 @@ class LeadSubmission(models.Model):
     # Основні поля (спільні для всіх форм)
     name = models.CharField(
         max_length=100,
-        db_index=True,
         help_text='Ім\'я клієнта'
     )
     phone = models.CharField(
         max_length=20,
         blank=True,
-        db_index=True,
         help_text='Номер телефону'
     )
     email = models.EmailField(
         blank=True,
-        db_index=True,
         help_text='Email адреса'
     )
     
@@ -83,7 +101,6 @@ class LeadSubmission(models.Model):
     # Технічні поля
     telegram_sent = models.BooleanField(
         default=False,
-        db_index=True,
         help_text='Чи була заявка відправлена в Telegram'
     )
     telegram_sent_at = models.DateTimeField(
@@ -107,14 +124,31 @@ class LeadSubmission(models.Model):
         help_text='Внутрішні нотатки адміністратора'
     )
     
+    objects = LeadSubmissionQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Заявка'
         verbose_name_plural = 'Заявки'
         ordering = ['-created_at']
+        # Лише індекси під реальні запити (python manage.py index_audit):
+        # - (-created_at, -id): список адмінки (admin додає pk для стабільного порядку);
+        # - (updated_at, id): keyset пагінація стрічки змін для CRM;
+        # - (form_type/status, -created_at): фільтри адмінки та awaiting_triage() з сортуванням,
+        #   вони ж замінюють окремі індекси form_type і status;
+        # - pages_lead_unsent_idx: черга pending_telegram() - частковий індекс, бо
+        #   невідправлених заявок одиниці, а повний індекс за telegram_sent майже весь
+        #   складався б з True і планувальник його не обирав би.
+        # Пошук адмінки (icontains за name/phone/email) B-tree індексами не прискорюється.
         indexes = [
-            models.Index(fields=['-created_at']),
+            models.Index(fields=['-created_at', '-id'], name='pages_lead_created_id_idx'),
+            models.Index(fields=['updated_at', 'id'], name='pages_lead_updated_id_idx'),
             models.Index(fields=['form_type', '-created_at']),
             models.Index(fields=['status', '-created_at']),
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(telegram_sent=False),
+                name='pages_lead_unsent_idx',
+            ),
         ]
     
     def __str__(self):
@@ -134,3 +168,91 @@ class LeadSubmission(models.Model):
         """Позначити заявку як 'Скасовано'"""
         self.status = 'cancelled'
         self.save()
+
+
+class LegalDocumentManager(models.Manager):
+
+    def get_cached(self, slug):
+        """
+        Заголовок, HTML та версія документа з кешу (pages.utils.legal).
+
+        Returns:
+            dict title, html, version або None, якщо документа немає
+        """
+        return legal.get_cached(
+            slug,
+            lambda slug: self.filter(slug=slug).values('title', 'html', 'version').first(),
+        )
+
+
+class LegalDocument(models.Model):
+    """
+    Правовий документ (оферта, політики, згода) для /legal/<slug>/.
+    Текст редагується в адмінці в Markdown, HTML рендериться при збереженні.
+    """
+
+    slug = models.SlugField(
+        max_length=50,
+        unique=True,
+        help_text='Частина адреси: /legal/<slug>/. Посилання на документи в footer використовують її'
+    )
+    title = models.CharField(
+        max_length=200,
+        help_text='Заголовок документа'
+    )
+    body = models.TextField(
+        blank=True,
+        help_text='Текст у Markdown: розділи - ## та ###, списки - "-" або "1.", посилання - [текст](https://...). '
+                  'HTML теги не підтримуються'
+    )
+    html = models.TextField(
+        blank=True,
+        editable=False,
+        help_text='HTML, згенерований з body при збереженні'
+    )
+    version = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text='Номер редакції (збільшується з кожним збереженням, входить в ETag)'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text='Дата та час останньої зміни'
+    )
+
+    objects = LegalDocumentManager()
+
+    class Meta:
+        verbose_name = 'Правовий документ'
+        verbose_name_plural = 'Правові документи'
+        ordering = ['title']
+
+    def __str__(self):
+        return self.title
+
+    def get_absolute_url(self):
+        return reverse('pages:legal', kwargs={'slug': self.slug})
+
+    def save(self, *args, **kwargs):
+        """Рендерить HTML, збільшує версію та скидає документ у кеші після коміту."""
+        self.html = legal.render_markdown(self.body)
+        if self._state.adding:
+            self.version = 1
+        else:
+            # Інкремент у БД: два одночасні збереження не отримають однакову версію
+            # (а з нею - однаковий ETag для різного HTML)
+            self.version = models.F('version') + 1
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'html', 'version'}
+        super().save(*args, **kwargs)
+        if not isinstance(self.version, int):
+            self.refresh_from_db(fields=['version'])
+        # Після коміту: інакше паралельний запит закешує ще старий рядок
+        transaction.on_commit(lambda slug=self.slug: legal.invalidate(slug))
+
+    def delete(self, *args, **kwargs):
+        slug = self.slug
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(lambda: legal.invalidate(slug))
+        return result
@@ -0,0 +1,5 @@
+"""
+Інструменти вимірювання продуктивності (навантажувальні тести, бенчмарки).
+Використовуються management командами, у production коді не імпортуються
+(логування повільних запитів для production - pages.utils.sql_log).
+"""
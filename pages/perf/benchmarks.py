@@ -0,0 +1,311 @@
+"""
+Мікробенчмарки гарячого шляху запиту для manage.py bench.
+
+Кожен бенчмарк - фабрика, зареєстрована через @benchmark: вона виконує
+підготовку (дані форм, RequestFactory запити) і повертає функцію без
+аргументів, яку вимірює runner. Підготовка в замір не потрапляє.
+"""
+
+import json
+import logging
+import os
+import time
+import timeit
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.test import Client, RequestFactory, override_settings
+from django.urls import resolve
+
+from PolygraphNew.log import JsonFormatter, QueueStreamHandler
+from PolygraphNew.middleware import ACCESS_LOG_PREFIX
+from pages import views
+from pages.forms import ConsultationForm, CorporateServicesForm, CTAContactForm, InfidelityCheckForm
+from pages.utils import get_client_ip
+from pages.utils.form_guard import HONEYPOT_FIELD, TOKEN_FIELD, issue_token
+from pages.utils.telegram import (
+    format_consultation_message,
+    format_corporate_message,
+    format_cta_message,
+    format_infidelity_message,
+)
+
+# Ім'я бенчмарку → фабрика функції для заміру
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Реєструє фабрику бенчмарку під іменем name (група.назва)."""
+    def decorator(factory):
+        BENCHMARKS[name] = factory
+        return factory
+    return decorator
+
+
+def _host():
+    hosts = [host for host in settings.ALLOWED_HOSTS if host not in ('*', '.localhost')]
+    return hosts[0].lstrip('.') if hosts else 'localhost'
+
+
+def _request(path, htmx=False, **extra):
+    request = RequestFactory().get(path, HTTP_HOST=_host(), **extra)
+    if htmx:
+        request.META['HTTP_HX_REQUEST'] = 'true'
+    # base.html використовує request.resolver_match (активний пункт меню, критичний CSS)
+    request.resolver_match = resolve(path)
+    return request
+
+
+# ----------------------------------------------------------------------------
+# Форми
+# ----------------------------------------------------------------------------
+
+FORM_DATA = {
+    'consultation': (ConsultationForm, {
+        'name': 'Олена', 'contact': '@olena', 'comment': 'Скільки коштує перевірка?', 'consent': 'on',
+    }),
+    'cta': (CTAContactForm, {
+        'name': 'Олена', 'phone': '+380671234567', 'email': 'olena@example.com', 'message': 'Передзвоніть',
+    }),
+    'infidelity': (InfidelityCheckForm, {'name': 'Олена', 'phone': '+38(067) 123-45-67'}),
+    'corporate': (CorporateServicesForm, {'name': 'Олена', 'phone': '+38(067) 123-45-67'}),
+}
+
+
+def _form_benchmark(form_class, data):
+    """
+    Валідна відправка: кожен виклик - новий токен, виданий FORM_GUARD_MIN_AGE
+    секунд тому, тому замір включає позначку токена в кеші FORM_GUARD_CACHE_ALIAS.
+    """
+    rendered_at = time.time() - settings.FORM_GUARD_MIN_AGE - 1
+
+    def run():
+        form_class({**data, TOKEN_FIELD: issue_token(form_class.guard_scope, now=rendered_at)}).is_valid()
+    return run
+
+
+for _name, (_form_class, _data) in FORM_DATA.items():
+    benchmark(f'forms.{_name}')(lambda form_class=_form_class, data=_data: _form_benchmark(form_class, data))
+
+
+@benchmark('forms.bot_rejected')
+def bench_form_bot_rejected():
+    """Бот заповнив honeypot: відхилення до валідації полів, без кешу та БД."""
+    form_class, data = FORM_DATA['cta']
+    data = {**data, HONEYPOT_FIELD: 'https://spam.example.com'}
+
+    def run():
+        form_class(data).is_valid()
+    return run
+
+
+# ----------------------------------------------------------------------------
+# Повідомлення Telegram та утиліти
+# ----------------------------------------------------------------------------
+
+@benchmark('telegram.format_consultation')
+def bench_format_consultation():
+    return lambda: format_consultation_message('Олена <b>', '@olena', 'Скільки коштує перевірка?')
+
+
+@benchmark('telegram.format_cta')
+def bench_format_cta():
+    return lambda: format_cta_message('Олена', '+380671234567', 'olena@example.com', 'Передзвоніть')
+
+
+@benchmark('telegram.format_infidelity')
+def bench_format_infidelity():
+    return lambda: format_infidelity_message('Олена', '+38(067) 123-45-67')
+
+
+@benchmark('telegram.format_corporate')
+def bench_format_corporate():
+    return lambda: format_corporate_message('Олена', '+38(067) 123-45-67')
+
+
+@benchmark('utils.get_client_ip')
+def bench_get_client_ip():
+    request = RequestFactory().get('/', HTTP_X_FORWARDED_FOR='203.0.113.7, 10.0.0.1')
+    return lambda: get_client_ip(request)
+
+
+# ----------------------------------------------------------------------------
+# Рендеринг сторінок та HTMX partials (view + шаблон, без middleware)
+# ----------------------------------------------------------------------------
+
+PAGES = {
+    'index': (views.index_view, '/'),
+    'about': (views.about_view, '/about/'),
+    'contacts': (views.contacts_view, '/contacts/'),
+    'legal': (views.legal_document_view, '/legal/privacy-policy/'),
+    'infidelity_landing': (views.infidelity_landing_view, '/perevirka-na-zradu/'),
+    'infidelity_thanks': (views.infidelity_thanks_view, '/perevirka-na-zradu/thank-you/'),
+    'corporate_landing': (views.corporate_landing_view, '/korporatyvni-poslugy/'),
+    'corporate_thanks': (views.corporate_thanks_view, '/korporatyvni-poslugy/thank-you/'),
+}
+
+# Сторінки, що мають HTMX partial
+PARTIALS = {'index', 'about', 'contacts', 'legal'}
+
+
+def _view_benchmark(view, path, htmx):
+    request = _request(path, htmx=htmx)
+    kwargs = request.resolver_match.kwargs
+
+    def run():
+        view(request, **kwargs)
+    return run
+
+
+for _name, (_view, _path) in PAGES.items():
+    benchmark(f'render.{_name}')(lambda view=_view, path=_path: _view_benchmark(view, path, False))
+    if _name in PARTIALS:
+        benchmark(f'render.{_name}_partial')(lambda view=_view, path=_path: _view_benchmark(view, path, True))
+
+
+# ----------------------------------------------------------------------------
+# Middleware stack
+# ----------------------------------------------------------------------------
+
+@benchmark('middleware.stack')
+def bench_middleware_stack():
+    """Повний стек MIDDLEWARE навколо найпростішого view (/health/)."""
+    client = Client(HTTP_HOST=_host())
+    return lambda: client.get('/health/')
+
+
+@benchmark('middleware.stack_page')
+def bench_middleware_stack_page():
+    """Стек MIDDLEWARE зі сторінкою: CSRF, мініфікація, стиснення, Link заголовки."""
+    client = Client(HTTP_HOST=_host(), HTTP_ACCEPT_ENCODING='gzip, br')
+    return lambda: client.get('/contacts/')
+
+
+# Стандартні middleware замість Admin*Middleware: стек до обмеження сесій адмінкою
+UNSCOPED_SESSION_MIDDLEWARE = {
+    'PolygraphNew.middleware.AdminSessionMiddleware': 'django.contrib.sessions.middleware.SessionMiddleware',
+    'PolygraphNew.middleware.AdminAuthenticationMiddleware': 'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'PolygraphNew.middleware.AdminMessageMiddleware': 'django.contrib.messages.middleware.MessageMiddleware',
+}
+
+
+def _session_benchmark(scoped, path, htmx=False):
+    """
+    Обробка запиту з cookie sessionid (як у персоналу після адмінки) стеком
+    MIDDLEWARE з обмеженими (scoped) або стандартними session/auth/messages.
+    BaseHandler напряму: без накладних витрат test Client, які приховують різницю.
+    """
+    middleware = settings.MIDDLEWARE
+    if not scoped:
+        middleware = [UNSCOPED_SESSION_MIDDLEWARE.get(path, path) for path in middleware]
+    with override_settings(MIDDLEWARE=middleware):
+        handler = BaseHandler()
+        handler.load_middleware()
+
+    factory = RequestFactory(HTTP_HOST=_host())
+    factory.cookies[settings.SESSION_COOKIE_NAME] = 'benchmark-session-key'
+    extra = {'HTTP_HX_REQUEST': 'true'} if htmx else {}
+
+    def run():
+        handler.get_response(factory.get(path, **extra))
+    return run
+
+
+for _scoped, _suffix in ((False, 'unscoped'), (True, 'scoped')):
+    benchmark(f'middleware.sessions_{_suffix}')(
+        lambda scoped=_scoped: _session_benchmark(scoped, '/health/')
+    )
+    benchmark(f'middleware.sessions_{_suffix}_page')(
+        lambda scoped=_scoped: _session_benchmark(scoped, '/contacts/', htmx=True)
+    )
+
+
+# ----------------------------------------------------------------------------
+# Логування
+# ----------------------------------------------------------------------------
+
+# Форматер production LOGGING до черги (StreamHandler у потоці запиту)
+SYNC_LOG_FORMAT = '{levelname} {asctime} {module} {message}'
+# Затримка write повільного stdout (пайп платформи, що не встигає читати)
+SLOW_STREAM_WRITE_DELAY = 0.0002
+
+
+class SlowStream:
+    """Файл /dev/null, кожен write якого чекає SLOW_STREAM_WRITE_DELAY секунд."""
+
+    def __init__(self):
+        self.stream = open(os.devnull, 'w')
+
+    def write(self, data):
+        time.sleep(SLOW_STREAM_WRITE_DELAY)
+        return self.stream.write(data)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _logging_benchmark(queued, stream):
+    """
+    Записи, які DiagnosticMiddleware робить на кожен запит (діагностичний рядок
+    та access log), через синхронний StreamHandler (як до черги) або
+    QueueStreamHandler. Вимірюється лише час потоку запиту; при повільному
+    stdout черга переповнюється і зайві записи відкидаються, а не чекають.
+    """
+    if queued:
+        handler = QueueStreamHandler(stream)
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter(SYNC_LOG_FORMAT, style='{'))
+    logger = logging.getLogger(f'benchmark.logging.{id(handler)}')
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    entry = json.dumps({
+        'ts': round(time.time(), 3), 'method': 'GET', 'path': '/contacts/',
+        'htmx': False, 'status': 200, 'duration_ms': 12.3,
+    })
+
+    def run():
+        logger.info('Request Host header: %s, Path: %s', 'localhost', '/contacts/')
+        logger.info('%s%s', ACCESS_LOG_PREFIX, entry)
+    return run
+
+
+for _queued, _mode in ((False, 'sync'), (True, 'queue')):
+    benchmark(f'logging.request_{_mode}')(
+        lambda queued=_queued: _logging_benchmark(queued, open(os.devnull, 'w'))
+    )
+    benchmark(f'logging.request_{_mode}_slow_stdout')(
+        lambda queued=_queued: _logging_benchmark(queued, SlowStream())
+    )
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """
+    Вимірює час одного виклику func.
+
+    Кількість викликів на повтор підбирається так, щоб повтор тривав
+    щонайменше min_time секунд; результат - найкращий та медіанний повтор.
+
+    Args:
+        func: Функція без аргументів
+        repeat: Кількість повторів
+        min_time: Мінімальна тривалість одного повтору, секунд
+
+    Returns:
+        number (викликів на повтор), best_us, median_us - мікросекунди на виклик
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2 if number < 1000 else 10
+
+    timings = sorted(timer.repeat(repeat=repeat, number=number))
+    return {
+        'number': number,
+        'best_us': 1e6 * timings[0] / number,
+        'median_us': 1e6 * timings[len(timings) // 2] / number,
+    }
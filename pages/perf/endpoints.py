@@ -0,0 +1,102 @@
+"""
+Сценарії запитів до всіх маршрутів pages/urls.py.
+Спільні для навантажувального тесту (loadtest) та перевірки бюджету запитів.
+"""
+
+import time
+
+from django.conf import settings
+from django.urls import reverse
+
+from pages import urls as pages_urls
+from pages.utils.form_guard import TOKEN_FIELD, issue_token
+
+# Аргументи для маршрутів з параметрами
+URL_KWARGS = {
+    'legal': {'slug': 'privacy-policy'},
+    'form_token': {'scope': 'cta'},
+}
+
+# Маршрути, що приймають лише POST форми
+POST_ONLY_ROUTES = {'consultation', 'infidelity_submit', 'corporate_submit'}
+
+# Службові маршрути (персонал, API для CRM): не частина публічного навантаження
+SERVICE_ROUTES = {'memory_profile', 'lead_changes'}
+
+# Маршрути форм → назва форми в токені фільтра ботів (guard_scope)
+FORM_SCOPES = {
+    'index': 'cta',
+    'consultation': 'consultation',
+    'infidelity_submit': 'infidelity',
+    'corporate_submit': 'corporate',
+}
+
+
+def form_payloads():
+    """Валідні дані форм: url_name → (дані, додаткові заголовки)."""
+    return {
+        'index': ({
+            'name': 'Навантажувальний тест',
+            'phone': '+380671234567',
+            'email': 'loadtest@example.com',
+            'message': 'Перевірка продуктивності',
+        }, {'HX-Request': 'true'}),
+        'consultation': ({
+            'name': 'Навантажувальний тест',
+            'contact': '@loadtest',
+            'comment': 'Перевірка продуктивності',
+            'consent': 'on',
+        }, {'HX-Request': 'true'}),
+        'infidelity_submit': ({
+            'name': 'Навантажувальний тест',
+            'phone': '+380671234567',
+        }, {}),
+        'corporate_submit': ({
+            'name': 'Навантажувальний тест',
+            'phone': '+380671234567',
+        }, {}),
+    }
+
+
+def signed_form_data(url_name, data):
+    """
+    Дані форми з новим токеном фільтра ботів, як у людини, що заповнювала
+    форму FORM_GUARD_MIN_AGE секунд. Токен одноразовий - для кожного запиту свій.
+    """
+    if url_name not in FORM_SCOPES or data is None:
+        return data
+    rendered_at = time.time() - settings.FORM_GUARD_MIN_AGE - 1
+    return {**data, TOKEN_FIELD: issue_token(FORM_SCOPES[url_name], now=rendered_at)}
+
+
+def build_endpoints():
+    """
+    Список сценаріїв для всіх маршрутів pages/urls.py.
+
+    Returns:
+        Список dict: label, url_name, method, path, data, headers.
+        Дані форм без токена - див. signed_form_data
+    """
+    payloads = form_payloads()
+    kwargs_by_name = dict(URL_KWARGS)
+
+    endpoints = []
+    for pattern in pages_urls.urlpatterns:
+        name = pattern.name
+        if name in SERVICE_ROUTES:
+            continue
+        if pattern.pattern.converters and name not in kwargs_by_name:
+            continue
+        path = reverse(f'{pages_urls.app_name}:{name}', kwargs=kwargs_by_name.get(name))
+
+        if name not in POST_ONLY_ROUTES:
+            endpoints.append({
+                'label': f'GET {path}', 'url_name': name, 'method': 'GET', 'path': path, 'data': None, 'headers': {},
+            })
+
+        if name in payloads:
+            data, headers = payloads[name]
+            endpoints.append({
+                'label': f'POST {path}', 'url_name': name, 'method': 'POST', 'path': path, 'data': data, 'headers': headers,
+            })
+    return endpoints
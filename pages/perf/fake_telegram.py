@@ -0,0 +1,147 @@
+"""
+Локальний замінник Telegram Bot API для навантажувальних тестів.
+
+Відповідає на sendMessage/getMe як справжній API, але з налаштовуваною
+затримкою, часткою помилок 500 та лімітом запитів (429 з retry_after),
+щоб виміряти поведінку сайту, коли Telegram повільний або обмежує бота.
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'FakeTelegram/1.0'
+
+    def log_message(self, format, *args):
+        # Тисячі запитів під навантаженням не повинні засмічувати stdout
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        fake = self.server.fake
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
+        method = self.path.rstrip('/').rsplit('/', 1)[-1]
+        status, payload, headers = fake.respond(method)
+        self._send_json(status, payload, headers)
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+class FakeTelegramServer:
+    """
+    Фейковий Bot API у фоновому потоці.
+
+    Args:
+        latency: Затримка відповіді в секундах
+        jitter: Випадкова додаткова затримка 0..jitter секунд
+        error_rate: Частка відповідей 500 (0..1)
+        rate_limit: Максимум запитів за секунду, понад ліміт - 429 (0 = без ліміту)
+        retry_after: Значення retry_after у відповіді 429
+        host: Адреса для прослуховування
+        port: Порт (0 = вільний порт)
+
+    Приклад:
+        with FakeTelegramServer(latency=0.3) as server:
+            os.environ['TELEGRAM_API_URL'] = server.url
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit=0, retry_after=1,
+                 host='127.0.0.1', port=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+
+        self._lock = threading.Lock()
+        self._window_start = 0.0
+        self._window_count = 0
+        self.stats = {'requests': 0, 'messages': 0, 'errors': 0, 'rate_limited': 0}
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def _rate_limited(self):
+        if not self.rate_limit:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            return self._window_count > self.rate_limit
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def respond(self, method):
+        """
+        Відповідь на виклик методу API.
+
+        Returns:
+            (status, JSON payload, додаткові заголовки)
+        """
+        self._count('requests')
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+
+        if self._rate_limited():
+            self._count('rate_limited')
+            return 429, {
+                'ok': False,
+                'error_code': 429,
+                'description': f'Too Many Requests: retry after {self.retry_after}',
+                'parameters': {'retry_after': self.retry_after},
+            }, {'Retry-After': str(self.retry_after)}
+
+        if self.error_rate and random.random() < self.error_rate:
+            self._count('errors')
+            return 500, {'ok': False, 'error_code': 500, 'description': 'Internal Server Error'}, None
+
+        if method == 'getMe':
+            return 200, {'ok': True, 'result': {'id': 1, 'is_bot': True, 'username': 'fake_bot'}}, None
+
+        self._count('messages')
+        return 200, {'ok': True, 'result': {'message_id': self.stats['messages'], 'date': int(time.time())}}, None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
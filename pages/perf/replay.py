@@ -0,0 +1,169 @@
+"""
+Розбір production логів у навантаження для replay_log.
+
+Підтримуються два формати рядків:
+- структурований access log DiagnosticMiddleware:
+  '... access {"ts": ..., "method": "GET", "path": "/", "htmx": false, "status": 200, "duration_ms": 12.3}'
+- старий діагностичний рядок (лише GET, час - з timestamp рядка):
+  'INFO 2025-01-01 12:00:00,123 middleware Request Host header: example.com, Path: /about/'
+
+Обидва можуть бути як текстовим рядком, так і полем message JSON запису
+(PolygraphNew.log.JsonFormatter).
+"""
+
+import json
+import re
+import sys
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.urls import Resolver404, resolve
+
+from PolygraphNew.middleware import ACCESS_LOG_PREFIX
+
+LEGACY_LINE_RE = re.compile(r'Request Host header: (?P<host>[^,]*), Path: (?P<path>\S+)')
+# asctime logging (2025-01-01 12:00:00,123) або ISO timestamp платформи (2025-01-01T12:00:00.123Z)
+TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[,.]\d+)?(?:Z|[+-]\d{2}:?\d{2})?')
+
+
+def _parse_timestamp(line):
+    match = TIMESTAMP_RE.search(line)
+    if not match:
+        return None
+    value = match.group(0).replace(',', '.')
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def read_log_lines(paths):
+    """Рядки з файлів логів по черзі; '-' - stdin."""
+    for path in paths:
+        if path == '-':
+            yield from sys.stdin
+            continue
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                yield from f
+        except OSError as e:
+            raise CommandError(f'Не вдалося прочитати лог {path}: {str(e)}')
+
+
+def log_message(line):
+    """
+    Повідомлення з рядка логу: поле message JSON запису або сам рядок.
+
+    Перед JSON записом платформа може дописати свій timestamp.
+    """
+    position = line.find('{"')
+    if position == -1:
+        return line
+    try:
+        record = json.loads(line[position:])
+    except ValueError:
+        return line
+    if isinstance(record, dict) and isinstance(record.get('message'), str):
+        return record['message']
+    return line
+
+
+def parse_json_line(line, prefix):
+    """
+    JSON об'єкт після префікса ('access ', 'slow_query ') у рядку логу або None.
+
+    Префікс може стояти будь-де: перед ним formatter та платформа
+    дописують рівень, час, модуль.
+    """
+    line = log_message(line)
+    position = line.find(prefix + '{')
+    if position == -1:
+        return None
+    try:
+        entry = json.loads(line[position + len(prefix):])
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def parse_access_line(line):
+    """
+    Запис структурованого access log або None.
+
+    Returns:
+        dict: ts, method, path, htmx, status, duration_ms
+    """
+    entry = parse_json_line(line, ACCESS_LOG_PREFIX)
+    if not entry or 'path' not in entry:
+        return None
+    return {
+        'ts': entry.get('ts'),
+        'method': entry.get('method', 'GET'),
+        'path': entry['path'],
+        'htmx': bool(entry.get('htmx')),
+        'status': entry.get('status'),
+        'duration_ms': entry.get('duration_ms'),
+    }
+
+
+def parse_legacy_line(line):
+    """Запис зі старого рядка 'Request Host header: ..., Path: ...' або None."""
+    match = LEGACY_LINE_RE.search(log_message(line))
+    if not match:
+        return None
+    return {
+        'ts': _parse_timestamp(line),
+        'method': 'GET',
+        'path': match.group('path'),
+        'htmx': False,
+        'status': None,
+        'duration_ms': None,
+    }
+
+
+def load_workload(lines):
+    """
+    Навантаження з рядків логу, впорядковане за часом.
+
+    Якщо в логах є структурований access log, старі рядки ігноруються:
+    DiagnosticMiddleware пише обидва для кожного запиту.
+
+    Args:
+        lines: Ітерований набір рядків (один або кілька файлів)
+
+    Returns:
+        Список записів (див. parse_access_line)
+    """
+    structured = []
+    legacy = []
+    for line in lines:
+        entry = parse_access_line(line)
+        if entry:
+            structured.append(entry)
+            continue
+        entry = parse_legacy_line(line)
+        if entry:
+            legacy.append(entry)
+
+    workload = structured or legacy
+    if all(entry['ts'] is not None for entry in workload):
+        workload.sort(key=lambda entry: entry['ts'])
+    return workload
+
+
+def route_label(method, path):
+    """
+    Мітка для групування статистики: маршрут замість конкретного шляху.
+
+    '/legal/privacy/' → 'GET /legal/<slug:slug>/'; статика - 'GET static'.
+    """
+    path = urlsplit(path).path
+    if path.startswith(settings.STATIC_URL):
+        return f'{method} static'
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return f'{method} (404)'
+    return f'{method} /{match.route}'
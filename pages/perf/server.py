@@ -0,0 +1,103 @@
+"""
+Локальний сервер для навантажувальних прогонів: gunicorn з фейковим Telegram API.
+Спільний для loadtest та replay_log.
+"""
+
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+
+import requests
+from django.conf import settings
+from django.core.management.base import CommandError
+
+# За цим User-Agent заявки з навантажувальних прогонів видаляються після прогону
+LOADTEST_USER_AGENT = 'PolygraphNew-loadtest/1.0'
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_gunicorn(telegram_url, workers=4, threads=1):
+    """
+    Запускає gunicorn з каналом сповіщень Telegram, направленим на фейковий API.
+
+    Args:
+        telegram_url: URL фейкового Telegram Bot API
+        workers: Кількість воркерів
+        threads: Потоки на воркер (>1 - gthread)
+
+    Returns:
+        (subprocess.Popen, base_url)
+    """
+    port = free_port()
+    env = dict(os.environ)
+    env.update({
+        'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'PolygraphNew.settings.develop'),
+        'TELEGRAM_API_URL': telegram_url,
+        'TELEGRAM_BOT_TOKEN': 'loadtest-token',
+        'TELEGRAM_CHAT_ID': '100000001',
+    })
+    env.pop('TELEGRAM_CHAT_ID_2', None)
+    env.pop('TELEGRAM_CHAT_IDS', None)
+
+    command = [
+        sys.executable, '-m', 'gunicorn', 'PolygraphNew.wsgi:application',
+        '--bind', f'127.0.0.1:{port}',
+        '--workers', str(workers),
+        '--threads', str(threads),
+        '--timeout', '60',
+    ]
+    try:
+        server = subprocess.Popen(
+            command,
+            cwd=settings.BASE_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:
+        raise CommandError(f'Не вдалося запустити gunicorn ({e}); вкажіть --target')
+    return server, f'http://127.0.0.1:{port}'
+
+
+def stop_server(server):
+    server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+def wait_ready(base_url, host_header, timeout=30):
+    """Чекає, поки /health/ відповість 200."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = requests.get(f'{base_url}/health/', headers={'Host': host_header}, timeout=2)
+            if response.status_code == 200:
+                return
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(0.3)
+    raise CommandError(f'Сервер {base_url} не відповів на /health/ за {timeout} с')
+
+
+def csrf_headers(base_url, host_header):
+    """Заголовки Cookie та X-CSRFToken для POST форм."""
+    response = requests.get(f'{base_url}/', headers={'Host': host_header}, timeout=10)
+    # Secure cookie не повертається в cookie jar по http, тому читаємо заголовок напряму
+    match = re.search(rf'{settings.CSRF_COOKIE_NAME}=([^;]+)', response.headers.get('Set-Cookie', ''))
+    if not match:
+        raise CommandError('Не вдалося отримати CSRF cookie з головної сторінки')
+    token = match.group(1)
+    return {
+        'Cookie': f'{settings.CSRF_COOKIE_NAME}={token}',
+        'X-CSRFToken': token,
+    }
@@ -0,0 +1,63 @@
+"""
+Запис виконаних SQL запитів з місцем виклику в коді проекту
+(check_query_budget та інші інструменти вимірювання).
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+
+from pages.utils.sql_log import normalize_sql, project_origin
+
+_THIS_FILE = os.path.abspath(__file__)
+
+
+class QueryRecorder:
+    """
+    Записує SQL запити через connection.execute_wrapper.
+
+    Кожен запис: sql, duration (секунди), origin (кадри коду проекту).
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                'sql': sql,
+                'duration': time.perf_counter() - started,
+                'origin': project_origin(skip_files=(_THIS_FILE,)),
+            })
+
+    @property
+    def total_time(self) -> float:
+        return sum(query['duration'] for query in self.queries)
+
+    def duplicates(self) -> dict:
+        """Нормалізований SQL → кількість повторів (лише ті, що повторюються)."""
+        counts = {}
+        for query in self.queries:
+            key = normalize_sql(query['sql'])
+            counts[key] = counts.get(key, 0) + 1
+        return {sql: count for sql, count in counts.items() if count > 1}
+
+
+@contextmanager
+def record_queries(using=connection):
+    """
+    Контекстний менеджер запису SQL запитів.
+
+    Приклад:
+        with record_queries() as recorder:
+            client.get('/')
+        print(len(recorder.queries), recorder.total_time)
+    """
+    recorder = QueryRecorder()
+    with using.execute_wrapper(recorder):
+        yield recorder
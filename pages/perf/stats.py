@@ -0,0 +1,44 @@
+"""
+Статистика вимірювань: перцентилі та підсумки у мілісекундах.
+"""
+
+import math
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """
+    Перцентиль методом найближчого рангу.
+
+    Args:
+        sorted_values: Відсортовані значення
+        fraction: Частка від 0 до 1 (0.99 для p99)
+
+    Returns:
+        Значення перцентиля або 0.0 для порожнього списку
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(durations) -> dict:
+    """
+    Підсумок тривалостей у секундах.
+
+    Args:
+        durations: Тривалості окремих вимірювань (секунди)
+
+    Returns:
+        count, mean/p50/p95/p99/max у мілісекундах
+    """
+    values = sorted(durations)
+    count = len(values)
+    return {
+        'count': count,
+        'mean_ms': 1000 * sum(values) / count if count else 0.0,
+        'p50_ms': 1000 * percentile(values, 0.50),
+        'p95_ms': 1000 * percentile(values, 0.95),
+        'p99_ms': 1000 * percentile(values, 0.99),
+        'max_ms': 1000 * values[-1] if count else 0.0,
+    }
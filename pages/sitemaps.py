@@ -0,0 +1,57 @@
+"""
+Sitemap для /sitemap.xml (django.contrib.sitemaps).
+"""
+
+from django.conf import settings
+from django.contrib.sitemaps import Sitemap
+from django.urls import reverse
+
+from .models import LegalDocument
+
+
+class SiteSitemap(Sitemap):
+    """Спільна схема адрес: за проксі запит приходить по http, а сайт працює по https."""
+
+    @property
+    def protocol(self):
+        return settings.SITEMAP_PROTOCOL
+
+
+class StaticViewSitemap(SiteSitemap):
+    """Публічні сторінки без параметрів (сторінки подяки та службові маршрути не індексуються)."""
+
+    changefreq = 'monthly'
+
+    PRIORITIES = {
+        'pages:index': 1.0,
+        'pages:infidelity_landing': 0.9,
+        'pages:corporate_landing': 0.9,
+        'pages:about': 0.7,
+        'pages:contacts': 0.7,
+    }
+
+    def items(self):
+        return list(self.PRIORITIES)
+
+    def location(self, item):
+        return reverse(item)
+
+    def priority(self, item):
+        return self.PRIORITIES[item]
+
+
+class LegalDocumentSitemap(SiteSitemap):
+    changefreq = 'yearly'
+    priority = 0.2
+
+    def items(self):
+        return LegalDocument.objects.only('slug', 'updated_at').order_by('slug')
+
+    def lastmod(self, document):
+        return document.updated_at
+
+
+SITEMAPS = {
+    'pages': StaticViewSitemap,
+    'legal': LegalDocumentSitemap,
+}
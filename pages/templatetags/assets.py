@@ -0,0 +1,237 @@
+"""
+Template tags для оптимізованих статичних асетів.
+Використання: {% load assets %}
+"""
+
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from pages.assets.bundles import MANIFEST_NAME as BUNDLES_MANIFEST
+from pages.assets.bundles import resolve_static_urls
+from pages.assets.fonts import MANIFEST_NAME as FONTS_MANIFEST
+from pages.assets.icons import MANIFEST_NAME as ICONS_MANIFEST
+from pages.assets.images import MANIFEST_NAME as IMAGES_MANIFEST
+from pages.assets.manifest import load_manifest
+from pages.assets.vendor import MANIFEST_NAME as VENDOR_MANIFEST
+from pages.assets.video import MANIFEST_NAME as POSTERS_MANIFEST
+
+register = template.Library()
+
+# Сучасні формати першими: браузер бере перший підтримуваний <source>
+SOURCE_TYPES = (
+    ('avif', 'image/avif'),
+    ('webp', 'image/webp'),
+)
+
+
+def _srcset(variants):
+    return ', '.join(f'{static(name)} {width}w' for width, name in variants)
+
+
+@register.simple_tag
+def responsive_img(path, alt='', sizes='100vw', css_class='', loading='lazy', fetchpriority=''):
+    """
+    Адаптивне зображення з AVIF/WebP варіантами.
+
+    Виводить <picture> з srcset/sizes, intrinsic width/height (без layout shift)
+    та lazy loading. Якщо build_assets ще не запускався - звичайний <img>.
+
+    Приклад:
+        {% responsive_img 'img/poli.png' alt='Поліграф' sizes='(width >= 768px) 33vw, 100vw' css_class='why-us__image' %}
+    """
+    entry = load_manifest(IMAGES_MANIFEST).get(path)
+
+    img_attrs = [('alt', alt)]
+    if css_class:
+        img_attrs.append(('class', css_class))
+    if entry:
+        img_attrs += [('width', entry['width']), ('height', entry['height'])]
+    img_attrs += [('loading', loading), ('decoding', 'async')]
+    if fetchpriority:
+        img_attrs.append(('fetchpriority', fetchpriority))
+
+    if not entry:
+        return format_html(
+            '<img src="{}"{}>',
+            static(path),
+            format_html_join('', ' {}="{}"', img_attrs),
+        )
+
+    sources = format_html_join(
+        '',
+        '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (mime, _srcset(entry['variants'][fmt]), sizes)
+            for fmt, mime in SOURCE_TYPES
+            if entry['variants'].get(fmt)
+        ),
+    )
+    return format_html(
+        '<picture class="responsive-picture">{}<img src="{}"{}></picture>',
+        sources,
+        static(entry['fallback']),
+        format_html_join('', ' {}="{}"', img_attrs),
+    )
+
+
+@register.simple_tag
+def background_image_set(selector, path, width=1280):
+    """
+    background-image з AVIF/WebP варіантів зображення через image-set().
+
+    Правило виводиться лише коли build_assets згенерував варіанти; без них
+    лишається background-image з вихідного CSS (оригінальний файл). Для кожного
+    формату береться найменший варіант, не вужчий за width.
+
+    Приклад:
+        {% background_image_set 'html body::before' 'img/Logoabout.png' width=1280 %}
+    """
+    entry = load_manifest(IMAGES_MANIFEST).get(path)
+    if not entry:
+        return ''
+
+    candidates = []
+    for fmt, mime in SOURCE_TYPES:
+        variants = entry['variants'].get(fmt)
+        if not variants:
+            continue
+        name = next((name for variant_width, name in variants if variant_width >= width), variants[-1][1])
+        candidates.append(format_html("url('{}') type('{}')", static(name), mime))
+    if not candidates:
+        return ''
+    return format_html(
+        '<style>{} {{ background-image: image-set({}); }}</style>',
+        selector,
+        mark_safe(', '.join(candidates)),
+    )
+
+
+@register.simple_tag
+def video_poster(path):
+    """
+    URL постера для відео, згенерованого build_assets.
+    Порожній рядок, якщо постера немає (браузер просто не покаже постер).
+
+    Приклад:
+        <video poster="{% video_poster 'video/hero.mp4' %}" preload="metadata">
+    """
+    entry = load_manifest(POSTERS_MANIFEST).get(path)
+    return static(entry['poster']) if entry else ''
+
+
+@register.simple_tag
+def bundle_css(name, page=None):
+    """
+    CSS бандла з ASSET_BUNDLES.
+
+    Якщо для бандла є critical_css - CSS першого екрану сторінки інлайниться
+    в <style>, а повний бандл завантажується без блокування рендерингу.
+    Без build_assets - окремі <link> на кожен файл у вихідному порядку.
+
+    Приклад:
+        {% bundle_css 'site' page=request.resolver_match.url_name %}
+    """
+    entry = load_manifest(BUNDLES_MANIFEST).get(name)
+    if not entry or 'css' not in entry:
+        return format_html_join(
+            '\n', '<link rel="stylesheet" href="{}">',
+            ((static(path),) for path in settings.ASSET_BUNDLES[name]['css']),
+        )
+
+    href = static(entry['css'])
+    critical = entry.get('critical_css', {})
+    critical_css = critical.get(page) or critical.get('default')
+    if not critical_css:
+        return format_html('<link rel="stylesheet" href="{}">', href)
+
+    # CSS вже мініфікований build-кроком і не містить даних користувача
+    return format_html(
+        '<style>{}</style>\n'
+        '<link rel="preload" href="{}" as="style">\n'
+        '<link rel="stylesheet" href="{}" media="print" onload="this.media=\'all\'">\n'
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        mark_safe(resolve_static_urls(critical_css)),
+        href,
+        href,
+        href,
+    )
+
+
+@register.simple_tag
+def font_preloads():
+    """
+    Preload для WOFF2 сабсетів шрифтів, які реально використовуються на сайті.
+    Шрифт починає завантажуватися разом з CSS, а не після його розбору.
+
+    Приклад:
+        {% font_preloads %}
+    """
+    return format_html_join(
+        '\n',
+        '<link rel="preload" href="{}" as="font" type="font/woff2" crossorigin>',
+        (
+            (static(entry['path']),)
+            for entry in load_manifest(FONTS_MANIFEST).values()
+            if entry.get('preload')
+        ),
+    )
+
+
+@register.simple_tag
+def icon_links():
+    """
+    favicon, apple-touch-icon та web app manifest з іконок build_assets.
+    Хешовані static адреси кешуються назавжди; без build - нічого
+    (браузер сам запитає /favicon.ico).
+
+    Приклад:
+        {% icon_links %}
+    """
+    icons = load_manifest(ICONS_MANIFEST)
+    if not icons:
+        return ''
+    return format_html(
+        '<link rel="icon" href="{}" sizes="any">\n'
+        '<link rel="apple-touch-icon" href="{}">\n'
+        '<link rel="manifest" href="{}">',
+        static(icons['favicon']),
+        static(icons['apple_touch_icon']),
+        reverse('pages:web_manifest'),
+    )
+
+
+@register.simple_tag
+def bundle_js(name):
+    """
+    JS бандла з ASSET_BUNDLES (defer, порядок файлів зберігається).
+    Без build_assets - окремі <script> на кожен файл.
+
+    Приклад:
+        {% bundle_js 'site' %}
+    """
+    entry = load_manifest(BUNDLES_MANIFEST).get(name)
+    if not entry or 'js' not in entry:
+        return format_html_join(
+            '\n', '<script src="{}" defer></script>',
+            ((static(path),) for path in settings.ASSET_BUNDLES[name]['js']),
+        )
+    return format_html('<script src="{}" defer></script>', static(entry['js']))
+
+
+@register.simple_tag
+def htmx_script():
+    """
+    HTMX з локальної копії (build_assets), або з CDN з integrity як fallback.
+    """
+    entry = load_manifest(VENDOR_MANIFEST).get('htmx')
+    if entry:
+        return format_html('<script src="{}" defer></script>', static(entry['path']))
+    return format_html(
+        '<script src="{}" integrity="{}" crossorigin="anonymous" defer></script>',
+        settings.HTMX_CDN_URL,
+        settings.HTMX_INTEGRITY,
+    )
@@ -0,0 +1,22 @@
+"""
+Template tags фільтра ботів для форм заявок.
+Використання: {% load form_guard %} ... {% form_guard 'cta' %}
+"""
+
+from django import template
+
+from pages.utils.form_guard import guard_fields
+
+register = template.Library()
+
+
+@register.simple_tag
+def form_guard(scope, htmx=True):
+    """
+    Приховані поля фільтра ботів: підписаний час рендерингу та honeypot.
+
+    Args:
+        scope: guard_scope форми (consultation, cta, infidelity, corporate)
+        htmx: False для сторінок без HTMX - токен оновлює JS сторінки
+    """
+    return guard_fields(scope, htmx=htmx)
@@ -0,0 +1,247 @@
+"""
+Тести pages: віддача файлів з HTTP Range (pages.utils.ranges), мініфікація
+та критичний CSS бандлів (pages.assets.bundles), фільтр ботів форм
+(pages.utils.form_guard), конкурентний запис у SQLite (PolygraphNew.sqlite3).
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+from django.db import OperationalError, connections, transaction
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.urls import reverse
+
+from pages.assets.bundles import extract_critical_css, minify_css, minify_js
+from pages.utils.form_guard import FormGuardError, check_submission, issue_token, refresh_token
+from pages.utils.ranges import parse_range_header, ranged_file_response
+
+FILE_SIZE = 1000
+
+
+class RangedFileResponseTests(SimpleTestCase):
+    """ranged_file_response: 200/206/416, If-Range та умовні запити за ETag."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.file_dir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.file_dir.name, 'data.bin')
+        with open(cls.path, 'wb') as f:
+            f.write(bytes(range(256)) * 3 + bytes(FILE_SIZE - 768))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.file_dir.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        with open(self.path, 'rb') as f:
+            self.content = f.read()
+
+    def get(self, **headers):
+        request = self.factory.get('/data.bin', **headers)
+        response = ranged_file_response(request, self.path, 'application/octet-stream')
+        self.addCleanup(response.close)
+        return response
+
+    def test_without_range_returns_whole_file(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+
+    def test_first_bytes(self):
+        response = self.get(HTTP_RANGE='bytes=0-99')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 0-99/{FILE_SIZE}')
+        self.assertEqual(response['Content-Length'], '100')
+        self.assertEqual(b''.join(response.streaming_content), self.content[:100])
+
+    def test_suffix_range(self):
+        response = self.get(HTTP_RANGE='bytes=-10')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes {FILE_SIZE - 10}-{FILE_SIZE - 1}/{FILE_SIZE}')
+        self.assertEqual(b''.join(response.streaming_content), self.content[-10:])
+
+    def test_start_beyond_end_is_unsatisfiable(self):
+        response = self.get(HTTP_RANGE=f'bytes={FILE_SIZE}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{FILE_SIZE}')
+
+    def test_if_range_with_current_etag(self):
+        etag = self.get()['ETag']
+        response = self.get(HTTP_RANGE='bytes=100-199', HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), self.content[100:200])
+
+    def test_if_range_with_stale_etag_returns_whole_file(self):
+        response = self.get(HTTP_RANGE='bytes=100-199', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+
+    def test_if_none_match(self):
+        etag = self.get()['ETag']
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+
+
+class ParseRangeHeaderTests(SimpleTestCase):
+    """parse_range_header: (start, end) включно, None - ігнорувати, False - 416."""
+
+    def test_satisfiable_ranges(self):
+        cases = {
+            'bytes=0-99': (0, 99),
+            'bytes=100-': (100, FILE_SIZE - 1),
+            'bytes=-10': (FILE_SIZE - 10, FILE_SIZE - 1),
+            'bytes=900-5000': (900, FILE_SIZE - 1),
+            'bytes=-5000': (0, FILE_SIZE - 1),
+            ' bytes=0-0 ': (0, 0),
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(parse_range_header(header, FILE_SIZE), expected)
+
+    def test_ignored_headers(self):
+        for header in ('', 'bytes=-', 'bytes=5-1', 'bytes=0-1,5-6', 'items=0-1', 'bytes=a-b'):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range_header(header, FILE_SIZE))
+
+    def test_unsatisfiable_ranges(self):
+        for header in (f'bytes={FILE_SIZE}-', f'bytes={FILE_SIZE + 1}-{FILE_SIZE + 5}', 'bytes=-0'):
+            with self.subTest(header=header):
+                self.assertIs(parse_range_header(header, FILE_SIZE), False)
+
+
+class BundleMinifyTests(SimpleTestCase):
+    """Мініфікація не змінює рядки, url() та regex-літерали; критичний CSS - лише перший екран."""
+
+    def test_js_regex_after_return(self):
+        self.assertEqual(minify_js('function f(x) {\n  return /re/.test(x);\n}'), 'function f(x){return/re/.test(x);}')
+
+    def test_css_strings_and_urls_unchanged(self):
+        css = minify_css(".a { content: ';}' ; background: url('a;}.png') ; }")
+        self.assertIn("content:';}'", css)
+        self.assertIn("url('a;}.png')", css)
+
+    def test_critical_css_keeps_first_screen_rules(self):
+        css = minify_css("""
+            html { color: red }
+            .hero, .footer { margin: 0 }
+            .hero__title { font-size: 2rem }
+            .heroes { color: blue }
+            @media (min-width: 768px) { .hero { padding: 0 } .footer { padding: 0 } }
+            @media print { .footer { display: none } }
+        """)
+        self.assertEqual(
+            extract_critical_css(css, ['html', '.hero']),
+            'html{color:red}.hero{margin:0}@media (min-width:768px){.hero{padding:0}}',
+        )
+        self.assertIn('.hero__title{', extract_critical_css(css, ['.hero__']))
+
+
+class FormGuardTests(TestCase):
+    """Оновлення токена при фокусі форми та відповіді HTMX форм з помилками."""
+
+    def test_refreshed_token_keeps_render_time(self):
+        embedded = issue_token('cta', now=time.time() - 3600)
+        check_submission('cta', {'form_token': refresh_token('cta', embedded)})
+
+    def test_new_token_is_too_fast(self):
+        with self.assertRaisesMessage(FormGuardError, 'too_fast'):
+            check_submission('cta', {'form_token': refresh_token('cta', 'garbage')})
+
+    def test_refreshed_token_of_other_form_is_new(self):
+        embedded = issue_token('consultation', now=time.time() - 3600)
+        with self.assertRaisesMessage(FormGuardError, 'too_fast'):
+            check_submission('cta', {'form_token': refresh_token('cta', embedded)})
+
+    def test_form_token_view(self):
+        url = reverse('pages:form_token', kwargs={'scope': 'cta'})
+        embedded = issue_token('cta', now=time.time() - 3600)
+        data = self.client.get(url, {'form_token': embedded}, HTTP_HOST='localhost').json()
+        check_submission('cta', {'form_token': data['form_token']})
+        html = self.client.get(url, HTTP_HOST='localhost', HTTP_HX_REQUEST='true').content.decode()
+        self.assertIn('id="form-token-cta"', html)
+
+    def test_landing_refreshes_without_htmx(self):
+        html = self.client.get(reverse('pages:infidelity_landing'), HTTP_HOST='localhost').content.decode()
+        self.assertIn('data-refresh-url=', html)
+        self.assertNotIn('hx-get="/form-token/', html)
+
+    def test_htmx_form_errors_are_422(self):
+        response = self.client.post(
+            reverse('pages:consultation'), {'form_token': 'garbage'}, HTTP_HOST='localhost', HTTP_HX_REQUEST='true',
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertIn('hx-swap-oob="true"', response.content.decode())
+
+
+class SQLiteConcurrencyTests(SimpleTestCase):
+    """
+    PolygraphNew.sqlite3 на тимчасовому файлі: WAL і atomic() з читанням, потім
+    записом у двох потоках без "database is locked" та без втрачених оновлень.
+    """
+
+    alias = 'sqlite_concurrency'
+    iterations = 50
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.db_dir = tempfile.TemporaryDirectory()
+        # Окремий alias реєструється після setUpClass: SimpleTestCase не блокує його запити
+        databases = connections.configure_settings({
+            'default': {'ENGINE': 'PolygraphNew.sqlite3', 'NAME': ':memory:'},
+            cls.alias: {'ENGINE': 'PolygraphNew.sqlite3', 'NAME': os.path.join(cls.db_dir.name, 'db.sqlite3')},
+        })
+        connections.settings[cls.alias] = databases[cls.alias]
+
+    @classmethod
+    def tearDownClass(cls):
+        connections[cls.alias].close()
+        del connections[cls.alias]
+        del connections.settings[cls.alias]
+        cls.db_dir.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute('CREATE TABLE IF NOT EXISTS counter (id INTEGER PRIMARY KEY, value INTEGER NOT NULL)')
+            cursor.execute('INSERT OR REPLACE INTO counter (id, value) VALUES (1, 0)')
+
+    def _read_then_write(self, barrier, errors):
+        try:
+            barrier.wait()
+            for _ in range(self.iterations):
+                with transaction.atomic(using=self.alias):
+                    with connections[self.alias].cursor() as cursor:
+                        cursor.execute('SELECT value FROM counter WHERE id = 1')
+                        value = cursor.fetchone()[0]
+                        cursor.execute('UPDATE counter SET value = %s WHERE id = 1', [value + 1])
+        except OperationalError as e:
+            errors.append(e)
+        finally:
+            connections[self.alias].close()
+
+    def test_journal_mode_is_wal(self):
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            self.assertEqual(cursor.fetchone()[0], 'wal')
+
+    def test_concurrent_read_then_write(self):
+        barrier = threading.Barrier(2)
+        errors = []
+        threads = [threading.Thread(target=self._read_then_write, args=(barrier, errors)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute('SELECT value FROM counter WHERE id = 1')
+            self.assertEqual(cursor.fetchone()[0], 2 * self.iterations)
@@ -12,6 +12,7 @@ urlpatterns = [
     path('about/', views.about_view, name='about'),
     path('contacts/', views.contacts_view, name='contacts'),
     path('consultation/', views.consultation_view, name='consultation'),
+    path('form-token/<slug:scope>/', views.form_token_view, name='form_token'),
     path('perevirka-na-zradu/', views.infidelity_landing_view, name='infidelity_landing'),
     path('perevirka-na-zradu/submit/', views.infidelity_form_submit, name='infidelity_submit'),
     path('perevirka-na-zradu/thank-you/', views.infidelity_thanks_view, name='infidelity_thanks'),
@@ -20,9 +21,15 @@ urlpatterns = [
     path('korporatyvni-poslugy/thank-you/', views.corporate_thanks_view, name='corporate_thanks'),
     path('legal/<slug:slug>/', views.legal_document_view, name='legal'),
     path('health/', views.health_check, name='health'),
+    path('health/ready', views.health_ready_view, name='health_ready'),
+    path('api/leads/changes/', views.lead_changes_view, name='lead_changes'),
+    path('debug/memory/', views.memory_profile_view, name='memory_profile'),
     path('favicon.ico', views.favicon_view, name='favicon'),
+    path('site.webmanifest', views.web_manifest, name='web_manifest'),
     path('robots.txt', views.robots_txt, name='robots'),
+    path('sitemap.xml', views.sitemap_xml, name='sitemap'),
     path('sw.js', views.sw_js, name='sw'),
+    path('offline/', views.offline_view, name='offline'),
 ]
 
 
@@ -0,0 +1,127 @@
+"""
+Інкрементальна стрічка змін заявок для синхронізації з CRM.
+
+Позиція в стрічці - пара (updated_at, id) останньої відданої заявки,
+загорнута в підписаний непрозорий курсор. Сторінки вибираються keyset
+пагінацією по індексу (updated_at, id): вартість не залежить від глибини,
+а нові зміни потрапляють у кінець стрічки.
+
+Зміни, новіші за CRM_FEED_SETTLE_SECONDS, ще не віддаються: updated_at
+ставиться до коміту транзакції, тож заявка з меншим updated_at може стати
+видимою вже після того, як клієнт пройшов цю позицію, і була б пропущена.
+"""
+
+import hashlib
+import hmac
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+
+from ..models import LeadSubmission
+
+CURSOR_SALT = 'pages.change_feed.cursor'
+
+# Змінюється разом з форматом запису: старі ETag клієнтів стають недійсними
+FEED_VERSION = 1
+
+FEED_FIELDS = (
+    'id',
+    'form_type',
+    'status',
+    'name',
+    'phone',
+    'email',
+    'contact',
+    'message',
+    'admin_notes',
+    'telegram_sent',
+    'telegram_sent_at',
+    'created_at',
+    'updated_at',
+)
+
+
+def is_authorized(request):
+    """Чи містить запит 'Authorization: Bearer <токен>' з CRM_FEED_TOKENS."""
+    scheme, _, token = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+    if scheme.lower() != 'bearer' or not token:
+        return False
+    token = token.strip().encode()
+    # Порівняння за сталий час з кожним токеном: час відповіді не підказує збіг
+    matches = [hmac.compare_digest(token, expected.encode()) for expected in settings.CRM_FEED_TOKENS]
+    return any(matches)
+
+
+def encode_cursor(updated_at, pk):
+    return signing.dumps([updated_at.isoformat(), pk], salt=CURSOR_SALT)
+
+
+def decode_cursor(cursor):
+    """
+    Позиція з курсора.
+
+    Returns:
+        (updated_at, id) або None для порожнього курсора (початок стрічки)
+
+    Raises:
+        ValueError: курсор пошкоджений або підписаний іншим SECRET_KEY
+    """
+    if not cursor:
+        return None
+    try:
+        updated_at, pk = signing.loads(cursor, salt=CURSOR_SALT)
+        return datetime.fromisoformat(updated_at), int(pk)
+    except (signing.BadSignature, TypeError, ValueError):
+        raise ValueError('Некоректний курсор')
+
+
+def parse_limit(value):
+    """Розмір сторінки з параметра limit (за замовчуванням CRM_FEED_PAGE_SIZE)."""
+    if value in (None, ''):
+        return settings.CRM_FEED_PAGE_SIZE
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError('limit має бути цілим числом')
+    if not 1 <= limit <= settings.CRM_FEED_MAX_PAGE_SIZE:
+        raise ValueError(f'limit має бути від 1 до {settings.CRM_FEED_MAX_PAGE_SIZE}')
+    return limit
+
+
+def page_keys(position, limit):
+    """
+    Ключі (updated_at, id) наступної сторінки: до limit + 1 рядків.
+
+    Вузький запит, який покривається індексом (updated_at, id) - з нього
+    рахується ETag, і повні рядки читаються лише якщо клієнт їх ще не має.
+    Зайвий рядок означає, що є наступна сторінка.
+    """
+    queryset = LeadSubmission.objects.filter(
+        updated_at__lt=timezone.now() - timedelta(seconds=settings.CRM_FEED_SETTLE_SECONDS),
+    )
+    if position:
+        updated_at, pk = position
+        # (updated_at, id) > позиції: діапазон по індексу мінус рядки з тим самим часом до id включно
+        queryset = queryset.filter(updated_at__gte=updated_at).exclude(updated_at=updated_at, id__lte=pk)
+    return list(queryset.order_by('updated_at', 'id').values_list('updated_at', 'id')[:limit + 1])
+
+
+def page_etag(cursor, limit, keys):
+    """ETag сторінки: запит (курсор, limit) та ключі рядків, що в неї потрапили."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{FEED_VERSION}:{cursor}:{limit}'.encode())
+    for updated_at, pk in keys:
+        digest.update(f':{updated_at.isoformat()}/{pk}'.encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def load_leads(keys):
+    """Записи стрічки в порядку ключів."""
+    leads = LeadSubmission.objects.only(*FEED_FIELDS).in_bulk([pk for _, pk in keys])
+    return [
+        {field: getattr(leads[pk], field) for field in FEED_FIELDS}
+        for _, pk in keys
+        if pk in leads
+    ]
@@ -0,0 +1,202 @@
+"""
+Дешевий фільтр ботів для форм заявок: honeypot та підписаний час рендерингу.
+
+Форма отримує приховане поле form_token = HMAC підпис (SECRET_KEY) рядка
+'<форма>:<час видачі, мс>:<nonce>[:<час рендерингу сторінки, мс>]'. Перевірка токена і honeypot - це
+лише розбір рядка та HMAC, без валідації полів і запитів до БД:
+- honeypot заповнений, токена немає або підпис не збігається - відхилено;
+- від рендерингу минуло менше FORM_GUARD_MIN_AGE - надто швидко для людини;
+- більше FORM_GUARD_MAX_AGE - токен прострочений.
+Nonce прийнятої заявки запам'ятовується в кеші FORM_GUARD_CACHE_ALIAS, тому
+повторна відправка того самого токена відхиляється.
+
+Сторінка з формою може бути відкрита давно або взята з кешу (bfcache, service
+worker без мережі), тобто з токеном, який вже використано або прострочено. Тому при першому фокусі форми токен замінюється
+свіжим з /form-token/<форма>/ (повз кеш service worker): на сторінках сайту -
+через HTMX, на лендінгах (без HTMX) - їхнім JS за data-refresh-url. Оновлений
+токен зберігає час рендерингу сторінки: FORM_GUARD_MIN_AGE рахується від нього,
+тому автозаповнення й відправка одразу після фокусу не відхиляються, а
+FORM_GUARD_MAX_AGE - від видачі. Вбудований у сторінку токен лишається для
+відправки без JavaScript.
+"""
+
+import secrets
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import caches
+from django.urls import reverse
+from django.utils.html import format_html
+
+TOKEN_FIELD = 'form_token'
+HONEYPOT_FIELD = 'honeypot'
+
+TOKEN_SALT = 'pages.form_guard'
+REPLAY_KEY_TEMPLATE = 'form-guard:{}'
+
+
+class FormGuardError(Exception):
+    """
+    Відправку відхилено фільтром.
+
+    Args:
+        reason: honeypot, missing, invalid, too_fast, expired або replayed
+    """
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def issue_token(scope, now=None, rendered_ms=None):
+    """
+    Токен для форми scope (form_type заявки), підписаний поточним часом.
+
+    Args:
+        scope: Назва форми; токен однієї форми не приймається іншою
+        now: Час видачі (секунди epoch), за замовчуванням - поточний
+        rendered_ms: Час рендерингу сторінки (мс) для оновленого токена,
+            за замовчуванням - час видачі
+    """
+    issued_ms = int((time.time() if now is None else now) * 1000)
+    value = f'{scope}:{issued_ms}:{secrets.token_urlsafe(12)}'
+    if rendered_ms is not None and rendered_ms < issued_ms:
+        value += f':{rendered_ms}'
+    return signing.Signer(salt=TOKEN_SALT).sign(value)
+
+
+def _unsign(token):
+    """
+    Розбирає токен.
+
+    Returns:
+        (scope, issued_ms, nonce, rendered_ms)
+
+    Raises:
+        signing.BadSignature, ValueError: підпис або формат не збігається
+    """
+    parts = signing.Signer(salt=TOKEN_SALT).unsign(token).split(':')
+    if len(parts) not in (3, 4):
+        raise ValueError(token)
+    scope, issued_ms, nonce = parts[0], int(parts[1]), parts[2]
+    rendered_ms = int(parts[3]) if len(parts) == 4 else issued_ms
+    return scope, issued_ms, nonce, rendered_ms
+
+
+def refresh_token(scope, token):
+    """
+    Новий токен замість вбудованого в сторінку (можливо, використаного чи простроченого).
+
+    Час рендерингу переноситься з попереднього токена, тому мінімальний вік
+    рахується від відкриття сторінки, а не від фокусу форми. Без коректного
+    токена - звичайний новий токен.
+
+    Args:
+        scope: Назва форми
+        token: Токен зі сторінки (form_token)
+    """
+    try:
+        token_scope, _, _, rendered_ms = _unsign(token or '')
+    except (signing.BadSignature, ValueError):
+        return issue_token(scope)
+    if token_scope != scope:
+        return issue_token(scope)
+    return issue_token(scope, rendered_ms=rendered_ms)
+
+
+def check_submission(scope, data):
+    """
+    Honeypot та токен відправки без звернень до БД чи кешу.
+
+    Args:
+        scope: Назва форми, для якої видано токен
+        data: POST дані форми
+
+    Returns:
+        nonce токена (для claim_token після успішної валідації)
+
+    Raises:
+        FormGuardError: відправку треба відхилити
+    """
+    if data.get(HONEYPOT_FIELD):
+        raise FormGuardError('honeypot')
+    token = data.get(TOKEN_FIELD)
+    if not token:
+        raise FormGuardError('missing')
+    try:
+        token_scope, issued_ms, nonce, rendered_ms = _unsign(token)
+    except (signing.BadSignature, ValueError):
+        raise FormGuardError('invalid')
+    if token_scope != scope:
+        raise FormGuardError('invalid')
+    now_ms = time.time() * 1000
+    if now_ms - rendered_ms < settings.FORM_GUARD_MIN_AGE * 1000:
+        raise FormGuardError('too_fast')
+    if now_ms - issued_ms > settings.FORM_GUARD_MAX_AGE * 1000:
+        raise FormGuardError('expired')
+    return nonce
+
+
+def claim_token(nonce):
+    """
+    Позначає токен використаним.
+
+    Raises:
+        FormGuardError: токен вже використано (повторна відправка)
+    """
+    cache = caches[settings.FORM_GUARD_CACHE_ALIAS]
+    # Після FORM_GUARD_MAX_AGE токен і так прострочений - довше пам'ятати не треба
+    if not cache.add(REPLAY_KEY_TEMPLATE.format(nonce), 1, timeout=settings.FORM_GUARD_MAX_AGE):
+        raise FormGuardError('replayed')
+
+
+def token_input(scope, token, oob=False, refresh=False, htmx=True):
+    """
+    Приховане поле з токеном.
+
+    Args:
+        scope: Назва форми
+        token: Токен (issue_token)
+        oob: Для HTMX відповіді - замінює поле у формі за id (hx-swap-oob),
+            не чіпаючи введені дані
+        refresh: При першому фокусі форми поле замінюється свіжим токеном
+            з form_token_view (сторінка могла бути відкрита давно або прийти з кешу)
+        htmx: Оновлення через HTMX; False - лише data-refresh-url для JS
+            сторінок без HTMX (лендінги)
+    """
+    extra = ''
+    if oob:
+        extra = format_html(' hx-swap-oob="true"')
+    elif refresh and htmx:
+        # Запит містить лише поточний токен (hx-params) - з нього береться час рендерингу
+        extra = format_html(
+            ' hx-get="{}" hx-trigger="focusin from:closest form once" hx-swap="outerHTML" hx-params="{}"',
+            reverse('pages:form_token', kwargs={'scope': scope}),
+            TOKEN_FIELD,
+        )
+    elif refresh:
+        extra = format_html(' data-refresh-url="{}"', reverse('pages:form_token', kwargs={'scope': scope}))
+    return format_html(
+        '<input type="hidden" name="{}" value="{}" id="form-token-{}"{}>',
+        TOKEN_FIELD,
+        token,
+        scope,
+        extra,
+    )
+
+
+def guard_fields(scope, htmx=True):
+    """
+    Токен та honeypot (приховане від людей текстове поле, яке заповнюють боти).
+
+    Args:
+        scope: Назва форми
+        htmx: Чи завантажує сторінка HTMX (див. token_input)
+    """
+    return format_html(
+        '{}<input type="text" name="{}" value="" class="form-guard__field" tabindex="-1" '
+        'autocomplete="off" aria-hidden="true" style="display:none !important;">',
+        token_input(scope, issue_token(scope), refresh=True, htmx=htmx),
+        HONEYPOT_FIELD,
+    )
@@ -0,0 +1,176 @@
+"""
+Перевірка готовності інстансу (/health/ready): проби залежностей з таймаутом.
+
+Проби (БД, міграції, кеш, черга сповіщень) виконуються паралельно в окремих
+потоках, і відповідь не чекає довше за HEALTH_PROBE_TIMEOUT, навіть якщо
+PostgreSQL чи Redis зависли. Результат зберігається в пам'яті процесу на
+HEALTH_CACHE_SECONDS: часті перевірки балансувальника (і кількох воркерів)
+не навантажують БД. Проби запускає лише один потік; одночасні запити не
+чекають на нього, а отримують попередній результат (age_ms показує його вік).
+
+Критичні проби (database, migrations, cache) визначають готовність; черга
+сповіщень лише показується - збій Telegram не повинен виводити з ротації всі
+інстанси одразу.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+
+from ..models import LeadSubmission
+
+PROBE_CACHE_KEY = 'health:probe'
+
+_executor = None
+# _lock - лише читання/заміна результату, _refresh_lock - один потік, що запускає проби
+_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+_cached = None
+_migrations_applied = False
+
+
+def _select_one():
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # Запит не переживе відповідь: після таймауту проби PostgreSQL сам його скасує
+            cursor.execute('SET LOCAL statement_timeout = %s', [int(settings.HEALTH_PROBE_TIMEOUT * 1000)])
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+
+
+def _probe_database():
+    if connection.vendor == 'postgresql':
+        # SET LOCAL діє лише всередині транзакції
+        with transaction.atomic():
+            _select_one()
+    else:
+        # Без atomic(): на SQLite з SQLITE_IMMEDIATE_TRANSACTIONS це BEGIN IMMEDIATE,
+        # тобто блокування запису кожні кілька секунд у кожному воркері
+        _select_one()
+    return {}
+
+
+def _probe_migrations():
+    # Застосовані міграції не відкочуються під час роботи процесу - після
+    # успіху граф міграцій (читання файлів з диска) більше не завантажується
+    global _migrations_applied
+    if not _migrations_applied:
+        executor = MigrationExecutor(connection)
+        pending = executor.migration_plan(executor.loader.graph.leaf_nodes())
+        if pending:
+            raise RuntimeError(f'незастосованих міграцій: {len(pending)}')
+        _migrations_applied = True
+    return {}
+
+
+def _probe_cache():
+    cache = caches[settings.HEALTH_CACHE_ALIAS]
+    value = str(time.time())
+    cache.set(PROBE_CACHE_KEY, value, timeout=60)
+    if cache.get(PROBE_CACHE_KEY) != value:
+        raise RuntimeError('записане значення не читається')
+    return {}
+
+
+def _probe_notifications():
+    pending = LeadSubmission.objects.pending_telegram().count()
+    return {
+        'pending': pending,
+        'status': 'warn' if pending > settings.HEALTH_NOTIFICATION_BACKLOG_WARN else 'ok',
+    }
+
+
+# Назва → (проба, критична)
+PROBES = {
+    'database': (_probe_database, True),
+    'migrations': (_probe_migrations, True),
+    'cache': (_probe_cache, True),
+    'notifications': (_probe_notifications, False),
+}
+
+
+def _run(probe):
+    """
+    Проба в потоці пулу з власним з'єднанням з БД.
+
+    З'єднання закривається після кожної проби: потоки пулу живуть стільки ж,
+    скільки воркер, і не повинні тримати з'єднання між перевірками.
+    """
+    started = time.perf_counter()
+    try:
+        result = {'status': 'ok', **probe()}
+    except Exception as e:
+        result = {'status': 'fail', 'error': str(e)[:200]}
+    finally:
+        connection.close()
+    result['latency_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def _get_executor():
+    # Пул створюється при першій перевірці, тобто вже у воркері gunicorn, а не до fork
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=len(PROBES), thread_name_prefix='health')
+    return _executor
+
+
+def run_probes():
+    """
+    Паралельний прогін усіх проб з загальним таймаутом HEALTH_PROBE_TIMEOUT.
+
+    Returns:
+        dict: ready, checks (назва → status, latency_ms, ...)
+    """
+    started = time.monotonic()
+    futures = {name: _get_executor().submit(_run, probe) for name, (probe, _) in PROBES.items()}
+    checks = {}
+    for name, future in futures.items():
+        remaining = max(started + settings.HEALTH_PROBE_TIMEOUT - time.monotonic(), 0)
+        try:
+            checks[name] = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            # Потік завершиться сам, але відповідь не чекає довше за таймаут
+            checks[name] = {
+                'status': 'fail',
+                'error': f'таймаут {settings.HEALTH_PROBE_TIMEOUT} с',
+                'latency_ms': round(settings.HEALTH_PROBE_TIMEOUT * 1000, 1),
+            }
+    ready = all(checks[name]['status'] != 'fail' for name, (_, critical) in PROBES.items() if critical)
+    return {'ready': ready, 'checks': checks}
+
+
+def readiness():
+    """
+    Результат проб, не старший за HEALTH_CACHE_SECONDS.
+
+    Застарілий результат оновлює лише один потік; решта не чекає на проби і
+    повертає попередній. Чекають лише запити до першого прогону в процесі.
+
+    Returns:
+        dict: ready, checks та age_ms - вік результату (0 - щойно виміряний)
+    """
+    global _cached
+    with _lock:
+        cached = _cached
+    if cached is None or time.monotonic() - cached[0] >= settings.HEALTH_CACHE_SECONDS:
+        if _refresh_lock.acquire(blocking=cached is None):
+            try:
+                with _lock:
+                    cached = _cached
+                # Інший потік міг оновити результат, поки цей чекав на _refresh_lock
+                if cached is None or time.monotonic() - cached[0] >= settings.HEALTH_CACHE_SECONDS:
+                    result = run_probes()
+                    cached = (time.monotonic(), result)
+                    with _lock:
+                        _cached = cached
+            finally:
+                _refresh_lock.release()
+    measured_at, result = cached
+    return {**result, 'age_ms': round((time.monotonic() - measured_at) * 1000)}
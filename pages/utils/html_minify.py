@@ -0,0 +1,74 @@
+"""
+Безпечна мініфікація HTML, що рендериться шаблонами.
+
+Видаляються коментарі та відступи. Вміст <pre>, <textarea>, <script> і <style>
+копіюється без змін, значення атрибутів у лапках - теж. Будь-яка послідовність
+пробілів у тексті стискається до одного пробілу, тому інлайнові елементи
+(посилання, inline-block кнопки) зберігають проміжки між собою.
+"""
+
+import re
+
+# Коментар або елемент, вміст якого не можна чіпати.
+# Умовні коментарі (<!--[if IE]>) зберігаються.
+PROTECTED_RE = re.compile(
+    r'(?P<comment><!--(?P<conditional>\[if|<!)?.*?-->)'
+    r'|<(?P<raw>pre|textarea|script|style)\b(?:"[^"]*"|\'[^\']*\'|[^\'">])*>.*?</(?P=raw)\s*>',
+    re.IGNORECASE | re.DOTALL,
+)
+# Тег з урахуванням '>' всередині значень атрибутів
+TAG_RE = re.compile(r'<(?:"[^"]*"|\'[^\']*\'|[^\'">])*>')
+# Рядок у лапках (зберігаємо) або послідовність пробілів (стискаємо)
+TAG_WHITESPACE_RE = re.compile(r'("[^"]*"|\'[^\']*\')|\s+')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _minify_tag(tag: str) -> str:
+    tag = TAG_WHITESPACE_RE.sub(lambda match: match.group(1) or ' ', tag)
+    return tag[:-2] + '>' if tag.endswith(' >') else tag
+
+
+def _minify_markup(markup: str) -> str:
+    parts = []
+    position = 0
+    for match in TAG_RE.finditer(markup):
+        parts.append(WHITESPACE_RE.sub(' ', markup[position:match.start()]))
+        parts.append(_minify_tag(match.group(0)))
+        position = match.end()
+    parts.append(WHITESPACE_RE.sub(' ', markup[position:]))
+    return ''.join(parts)
+
+
+def minify_html(html: str) -> str:
+    """
+    Мініфікує HTML без зміни його змісту.
+
+    Args:
+        html: HTML документ або фрагмент (HTMX partial)
+
+    Returns:
+        Мініфікований HTML
+    """
+    parts = []
+    # Розмітка між захищеними елементами; видалений коментар її не розриває,
+    # щоб пробіли з обох боків коментаря стиснулися в один
+    markup = []
+    position = 0
+    for match in PROTECTED_RE.finditer(html):
+        markup.append(html[position:match.start()])
+        position = match.end()
+        element = match.group(0)
+        if match.group('comment') and not match.group('conditional'):
+            continue
+
+        parts.append(_minify_markup(''.join(markup)))
+        markup = []
+        if match.group('comment'):
+            parts.append(element)
+        else:
+            # Атрибути відкриваючого тегу мініфікуємо, вміст - ні
+            opening_end = TAG_RE.match(element).end()
+            parts.append(_minify_tag(element[:opening_end]) + element[opening_end:])
+    markup.append(html[position:])
+    parts.append(_minify_markup(''.join(markup)))
+    return ''.join(parts).strip()
@@ -0,0 +1,94 @@
+"""
+Правові документи: Markdown → безпечний HTML та кеш для відповідей.
+
+HTML рендериться один раз при збереженні документа в адмінці (LegalDocument.save)
+і зберігається в БД разом з номером версії. Запит сторінки бере заголовок, HTML
+та версію з кешу LEGAL_DOCUMENT_CACHE_ALIAS - без розбору Markdown і без запиту
+до БД. Збереження чи видалення документа скидає його запис у кеші.
+"""
+
+import hashlib
+
+import markdown
+import nh3
+from django.conf import settings
+from django.core.cache import caches
+
+# Змінюється разом з шаблоном partials/legal_document.html: старі ETag стають недійсними
+TEMPLATE_VERSION = 1
+
+CACHE_KEY_TEMPLATE = 'legal-document:{}'
+
+MARKDOWN_EXTENSIONS = ['tables', 'sane_lists']
+
+# Теги та атрибути, які лишаються після Markdown (решта, зокрема сирий HTML
+# у вихідному тексті, вирізається)
+ALLOWED_TAGS = {
+    'h2', 'h3', 'h4', 'p', 'br', 'hr', 'strong', 'em', 'code', 'pre', 'blockquote',
+    'ul', 'ol', 'li', 'a', 'table', 'thead', 'tbody', 'tr', 'th', 'td',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title'},
+    'ol': {'start'},
+    'th': {'align'},
+    'td': {'align'},
+}
+ALLOWED_URL_SCHEMES = {'http', 'https', 'mailto', 'tel'}
+
+
+def render_markdown(source):
+    """
+    HTML документа з Markdown.
+
+    Args:
+        source: Текст у Markdown (розділи - ##, ###)
+
+    Returns:
+        Очищений HTML: лише ALLOWED_TAGS, посилання з rel="noopener noreferrer"
+    """
+    html = markdown.markdown(source, extensions=MARKDOWN_EXTENSIONS, output_format='html')
+    return nh3.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes=ALLOWED_URL_SCHEMES,
+    )
+
+
+def _cache():
+    return caches[settings.LEGAL_DOCUMENT_CACHE_ALIAS]
+
+
+def cache_key(slug):
+    return CACHE_KEY_TEMPLATE.format(slug)
+
+
+def get_cached(slug, load):
+    """
+    Документ з кешу, при промаху - з load(slug).
+
+    Args:
+        slug: slug документа
+        load: Функція, що повертає dict (title, html, version) або None
+
+    Returns:
+        dict title, html, version або None, якщо документа немає
+        (відсутність теж кешується - невідомі slug не ходять у БД)
+    """
+    key = cache_key(slug)
+    document = _cache().get(key)
+    if document is None:
+        document = load(slug) or {}
+        _cache().set(key, document, timeout=settings.LEGAL_DOCUMENT_CACHE_TIMEOUT)
+    return document or None
+
+
+def invalidate(slug):
+    """Скидає документ у кеші (після збереження або видалення)."""
+    _cache().delete(cache_key(slug))
+
+
+def document_etag(slug, version):
+    """ETag HTMX відповіді документа: змінюється з кожною версією та шаблоном."""
+    digest = hashlib.blake2b(f'{TEMPLATE_VERSION}:{slug}:{version}'.encode(), digest_size=8)
+    return f'"{digest.hexdigest()}"'
@@ -0,0 +1,221 @@
+"""
+Профілювання пам'яті воркера: знімки tracemalloc, RSS та фоновий семплер.
+
+Все працює в межах одного процесу (воркера gunicorn): знімки та baseline
+не поділяються між воркерами, тому кожен звіт містить PID.
+"""
+
+import gc
+import logging
+import os
+import resource
+import signal
+import threading
+import time
+import tracemalloc
+
+logger = logging.getLogger(__name__)
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def rss_bytes():
+    """
+    Поточний RSS процесу.
+
+    На Linux (Render) читається з /proc/self/statm; на інших системах -
+    пік RSS з getrusage (краще, ніж нічого).
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS повертає байти, Linux - кілобайти
+        return peak if os.uname().sysname == 'Darwin' else peak * 1024
+
+
+def format_bytes(size):
+    sign = '-' if size < 0 else ''
+    size = abs(size)
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{sign}{size:.1f}{unit}' if unit != 'B' else f'{sign}{size}B'
+        size /= 1024
+    return f'{sign}{size:.1f}GB'
+
+
+class MemoryProfiler:
+    """
+    Знімки tracemalloc процесу та їх порівняння з baseline.
+
+    Baseline знімається при start() і може бути скинутий через reset_baseline(),
+    наприклад після прогріву кешів, щоб звіт показував лише подальший ріст.
+    """
+
+    def __init__(self, frames=10):
+        self.frames = frames
+        self.baseline = None
+        self.baseline_rss = None
+        self.baseline_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.reset_baseline()
+
+    def reset_baseline(self):
+        with self._lock:
+            self.baseline = self._snapshot()
+            self.baseline_rss = rss_bytes()
+            self.baseline_at = time.time()
+
+    def _snapshot(self):
+        snapshot = tracemalloc.take_snapshot()
+        # Власні структури tracemalloc та імпорт модулів - шум
+        return snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            tracemalloc.Filter(False, '<unknown>'),
+        ))
+
+    def report(self, limit=20, key_type='lineno'):
+        """
+        Ріст пам'яті відносно baseline.
+
+        Args:
+            limit: Кількість місць алокації у звіті
+            key_type: Групування tracemalloc ('lineno', 'filename', 'traceback')
+
+        Returns:
+            dict: pid, rss/baseline_rss, tracemalloc current/peak, top - місця
+            алокації з найбільшим ростом (size_diff, count_diff, size, count, site)
+        """
+        if not self.active:
+            raise RuntimeError('tracemalloc не запущено: увімкніть MEMORY_PROFILING_ENABLED')
+
+        with self._lock:
+            snapshot = self._snapshot()
+            stats = snapshot.compare_to(self.baseline, key_type)
+            baseline_rss = self.baseline_rss
+            baseline_at = self.baseline_at
+
+        current, peak = tracemalloc.get_traced_memory()
+        top = []
+        for stat in stats[:limit]:
+            # Кадри впорядковані від найстаршого, місце алокації - останній
+            frame = stat.traceback[-1]
+            top.append({
+                'site': f'{frame.filename}:{frame.lineno}',
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+                'size': stat.size,
+                'count': stat.count,
+                'traceback': stat.traceback.format()[-6:] if key_type == 'traceback' else None,
+            })
+        rss = rss_bytes()
+        return {
+            'pid': os.getpid(),
+            'rss': rss,
+            'baseline_rss': baseline_rss,
+            'rss_diff': rss - baseline_rss,
+            'baseline_age_s': round(time.time() - baseline_at, 1),
+            'traced_current': current,
+            'traced_peak': peak,
+            'gc_counts': gc.get_count(),
+            'top': top,
+        }
+
+
+def format_report(report):
+    """Текстова форма звіту MemoryProfiler.report() для логів та text/plain."""
+    lines = [
+        f'PID {report["pid"]}: RSS {format_bytes(report["rss"])} '
+        f'({format_bytes(report["rss_diff"])} за {report["baseline_age_s"]:.0f} с від baseline), '
+        f'tracemalloc {format_bytes(report["traced_current"])} (пік {format_bytes(report["traced_peak"])}), '
+        f'gc {report["gc_counts"]}',
+    ]
+    for entry in report['top']:
+        lines.append(
+            f'  {format_bytes(entry["size_diff"]):>10} {entry["count_diff"]:>+8} об. '
+            f'(всього {format_bytes(entry["size"])}) {entry["site"]}'
+        )
+        for frame_line in entry['traceback'] or []:
+            lines.append(f'      {frame_line}')
+    return '\n'.join(lines)
+
+
+profiler = MemoryProfiler()
+
+
+def install_dump_signal(signal_name, limit=20):
+    """
+    Звіт профілювання в лог по сигналу: kill -USR2 <pid воркера>.
+
+    Обробник лише запускає потік: логування та знімок у самому обробнику
+    можуть заблокуватися на lock, який утримує перерваний код.
+    """
+    signum = getattr(signal, signal_name)
+
+    def dump():
+        try:
+            logger.warning('Memory dump по %s\n%s', signal_name, format_report(profiler.report(limit)))
+        except Exception as e:
+            logger.error('Не вдалося зібрати memory dump: %s', e)
+
+    def handler(signum, frame):
+        threading.Thread(target=dump, name='memory-dump', daemon=True).start()
+
+    try:
+        signal.signal(signum, handler)
+    except ValueError:
+        # signal.signal працює лише в головному потоці (не у всіх серверах так)
+        logger.warning('Memory dump по %s недоступний: застосунок завантажено не в головному потоці', signal_name)
+
+
+class MemorySampler(threading.Thread):
+    """
+    Фоновий семплер RSS та GC воркера.
+
+    Раз на interval секунд пише в лог RSS, зміну від попереднього та першого
+    вимірювання і лічильники GC. Дешевий: без обходу об'єктів і tracemalloc.
+    """
+
+    def __init__(self, interval):
+        super().__init__(name='memory-sampler', daemon=True)
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def sample(self):
+        stats = gc.get_stats()
+        return {
+            'rss': rss_bytes(),
+            'collections': [generation['collections'] for generation in stats],
+            'uncollectable': sum(generation['uncollectable'] for generation in stats),
+        }
+
+    def run(self):
+        first = previous = self.sample()
+        started = time.monotonic()
+        while not self._stopped.wait(self.interval):
+            current = self.sample()
+            logger.info(
+                'memory pid=%d rss=%s delta=%s total_delta=%s uptime=%ds gc_collections=%s gc_uncollectable=%d',
+                os.getpid(),
+                format_bytes(current['rss']),
+                format_bytes(current['rss'] - previous['rss']),
+                format_bytes(current['rss'] - first['rss']),
+                time.monotonic() - started,
+                current['collections'],
+                current['uncollectable'],
+            )
+            previous = current
+
+    def stop(self):
+        self._stopped.set()
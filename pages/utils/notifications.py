@@ -0,0 +1,333 @@
+"""
+Сповіщення про нові заявки: канали з NOTIFIERS та маршрутизація за типом форми.
+
+Канал (аліас у NOTIFIERS) - це бекенд і його OPTIONS, як у CACHES:
+    NOTIFIERS = {
+        'telegram': {'BACKEND': 'pages.utils.notifications.TelegramNotifier', 'TIMEOUT': 10},
+        'sales_email': {
+            'BACKEND': 'pages.utils.notifications.EmailNotifier',
+            'OPTIONS': {'recipients': ['sales@example.com']},
+        },
+    }
+    NOTIFICATION_ROUTES = {'corporate': ['telegram', 'sales_email'], 'default': ['telegram']}
+
+Кожен канал розбиває відправку на окремі доставки (чат, webhook, лист), які
+виконуються паралельно у спільному обмеженому пулі потоків. Запит форми чекає
+кожен канал не довше за його TIMEOUT, тому додатковий канал не додає свою
+затримку до інших.
+"""
+
+import hashlib
+import hmac
+import html
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import requests
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.mail import EmailMessage, get_connection
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.html import strip_tags
+from django.utils.module_loading import import_string
+
+from .telegram import (
+    DEFAULT_TELEGRAM_API_URL,
+    format_consultation_message,
+    format_corporate_message,
+    format_cta_message,
+    format_infidelity_message,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10
+
+# Поля заявки у тілі webhook
+WEBHOOK_LEAD_FIELDS = ('id', 'form_type', 'status', 'name', 'phone', 'email', 'contact', 'message', 'created_at')
+
+_notifiers = {}
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _clean_env(name):
+    """Значення змінної оточення без пробілів та лапок, які можуть потрапити з env."""
+    return os.environ.get(name, '').strip().replace('"', '').replace("'", '')
+
+
+def _mask(value):
+    """Маскування для логів (перші 5 та останні 2 символи)."""
+    return f'{value[:5]}***{value[-2:]}' if len(value) > 7 else '***'
+
+
+class BaseNotifier:
+    """
+    Базовий канал сповіщень.
+
+    Args:
+        alias: Назва каналу в NOTIFIERS (для логів)
+        timeout: Скільки секунд запит форми чекає на доставки каналу
+    """
+
+    def __init__(self, alias, timeout=DEFAULT_TIMEOUT):
+        self.alias = alias
+        self.timeout = timeout
+
+    def deliveries(self, lead, text):
+        """
+        Незалежні доставки сповіщення: виклики без аргументів, що повертають True при успіху.
+
+        Args:
+            lead: Збережена LeadSubmission
+            text: Текст сповіщення в HTML розмітці Telegram (див. format_lead_message)
+        """
+        raise NotImplementedError
+
+
+class TelegramNotifier(BaseNotifier):
+    """
+    Повідомлення в чати Telegram через Bot API, кожен чат - окрема доставка.
+
+    Без OPTIONS налаштування читаються з оточення під час відправки:
+    TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_IDS (через кому) або TELEGRAM_CHAT_ID
+    та TELEGRAM_CHAT_ID_2, TELEGRAM_API_URL. Для кількох ботів - кілька каналів
+    з bot_token та chat_ids в OPTIONS.
+    """
+
+    def __init__(self, alias, timeout=DEFAULT_TIMEOUT, bot_token='', chat_ids=(), api_url=''):
+        super().__init__(alias, timeout)
+        self.bot_token = bot_token
+        self.chat_ids = list(chat_ids)
+        self.api_url = api_url
+
+    def _chat_ids(self):
+        if self.chat_ids:
+            return self.chat_ids
+        chat_ids = [chat_id.strip() for chat_id in _clean_env('TELEGRAM_CHAT_IDS').split(',')]
+        chat_ids += [_clean_env('TELEGRAM_CHAT_ID'), _clean_env('TELEGRAM_CHAT_ID_2')]
+        return list(dict.fromkeys(chat_id for chat_id in chat_ids if chat_id))
+
+    def deliveries(self, lead, text):
+        bot_token = self.bot_token or _clean_env('TELEGRAM_BOT_TOKEN')
+        chat_ids = self._chat_ids()
+        if not bot_token or not chat_ids:
+            logger.warning('%s: TELEGRAM_BOT_TOKEN або TELEGRAM_CHAT_ID не налаштовані', self.alias)
+            return []
+
+        api_url = (self.api_url or os.environ.get('TELEGRAM_API_URL') or DEFAULT_TELEGRAM_API_URL).rstrip('/')
+        url = f'{api_url}/bot{bot_token}/sendMessage'
+        return [lambda chat_id=chat_id: self._send(url, chat_id, text) for chat_id in chat_ids]
+
+    def _send(self, url, chat_id, text):
+        masked_chat = _mask(chat_id)
+        try:
+            response = requests.post(
+                url,
+                json={'chat_id': chat_id, 'text': text, 'parse_mode': 'HTML'},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            response_text = e.response.text if getattr(e, 'response', None) is not None else ''
+            logger.error(
+                'Помилка відправки повідомлення в Telegram (Chat ID: %s): %s Response: %s',
+                masked_chat, e, response_text,
+            )
+            return False
+        logger.info('Повідомлення успішно відправлено в Telegram (Chat ID: %s)', masked_chat)
+        return True
+
+
+class EmailNotifier(BaseNotifier):
+    """
+    Лист отримувачам через EMAIL_BACKEND (SMTP з EMAIL_HOST, EMAIL_PORT...).
+
+    OPTIONS: recipients (список адрес), from_email (за замовчуванням
+    DEFAULT_FROM_EMAIL), subject_prefix.
+    """
+
+    def __init__(self, alias, timeout=DEFAULT_TIMEOUT, recipients=(), from_email=None, subject_prefix='[Поліграф] '):
+        super().__init__(alias, timeout)
+        self.recipients = list(recipients)
+        self.from_email = from_email
+        self.subject_prefix = subject_prefix
+
+    def deliveries(self, lead, text):
+        if not self.recipients:
+            logger.warning('%s: не задано отримувачів листа', self.alias)
+            return []
+        return [lambda: self._send(lead, text)]
+
+    def _send(self, lead, text):
+        message = EmailMessage(
+            subject=f'{self.subject_prefix}{lead.get_form_type_display()}: {lead.name}',
+            body=html.unescape(strip_tags(text)),
+            from_email=self.from_email,
+            to=self.recipients,
+            connection=get_connection(timeout=self.timeout),
+        )
+        try:
+            message.send()
+        except Exception as e:
+            # smtplib та socket кидають різні винятки - жоден не повинен зламати інші канали
+            logger.error('Помилка відправки листа (%s): %s', self.alias, e)
+            return False
+        logger.info('Лист про заявку відправлено (%s)', self.alias)
+        return True
+
+
+class WebhookNotifier(BaseNotifier):
+    """
+    POST JSON {"event": "lead.created", "lead": {...}, "text": "..."} на url.
+
+    З secret тіло підписується: заголовок X-Signature: sha256=<HMAC-SHA256 тіла>.
+    """
+
+    def __init__(self, alias, timeout=DEFAULT_TIMEOUT, url='', secret='', headers=None):
+        super().__init__(alias, timeout)
+        self.url = url
+        self.secret = secret
+        self.headers = dict(headers or {})
+
+    def deliveries(self, lead, text):
+        if not self.url:
+            logger.warning('%s: не задано url webhook', self.alias)
+            return []
+        payload = {
+            'event': 'lead.created',
+            'lead': {field: getattr(lead, field) for field in WEBHOOK_LEAD_FIELDS},
+            'text': html.unescape(strip_tags(text)),
+        }
+        body = json.dumps(payload, cls=DjangoJSONEncoder, ensure_ascii=False).encode('utf-8')
+        return [lambda: self._send(body)]
+
+    def _send(self, body):
+        headers = {'Content-Type': 'application/json; charset=utf-8', **self.headers}
+        if self.secret:
+            signature = hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+            headers['X-Signature'] = f'sha256={signature}'
+        try:
+            response = requests.post(self.url, data=body, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error('Помилка відправки webhook (%s): %s', self.alias, e)
+            return False
+        logger.info('Webhook про заявку відправлено (%s)', self.alias)
+        return True
+
+
+@receiver(setting_changed)
+def _reset_notifiers(setting, **kwargs):
+    if setting in ('NOTIFIERS', 'NOTIFICATION_ROUTES'):
+        _notifiers.clear()
+
+
+def get_notifier(alias):
+    """Канал з NOTIFIERS (створюється один раз на процес)."""
+    notifier = _notifiers.get(alias)
+    if notifier is None:
+        try:
+            config = settings.NOTIFIERS[alias]
+        except KeyError:
+            raise ImproperlyConfigured(f'Канал сповіщень {alias!r} відсутній у NOTIFIERS')
+        backend = import_string(config['BACKEND'])
+        try:
+            notifier = backend(alias, timeout=config.get('TIMEOUT', DEFAULT_TIMEOUT), **config.get('OPTIONS', {}))
+        except TypeError as e:
+            raise ImproperlyConfigured(f'NOTIFIERS[{alias!r}]: некоректні OPTIONS: {str(e)}')
+        _notifiers[alias] = notifier
+    return notifier
+
+
+def route(form_type):
+    """Аліаси каналів для типу форми (NOTIFICATION_ROUTES, інакше 'default')."""
+    routes = settings.NOTIFICATION_ROUTES
+    return routes.get(form_type, routes.get('default', []))
+
+
+def _get_executor():
+    # Пул створюється при першій заявці, тобто вже у воркері gunicorn, а не до fork
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.NOTIFICATION_MAX_WORKERS,
+                thread_name_prefix='notify',
+            )
+        return _executor
+
+
+def dispatch(lead, text, aliases):
+    """
+    Паралельна відправка в канали.
+
+    Args:
+        lead: Збережена LeadSubmission
+        text: Текст сповіщення (HTML розмітка Telegram)
+        aliases: Канали з NOTIFIERS
+
+    Returns:
+        dict: аліас → True, якщо хоча б одна доставка каналу вдалася
+    """
+    started = time.monotonic()
+    pending = []
+    results = {}
+    for alias in aliases:
+        notifier = get_notifier(alias)
+        results[alias] = False
+        for delivery in notifier.deliveries(lead, text):
+            pending.append((notifier, _get_executor().submit(delivery)))
+
+    for notifier, future in pending:
+        remaining = max(started + notifier.timeout - time.monotonic(), 0)
+        try:
+            delivered = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            # Доставка продовжиться у фоні, але заявка не чекає довше за TIMEOUT каналу
+            logger.warning('%s: доставка не завершилась за %s с', notifier.alias, notifier.timeout)
+            delivered = False
+        except Exception as e:
+            logger.error('%s: помилка доставки: %s', notifier.alias, e)
+            delivered = False
+        results[notifier.alias] = results[notifier.alias] or delivered
+    return results
+
+
+def format_lead_message(lead):
+    """Текст сповіщення для заявки за її типом форми."""
+    if lead.form_type == 'consultation':
+        return format_consultation_message(lead.name, lead.contact, lead.message)
+    if lead.form_type == 'cta':
+        return format_cta_message(lead.name, lead.phone, lead.email, lead.message)
+    if lead.form_type == 'infidelity':
+        return format_infidelity_message(lead.name, lead.phone)
+    return format_corporate_message(lead.name, lead.phone)
+
+
+def notify_lead(lead):
+    """
+    Сповіщення про заявку в канали її типу форми.
+
+    При успіху хоча б в одному каналі заявка позначається відправленою
+    (telegram_sent, telegram_sent_at) - інакше вона лишається в
+    LeadSubmission.objects.pending_telegram().
+
+    Returns:
+        True, якщо сповіщення дійшло хоча б в один канал
+    """
+    results = dispatch(lead, format_lead_message(lead), route(lead.form_type))
+    if not any(results.values()):
+        return False
+    lead.telegram_sent = True
+    lead.telegram_sent_at = timezone.now()
+    lead.save(update_fields=['telegram_sent', 'telegram_sent_at', 'updated_at'])
+    return True
@@ -0,0 +1,158 @@
+"""
+Віддача файлів з підтримкою HTTP Range (206 Partial Content).
+
+Відповідь будується на FileResponse, тому під gunicorn файл віддається через
+wsgi.file_wrapper + sendfile (zero-copy): gunicorn бере поточну позицію
+дескриптора та Content-Length, тобто надсилає рівно запитаний діапазон.
+"""
+
+import io
+import os
+import re
+
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def parse_range_header(header: str, size: int):
+    """
+    Розбирає заголовок Range для файлу розміром size.
+
+    Підтримується лише один діапазон; для кількох діапазонів або
+    некоректного синтаксису повертається None (віддаємо файл повністю, RFC 9110).
+
+    Args:
+        header: Значення заголовка Range
+        size: Розмір файлу в байтах
+
+    Returns:
+        (start, end) включно, None якщо заголовок треба ігнорувати,
+        або False якщо діапазон незадовільний (416)
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Суфіксний діапазон: останні N байтів
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    if start >= size:
+        return False
+    end = int(last) if last else size - 1
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+class FileRange:
+    """File-like обгортка, що обмежує читання діапазоном [start, start + length)."""
+
+    def __init__(self, file, start: int, length: int):
+        self._file = file
+        self._start = start
+        self._length = length
+        self._position = 0
+        file.seek(start)
+
+    def read(self, size=-1):
+        remaining = self._length - self._position
+        if remaining <= 0:
+            return b''
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        data = self._file.read(size)
+        self._position += len(data)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._length
+        self._position = max(0, min(offset, self._length))
+        self._file.seek(self._start + self._position)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def close(self):
+        self._file.close()
+
+
+def ranged_file_response(request, path: str, content_type: str, max_age: int = 0):
+    """
+    Віддає файл з підтримкою Range, If-Range та умовних запитів.
+
+    Args:
+        request: Django HttpRequest
+        path: Абсолютний шлях до файлу
+        content_type: MIME тип відповіді
+        max_age: Cache-Control max-age у секундах
+
+    Returns:
+        FileResponse (200/206), HttpResponse 416 або 304
+    """
+    stat = os.stat(path)
+    size = stat.st_size
+    etag = f'"{int(stat.st_mtime):x}-{size:x}"'
+    last_modified = http_date(stat.st_mtime)
+
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(stat.st_mtime),
+    )
+    if response is not None:
+        return response
+
+    byte_range = None
+    range_header = request.headers.get('Range')
+    if range_header and _if_range_matches(request, etag, stat.st_mtime):
+        byte_range = parse_range_header(range_header, size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+    else:
+        file = open(path, 'rb')
+        if byte_range:
+            start, end = byte_range
+            response = FileResponse(FileRange(file, start, end - start + 1), content_type=content_type)
+            response.status_code = 206
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        else:
+            response = FileResponse(file, content_type=content_type)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = last_modified
+    if max_age:
+        patch_cache_control(response, public=True, max_age=max_age)
+    return response
+
+
+def _if_range_matches(request, etag: str, mtime: float) -> bool:
+    """If-Range: діапазон застосовується лише якщо файл не змінився."""
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith('"') or if_range.startswith('W/'):
+        return if_range == etag
+    since = parse_http_date_safe(if_range)
+    return since is not None and int(mtime) <= since
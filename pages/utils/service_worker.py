@@ -0,0 +1,96 @@
+"""
+Дані для service worker (/sw.js).
+
+Список precache будується з маніфестів build_assets (CSS/JS бандли, HTMX,
+WOFF2 шрифти), тож після collectstatic це хешовані URL з static storage.
+Версія SW - хеш цих URL та вмісту файлів: будь-яка зміна асетів дає нову
+версію, браузер встановлює новий SW, а старі кеші видаляються.
+"""
+
+import hashlib
+import json
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.urls import reverse
+
+from pages.assets.bundles import MANIFEST_NAME as BUNDLES_MANIFEST
+from pages.assets.fonts import MANIFEST_NAME as FONTS_MANIFEST
+from pages.assets.manifest import load_manifest
+from pages.assets.vendor import MANIFEST_NAME as VENDOR_MANIFEST
+
+# Кеш хешів вмісту: static шлях → (mtime, digest)
+_digest_cache = {}
+
+
+def precache_static_paths() -> list:
+    """
+    Static шляхи, які SW кешує під час встановлення.
+
+    Якщо build_assets не запускався - оригінальні файли бандлів з ASSET_BUNDLES.
+
+    Returns:
+        Відсортований список static шляхів без STATIC_URL
+    """
+    paths = set()
+    bundles = load_manifest(BUNDLES_MANIFEST)
+    for name, config in settings.ASSET_BUNDLES.items():
+        entry = bundles.get(name, {})
+        for kind in ('css', 'js'):
+            if entry.get(kind):
+                paths.add(entry[kind])
+            else:
+                paths.update(config.get(kind, []))
+
+    htmx = load_manifest(VENDOR_MANIFEST).get('htmx')
+    if htmx:
+        paths.add(htmx['path'])
+
+    for entry in load_manifest(FONTS_MANIFEST).values():
+        if entry.get('preload'):
+            paths.add(entry['path'])
+
+    return sorted(paths)
+
+
+def _file_digest(path: str) -> str:
+    absolute_path = finders.find(path)
+    if not absolute_path:
+        return ''
+    mtime = os.stat(absolute_path).st_mtime
+    cached = _digest_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(absolute_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    _digest_cache[path] = (mtime, digest)
+    return digest
+
+
+def get_service_worker_config() -> dict:
+    """
+    Конфігурація, що вбудовується в шаблон sw.js.
+
+    Returns:
+        version, precache (static URL), routes (prerender сторінки), offline_url
+    """
+    paths = precache_static_paths()
+    static_urls = [static(path) for path in paths]
+    routes = [reverse(name) for name in settings.SERVICE_WORKER_ROUTES]
+    offline_url = reverse(settings.SERVICE_WORKER_OFFLINE_ROUTE)
+
+    version = hashlib.sha256()
+    for path, url in zip(paths, static_urls):
+        # Хешоване ім'я вже відображає вміст; в розробці хешуємо сам файл
+        version.update(f'{url}:{_file_digest(path)}\n'.encode())
+    version.update(json.dumps([routes, offline_url]).encode())
+
+    return {
+        'version': version.hexdigest()[:12],
+        'precache': static_urls,
+        'routes': routes,
+        'offline_url': offline_url,
+        'static_url': settings.STATIC_URL,
+    }
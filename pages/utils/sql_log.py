@@ -0,0 +1,128 @@
+"""
+Логування повільних SQL запитів (SlowQueryLogMiddleware) та спільні допоміжні
+функції: нормалізація SQL і місце виклику запиту в коді проекту.
+"""
+
+import json
+import logging
+import os
+import re
+import sys
+import time
+
+from django.conf import settings
+
+# Числа та рядкові літерали замінюються, щоб однакові запити групувалися (N+1)
+SQL_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+SQL_IN_LIST_RE = re.compile(r'IN \((?:\s*(?:%s|\?|#)\s*,?)+\)')
+
+# Внутрішні модулі ORM: місцем виклику вважається перший кадр поза ними
+ORM_PATHS = tuple(
+    os.sep.join(('django', *parts)) + os.sep
+    for parts in (('db',), ('utils',), ('test',))
+)
+
+# Рядок логу повільного запиту: префікс + JSON (читає команда slow_queries)
+SLOW_QUERY_LOG_PREFIX = 'slow_query '
+
+_THIS_FILE = os.path.abspath(__file__)
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_sql(sql: str) -> str:
+    """SQL без конкретних значень: для групування однакових запитів."""
+    sql = SQL_LITERAL_RE.sub('#', sql)
+    return SQL_IN_LIST_RE.sub('IN (...)', sql)
+
+
+def _is_orm_frame(filename: str) -> bool:
+    return any(part in filename for part in ORM_PATHS)
+
+
+def _short_path(filename: str, base_dir: str) -> str:
+    if 'site-packages' in filename:
+        return filename.split('site-packages' + os.sep, 1)[1]
+    if filename.startswith(base_dir):
+        return os.path.relpath(filename, base_dir)
+    return filename
+
+
+def project_origin(limit: int = 3, skip_files=()) -> list:
+    """
+    Місце виклику запиту: найближчий кадр поза ORM та кадри коду проекту.
+
+    Перший елемент - код, що звернувся до ORM (view, admin, сесії), далі -
+    кадри проекту. Ланцюжок middleware (__call__) та сам інструмент
+    вимірювання пропускаються.
+
+    Args:
+        limit: Максимальна кількість кадрів
+        skip_files: Абсолютні шляхи файлів інструментів вимірювання, кадри яких пропускаються
+
+    Returns:
+        Список рядків 'pages/views.py:123 in index_view' (найглибший перший)
+    """
+    base_dir = str(settings.BASE_DIR)
+    origin = []
+    caller_found = False
+    # Обхід кадрів напряму: traceback.extract_stack читає ще й рядки коду
+    frame = sys._getframe(1)
+    while frame is not None and len(origin) < limit:
+        code = frame.f_code
+        filename = os.path.abspath(code.co_filename)
+        lineno = frame.f_lineno
+        frame = frame.f_back
+        if filename == _THIS_FILE or filename in skip_files or _is_orm_frame(filename):
+            continue
+        # venv всередині проекту теж містить site-packages
+        in_project = filename.startswith(base_dir) and 'site-packages' not in filename
+        if caller_found and (not in_project or code.co_name == '__call__'):
+            continue
+        caller_found = True
+        origin.append(f'{_short_path(filename, base_dir)}:{lineno} in {code.co_name}')
+    return origin
+
+
+def _params_count(params, many):
+    if not params:
+        return 0
+    if many:
+        params = next(iter(params), ())
+    return len(params)
+
+
+class SlowQueryLogger:
+    """
+    execute_wrapper, що логує запити, довші за поріг.
+
+    Запис логу - JSON: нормалізований SQL, кількість параметрів, тривалість,
+    місце виклику (project_origin) та шлях запиту. Стек збирається лише для
+    повільних запитів, тому для решти накладні витрати - два perf_counter().
+    """
+
+    def __init__(self, threshold_ms, path=None):
+        self.threshold = threshold_ms / 1000
+        self.path = path
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            if duration >= self.threshold:
+                self._log(sql, params, many, duration, context)
+
+    def _log(self, sql, params, many, duration, context):
+        entry = {
+            'sql': normalize_sql(sql),
+            'params': _params_count(params, many),
+            'duration_ms': round(1000 * duration, 1),
+            'origin': project_origin(),
+            'path': self.path,
+            'db': context['connection'].alias,
+        }
+        if many:
+            entry['batch'] = len(params) if hasattr(params, '__len__') else None
+        logger.warning('%s%s', SLOW_QUERY_LOG_PREFIX, json.dumps(entry, ensure_ascii=False))
@@ -4,25 +4,47 @@ Views для сторінок сайту.
 """
 
 import logging
-import traceback
+import os
 import json
+from django.conf import settings
+from django.contrib.auth.views import redirect_to_login
+from django.contrib.sitemaps.views import sitemap
 from django.shortcuts import render
-from django.http import HttpResponse, HttpResponseServerError, JsonResponse
-from django.utils import timezone
+from django.urls import reverse
+from django.http import Http404, HttpResponse, HttpResponseRedirect, HttpResponseServerError, JsonResponse
+from django.templatetags.static import static
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.safestring import mark_safe
+from django.views.decorators.cache import cache_page, never_cache
+from django.views.decorators.http import require_http_methods
+from django.views.decorators.vary import vary_on_headers
+from .assets.icons import MANIFEST_NAME as ICONS_MANIFEST
+from .assets.manifest import load_manifest
 from .forms import ConsultationForm, CTAContactForm, InfidelityCheckForm, CorporateServicesForm
-from .models import LeadSubmission
+from .models import LeadSubmission, LegalDocument
+from .sitemaps import SITEMAPS
 from .utils import get_client_ip
-from .utils.telegram import (
-    send_telegram_message,
-    format_consultation_message,
-    format_cta_message,
-    format_infidelity_message,
-    format_corporate_message,
+from .utils.form_guard import TOKEN_FIELD, refresh_token, token_input
+from .utils.health import readiness
+from .utils.legal import document_etag
+from .utils.change_feed import (
+    decode_cursor,
+    encode_cursor,
+    is_authorized,
+    load_leads,
+    page_etag,
+    page_keys,
+    parse_limit,
 )
+from .utils.memory import format_report, profiler
+from .utils.ranges import ranged_file_response
+from .utils.service_worker import get_service_worker_config
+from .utils.notifications import notify_lead
 
 logger = logging.getLogger(__name__)
 
 
+@vary_on_headers('HX-Request')
 def index_view(request):
     """Ознайомча сторінка"""
     try:
@@ -67,19 +89,13 @@ def index_view(request):
                     user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
                 )
                 
-                # Форматуємо та відправляємо повідомлення в Telegram
-                telegram_text = format_cta_message(name, phone, email, message)
-                telegram_sent = send_telegram_message(telegram_text)
-                
-                if telegram_sent:
-                    lead.telegram_sent = True
-                    lead.telegram_sent_at = timezone.now()
-                    lead.save()
-                    logger.info(f'CTA форма отримана і відправлена в Telegram: {name}, {phone}, {email}')
+                # Сповіщення в канали цього типу форми (паралельно, NOTIFICATION_ROUTES)
+                if notify_lead(lead):
+                    logger.info('CTA форма отримана і відправлена: %s, %s, %s', name, phone, email)
                 else:
-                    logger.warning(f'Не вдалося відправити CTA форму в Telegram: {name}, {phone}, {email}')
+                    logger.warning('Не вдалося відправити CTA форму: %s, %s, %s', name, phone, email)
                 
-                # Повертаємо успішне повідомлення (незалежно від результату Telegram)
+                # Повертаємо успішне повідомлення (незалежно від результату сповіщень)
                 success_html = '''
                 <div class="cta__form-success">
                     <strong>Дякуємо!</strong> Ваша заявка прийнята. Ми зв'яжемося з вами найближчим часом.
@@ -93,6 +109,10 @@ def index_view(request):
                     for error in errors:
                         errors_html += f'<p>{error}</p>'
                 errors_html += '</div>'
+                fresh_token = form.fresh_token()
+                if fresh_token:
+                    # Новий токен замінює застарілий у формі (hx-swap-oob), введені дані лишаються
+                    errors_html += token_input('cta', fresh_token, oob=True)
                 return HttpResponse(errors_html, status=422)
         
         # Перевірка HTMX запиту для навігації
@@ -101,12 +121,12 @@ def index_view(request):
         
         return render(request, 'index.html', context)
     except Exception as e:
-        logger.error(f'Error in index_view: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in index_view: %s', e)
         # Повертаємо просту помилку замість 500
         return HttpResponseServerError(f'Server error: {str(e)}')
 
 
+@vary_on_headers('HX-Request')
 def about_view(request):
     """Сторінка про нас з 3 акордеон-блоками: Послуги, Поліграфолог, Обладнання"""
     try:
@@ -284,11 +304,11 @@ def about_view(request):
         
         return render(request, 'about.html', context)
     except Exception as e:
-        logger.error(f'Error in about_view: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in about_view: %s', e)
         return HttpResponseServerError(f'Server error: {str(e)}')
 
 
+@vary_on_headers('HX-Request')
 def contacts_view(request):
     """Сторінка контактів з контактною інформацією та Google картою (sticky overlay)"""
     try:
@@ -327,8 +347,7 @@ def contacts_view(request):
         
         return render(request, 'contacts.html', context)
     except Exception as e:
-        logger.error(f'Error in contacts_view: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in contacts_view: %s', e)
         return HttpResponseServerError(f'Server error: {str(e)}')
 
 
@@ -354,19 +373,13 @@ def consultation_view(request):
             user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
         )
         
-        # Форматуємо та відправляємо повідомлення в Telegram
-        telegram_text = format_consultation_message(name, contact, comment)
-        telegram_sent = send_telegram_message(telegram_text)
-        
-        if telegram_sent:
-            lead.telegram_sent = True
-            lead.telegram_sent_at = timezone.now()
-            lead.save()
-            logger.info(f'Консультація отримана і відправлена в Telegram: {name}, {contact}')
+        # Сповіщення в канали цього типу форми (паралельно, NOTIFICATION_ROUTES)
+        if notify_lead(lead):
+            logger.info('Консультація отримана і відправлена: %s, %s', name, contact)
         else:
-            logger.warning(f'Не вдалося відправити консультацію в Telegram: {name}, {contact}')
+            logger.warning('Не вдалося відправити консультацію: %s, %s', name, contact)
         
-        # Повертаємо успішне повідомлення (незалежно від результату Telegram)
+        # Повертаємо успішне повідомлення (незалежно від результату сповіщень)
         success_html = '''
         <div class="footer__form-success">
             <strong>Дякуємо!</strong> Ваша заявка прийнята. Ми зв'яжемося з вами найближчим часом.
@@ -380,62 +393,262 @@ def consultation_view(request):
             for error in errors:
                 errors_html += f'<p>{error}</p>'
         errors_html += '</div>'
+        fresh_token = form.fresh_token()
+        if fresh_token:
+            # Новий токен замінює застарілий у формі (hx-swap-oob), введені дані лишаються
+            errors_html += token_input('consultation', fresh_token, oob=True)
         return HttpResponse(errors_html, status=422)
 
 
+# guard_scope форм, для яких видається токен (form_token_view)
+FORM_GUARD_SCOPES = {
+    form.guard_scope for form in (ConsultationForm, CTAContactForm, InfidelityCheckForm, CorporateServicesForm)
+}
+
+
+@never_cache
+@require_http_methods(['GET'])
+def form_token_view(request, scope):
+    """
+    Свіжий токен фільтра ботів для форми scope.
+
+    Запитується при першому фокусі форми: сторінка могла бути відкрита давно
+    або прийти з кешу з уже використаним або простроченим токеном. Час рендерингу
+    береться з поточного токена (?form_token=...). HTMX отримує поле для заміни,
+    JS лендінгів - JSON {"form_token": ...}.
+    """
+    if scope not in FORM_GUARD_SCOPES:
+        raise Http404('Форму не знайдено')
+    token = refresh_token(scope, request.GET.get(TOKEN_FIELD))
+    if request.headers.get('HX-Request'):
+        return HttpResponse(token_input(scope, token))
+    return JsonResponse({'form_token': token})
+
+
+@vary_on_headers('HX-Request')
 def legal_document_view(request, slug):
-    """Універсальний view для правових документів (заглушки)"""
+    """
+    Правовий документ з LegalDocument.
+
+    HTML рендериться при збереженні в адмінці, тут - лише з кешу (без Markdown і БД).
+    HTMX відповідь має ETag версії документа: повторний перехід отримує 304.
+    Повна сторінка ETag не має - footer містить одноразовий токен форми.
+    """
+    document = LegalDocument.objects.get_cached(slug)
+    if document is None:
+        raise Http404('Документ не знайдено')
+
     try:
-        # Мапінг slug → назва документа
-        documents = {
-            'public-offer': 'Публічна оферта',
-            'privacy-policy': 'Політика конфіденційності',
-            'cookie-policy': 'Політика використання cookies',
-            'consent-pd': 'Згода на обробку персональних даних',
-            'disclaimer': 'Відмова від відповідальності',
-        }
-        
-        document_title = documents.get(slug, 'Правовий документ')
-        
         context = {
-            'title': document_title,
-            'document_title': document_title,
+            'title': document['title'],
+            'document_title': document['title'],
+            'document_html': mark_safe(document['html']),
             'slug': slug,
         }
         
         # Перевірка HTMX запиту
         if request.headers.get('HX-Request'):
-            return render(request, 'partials/legal_document.html', context)
+            etag = document_etag(slug, document['version'])
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = render(request, 'partials/legal_document.html', context)
+            response['ETag'] = etag
+            # Браузер може зберігати відповідь, але перевіряє версію при кожному переході
+            patch_cache_control(response, no_cache=True)
+            return response
         
         return render(request, 'legal_document.html', context)
     except Exception as e:
-        logger.error(f'Error in legal_document_view: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in legal_document_view: %s', e)
         return HttpResponseServerError(f'Server error: {str(e)}')
 
 
 def health_check(request):
-    """Простий health check для Render"""
+    """Liveness: процес відповідає. Без звернень до БД та кешу"""
     from django.http import JsonResponse
     return JsonResponse({'status': 'ok'}, status=200)
 
 
+@never_cache
+@require_http_methods(['GET', 'HEAD'])
+def health_ready_view(request):
+    """
+    Readiness для балансувальника Render: 503, якщо БД, міграції чи кеш не готові.
+    Проби кешуються на HEALTH_CACHE_SECONDS і мають таймаут (pages.utils.health).
+    """
+    result = readiness()
+    return JsonResponse(
+        {'status': 'ok' if result['ready'] else 'fail', **result},
+        status=200 if result['ready'] else 503,
+        json_dumps_params={'ensure_ascii': False},
+    )
+
+
+@never_cache
+@require_http_methods(['GET', 'POST'])
+def memory_profile_view(request):
+    """
+    Звіт профілювання пам'яті воркера, що обробив запит (лише для персоналу).
+
+    Доступний тільки з MEMORY_PROFILING_ENABLED, інакше 404.
+    Параметри: ?limit=N, ?group=lineno|filename|traceback, ?format=json.
+    Новий baseline - POST (з CSRF токеном): ?reset=1 показує форму підтвердження,
+    а звіт після скидання повертає той самий воркер. Різні запити можуть потрапити
+    на різні воркери - дивіться PID.
+    """
+    if not settings.MEMORY_PROFILING_ENABLED or not profiler.active:
+        raise Http404()
+    if not (request.user.is_active and request.user.is_staff):
+        return redirect_to_login(request.get_full_path(), reverse('admin:login'))
+
+    params = request.POST if request.method == 'POST' else request.GET
+    if request.method == 'POST':
+        profiler.reset_baseline()
+    elif request.GET.get('reset'):
+        # GET не змінює стан: prefetch чи сторонне посилання не скине baseline
+        return render(request, 'debug/memory_reset.html', {
+            'params': {name: params[name] for name in ('limit', 'group', 'format') if params.get(name)},
+            'pid': os.getpid(),
+        })
+
+    group = params.get('group', 'lineno')
+    if group not in ('lineno', 'filename', 'traceback'):
+        group = 'lineno'
+    try:
+        limit = min(max(int(params.get('limit', settings.MEMORY_PROFILING_TOP)), 1), 200)
+    except ValueError:
+        limit = settings.MEMORY_PROFILING_TOP
+
+    report = profiler.report(limit, group)
+    if params.get('format') == 'json':
+        return JsonResponse(report)
+    return HttpResponse(format_report(report), content_type='text/plain; charset=utf-8')
+
+
+@require_http_methods(['GET', 'HEAD'])
+def lead_changes_view(request):
+    """
+    Стрічка змін заявок для CRM (JSON, Authorization: Bearer <CRM_FEED_TOKENS>).
+
+    ?cursor=<next_cursor попередньої відповіді>&limit=N. Повертає заявки,
+    змінені після курсора, у порядку (updated_at, id); клієнт зберігає
+    next_cursor і з has_more=true одразу запитує наступну сторінку.
+    Повторний запит з If-None-Match отримує 304 без читання рядків заявок.
+    Вимкнена (404), якщо CRM_FEED_TOKENS порожній.
+    """
+    if not settings.CRM_FEED_TOKENS:
+        raise Http404()
+    if not is_authorized(request):
+        response = JsonResponse({'error': 'Потрібен токен доступу'}, status=401)
+        response['WWW-Authenticate'] = 'Bearer'
+        return response
+
+    cursor = request.GET.get('cursor', '')
+    try:
+        position = decode_cursor(cursor)
+        limit = parse_limit(request.GET.get('limit'))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    keys = page_keys(position, limit)
+    etag = page_etag(cursor, limit, keys)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        page = keys[:limit]
+        response = JsonResponse({
+            'results': load_leads(page),
+            'next_cursor': encode_cursor(*page[-1]) if page else (cursor or None),
+            'has_more': len(keys) > limit,
+        }, json_dumps_params={'ensure_ascii': False})
+    response['ETag'] = etag
+    # Клієнт завжди перепитує, але з ETag відповідь без змін - порожній 304
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ('Authorization',))
+    return response
+
+
+@require_http_methods(['GET', 'HEAD'])
 def favicon_view(request):
-    """Редірект на іконку або порожня відповідь"""
-    from django.http import HttpResponseRedirect
-    return HttpResponseRedirect('/static/img/poli.png')
+    """
+    favicon.ico з build_assets (16/32/48 px в одному файлі).
+    Адреса без хешу, тому кешується на ICON_CACHE_MAX_AGE, а не назавжди.
+    """
+    favicon = load_manifest(ICONS_MANIFEST).get('favicon')
+    if not favicon:
+        # build_assets ще не запускався - вихідне зображення
+        return HttpResponseRedirect(static(settings.ICON_SOURCE))
+    path = os.path.join(settings.ASSET_BUILD_STATIC_DIR, favicon)
+    return ranged_file_response(request, path, 'image/x-icon', max_age=settings.ICON_CACHE_MAX_AGE)
+
+
+@require_http_methods(['GET', 'HEAD'])
+def web_manifest(request):
+    """Web app manifest з іконками build_assets (Android, "Додати на головний екран")."""
+    icons = load_manifest(ICONS_MANIFEST).get('icons', [])
+    response = JsonResponse({
+        'name': settings.WEB_MANIFEST_NAME,
+        'short_name': settings.WEB_MANIFEST_NAME,
+        'start_url': reverse('pages:index'),
+        'display': 'browser',
+        'background_color': settings.ICON_BACKGROUND,
+        'theme_color': settings.ICON_BACKGROUND,
+        'icons': [
+            {'src': static(name), 'sizes': f'{size}x{size}', 'type': 'image/png'}
+            for size, name in icons
+        ],
+    }, content_type='application/manifest+json', json_dumps_params={'ensure_ascii': False})
+    patch_cache_control(response, public=True, max_age=settings.ICON_CACHE_MAX_AGE)
+    return response
+
 
+def _absolute_url(request, path):
+    """Абсолютна адреса зі схемою SITEMAP_PROTOCOL (за проксі запит приходить по http)."""
+    return f'{settings.SITEMAP_PROTOCOL or request.scheme}://{request.get_host()}{path}'
 
+
+@require_http_methods(['GET', 'HEAD'])
+@cache_page(settings.ROBOTS_CACHE_TIMEOUT)
 def robots_txt(request):
-    """Повертає 404 для robots.txt (немає файлу)"""
-    from django.http import HttpResponseNotFound
-    return HttpResponseNotFound()
+    """robots.txt: службові адреси закриті від індексації, посилання на sitemap."""
+    return render(
+        request,
+        'robots.txt',
+        {'sitemap_url': _absolute_url(request, reverse('pages:sitemap'))},
+        content_type='text/plain; charset=utf-8',
+    )
+
+
+@require_http_methods(['GET', 'HEAD'])
+@cache_page(settings.SITEMAP_CACHE_TIMEOUT)
+def sitemap_xml(request):
+    """sitemap.xml: публічні сторінки та правові документи (pages.sitemaps)."""
+    return sitemap(request, sitemaps=SITEMAPS)
 
 
+@require_http_methods(['GET', 'HEAD'])
 def sw_js(request):
-    """Повертає 404 для sw.js (немає service worker)"""
-    from django.http import HttpResponseNotFound
-    return HttpResponseNotFound()
+    """
+    Service worker, згенерований з маніфестів static асетів.
+    no-cache: браузер перевіряє оновлення SW при кожній навігації.
+    """
+    config = get_service_worker_config()
+    response = render(
+        request,
+        'sw.js',
+        {'config_json': json.dumps(config)},
+        content_type='application/javascript; charset=utf-8',
+    )
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+@vary_on_headers('HX-Request')
+def offline_view(request):
+    """Offline сторінка, яку service worker віддає без мережі"""
+    context = {'title': 'Немає з\'єднання'}
+    if request.headers.get('HX-Request'):
+        return render(request, 'partials/offline_content.html', context)
+    return render(request, 'offline.html', context)
 
 
 def infidelity_landing_view(request):
@@ -449,8 +662,7 @@ def infidelity_landing_view(request):
         }
         return render(request, 'infidelity_landing.html', context)
     except Exception as e:
-        logger.error(f'Error in infidelity_landing_view: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in infidelity_landing_view: %s', e)
         return HttpResponseServerError(f'Server error: {str(e)}')
 
 
@@ -475,32 +687,29 @@ def infidelity_form_submit(request):
                 user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
             )
             
-            # Форматуємо та відправляємо повідомлення в Telegram
-            telegram_text = format_infidelity_message(name, phone)
-            telegram_sent = send_telegram_message(telegram_text)
-            
-            if telegram_sent:
-                lead.telegram_sent = True
-                lead.telegram_sent_at = timezone.now()
-                lead.save()
-                logger.info(f'Заявка з лендінгу зради отримана і відправлена в Telegram: {name}, {phone}')
+            # Сповіщення в канали цього типу форми (паралельно, NOTIFICATION_ROUTES)
+            if notify_lead(lead):
+                logger.info('Заявка з лендінгу зради отримана і відправлена: %s, %s', name, phone)
             else:
-                logger.warning(f'Не вдалося відправити заявку з лендінгу в Telegram: {name}, {phone}')
+                logger.warning('Не вдалося відправити заявку з лендінгу: %s, %s', name, phone)
             
-            # Повертаємо успішне повідомлення (незалежно від результату Telegram)
+            # Повертаємо успішне повідомлення (незалежно від результату сповіщень)
             return JsonResponse({'success': True, 'message': 'Заявку отримано!'}, status=200)
         else:
             # Повертаємо помилки валідації
             errors = {}
             for field, field_errors in form.errors.items():
-                if field != 'honeypot':
-                    errors[field] = field_errors[0] if field_errors else 'Помилка валідації'
+                errors[field] = field_errors[0] if field_errors else 'Помилка валідації'
             
-            return JsonResponse({'success': False, 'errors': errors}, status=422)
+            response_data = {'success': False, 'errors': errors}
+            fresh_token = form.fresh_token()
+            if fresh_token:
+                # Скрипт лендінгу підставляє новий токен у форму для повторної відправки
+                response_data['form_token'] = fresh_token
+            return JsonResponse(response_data, status=422)
     
     except Exception as e:
-        logger.error(f'Error in infidelity_form_submit: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in infidelity_form_submit: %s', e)
         return JsonResponse({'success': False, 'error': 'Server error'}, status=500)
 
 
@@ -515,8 +724,7 @@ def corporate_landing_view(request):
         }
         return render(request, 'corporate_landing.html', context)
     except Exception as e:
-        logger.error(f'Error in corporate_landing_view: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in corporate_landing_view: %s', e)
         return HttpResponseServerError(f'Server error: {str(e)}')
 
 
@@ -541,32 +749,29 @@ def corporate_form_submit(request):
                 user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
             )
             
-            # Форматуємо та відправляємо повідомлення в Telegram
-            telegram_text = format_corporate_message(name, phone)
-            telegram_sent = send_telegram_message(telegram_text)
-            
-            if telegram_sent:
-                lead.telegram_sent = True
-                lead.telegram_sent_at = timezone.now()
-                lead.save()
-                logger.info(f'Заявка з корпоративного лендінгу отримана і відправлена в Telegram: {name}, {phone}')
+            # Сповіщення в канали цього типу форми (паралельно, NOTIFICATION_ROUTES)
+            if notify_lead(lead):
+                logger.info('Заявка з корпоративного лендінгу отримана і відправлена: %s, %s', name, phone)
             else:
-                logger.warning(f'Не вдалося відправити корпоративну заявку в Telegram: {name}, {phone}')
+                logger.warning('Не вдалося відправити корпоративну заявку: %s, %s', name, phone)
             
-            # Повертаємо успішне повідомлення (незалежно від результату Telegram)
+            # Повертаємо успішне повідомлення (незалежно від результату сповіщень)
             return JsonResponse({'success': True, 'message': 'Дякуємо! Ваша заявка успішно відправлена.'}, status=200)
         else:
             # Повертаємо помилки валідації
             errors = {}
             for field, field_errors in form.errors.items():
-                if field != 'honeypot':
-                    errors[field] = field_errors[0] if field_errors else 'Помилка валідації'
+                errors[field] = field_errors[0] if field_errors else 'Помилка валідації'
             
-            return JsonResponse({'success': False, 'errors': errors}, status=422)
+            response_data = {'success': False, 'errors': errors}
+            fresh_token = form.fresh_token()
+            if fresh_token:
+                # Скрипт лендінгу підставляє новий токен у форму для повторної відправки
+                response_data['form_token'] = fresh_token
+            return JsonResponse(response_data, status=422)
     
     except Exception as e:
-        logger.error(f'Error in corporate_form_submit: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in corporate_form_submit: %s', e)
         return JsonResponse({'success': False, 'error': 'Server error'}, status=500)
 
 
@@ -581,8 +786,7 @@ def corporate_thanks_view(request):
         }
         return render(request, 'corporate_thanks.html', context)
     except Exception as e:
-        logger.error(f'Error in corporate_thanks_view: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in corporate_thanks_view: %s', e)
         return HttpResponseServerError(f'Server error: {str(e)}')
 
 
@@ -597,7 +801,6 @@ def infidelity_thanks_view(request):
         }
         return render(request, 'infidelity_thanks.html', context)
     except Exception as e:
-        logger.error(f'Error in infidelity_thanks_view: {e}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in infidelity_thanks_view: %s', e)
         return HttpResponseServerError(f'Server error: {str(e)}')
 
@@ -154,6 +154,15 @@
    */
   function initHTMXListeners() {
 
+    // 422 - помилки валідації форм (та новий токен у hx-swap-oob): htmx за
+    // замовчуванням не вставляє 4xx відповіді, тому дозволяємо swap явно
+    document.body.addEventListener('htmx:beforeSwap', (event) => {
+      if (event.detail.xhr.status === 422) {
+        event.detail.shouldSwap = true;
+        event.detail.isError = false;
+      }
+    });
+
     // ПЕРЕД заміною контенту - виконуємо всі cleanup операції в правильному порядку
     document.body.addEventListener('htmx:beforeSwap', (event) => {
       // Перевіряємо що swap відбувається для main контенту
@@ -260,6 +269,26 @@
     });
   }
 
+  /**
+   * Реєструє service worker (/sw.js): кеш асетів, HTMX partials та offline сторінка
+   * Реєстрація після load, щоб precache не конкурував з першим рендером
+   */
+  function registerServiceWorker() {
+    if (!('serviceWorker' in navigator)) { return; }
+
+    const register = () => {
+      navigator.serviceWorker.register('/sw.js').catch((error) => {
+        console.error('[AppInit] Service worker registration failed:', error);
+      });
+    };
+
+    if (document.readyState === 'complete') {
+      register();
+    } else {
+      window.addEventListener('load', register);
+    }
+  }
+
   // ============================================================================
   // ПОЧАТКОВА ІНІЦІАЛІЗАЦІЯ
   // ============================================================================
@@ -271,6 +300,7 @@
     console.log('[AppInit] Initial page load - initializing');
     setupHTMXListeners();
     setupPageshowListener();
+    registerServiceWorker();
     
     // Синхронізуємо body класи при першому завантаженні
     syncBodyClasses();
@@ -16,6 +16,8 @@ function initializeForm() {
     if (!form) return;
 
     form.addEventListener('submit', handleFormSubmit);
+    // Сторінка могла бути відкрита давно або прийти з кешу - оновлюємо токен при першому фокусі
+    form.addEventListener('focusin', () => refreshFormToken(form), { once: true });
     
     // Маска для телефону
     const phoneInput = document.getElementById('form-phone');
@@ -24,6 +26,26 @@ function initializeForm() {
     }
 }
 
+/**
+ * Замінює токен фільтра ботів свіжим (час рендерингу сторінки зберігається)
+ * @param {HTMLFormElement} form - форма з полем form_token
+ */
+async function refreshFormToken(form) {
+    const tokenInput = form.querySelector('[name="form_token"][data-refresh-url]');
+    if (!tokenInput) return;
+
+    try {
+        const url = `${tokenInput.dataset.refreshUrl}?form_token=${encodeURIComponent(tokenInput.value)}`;
+        const response = await fetch(url, { headers: { 'Accept': 'application/json' } });
+        if (!response.ok) return;
+        const data = await response.json();
+        if (data.form_token) tokenInput.value = data.form_token;
+    } catch (error) {
+        // Лишається вбудований токен; застарілий сервер замінить у відповіді на відправку
+        console.warn('Form token refresh failed:', error);
+    }
+}
+
 /**
  * Обробка відправки форми
  * @param {Event} event - подія submit
@@ -63,6 +85,11 @@ async function handleFormSubmit(event) {
             return;
         } else {
             // Помилка валідації або серверна помилка
+            if (data.form_token) {
+                // Сторінка застаріла: новий токен для повторної відправки
+                const tokenInput = form.querySelector('[name="form_token"]');
+                if (tokenInput) tokenInput.value = data.form_token;
+            }
             if (data.errors) {
                 displayFieldErrors(data.errors, form);
             } else {
@@ -120,14 +147,14 @@ function formatPhoneInput(event) {
 
 /**
  * Показ помилок валідації для полів
- * @param {Object} errors - об'єкт з помилками {fieldName: 'error message'}
+ * @param {Object} errors - об'єкт з помилками {fieldName: 'error message'} (__all__ - помилки форми)
  * @param {HTMLFormElement} form - форма
  */
 function displayFieldErrors(errors, form) {
     Object.entries(errors).forEach(([fieldName, errorMessage]) => {
         const field = form.querySelector(`[name="${fieldName}"]`);
+        showMessage(errorMessage, 'error');
         if (field) {
-            showMessage(errorMessage, 'error');
             field.focus();
             field.classList.add('infidelity-form__input--error');
             
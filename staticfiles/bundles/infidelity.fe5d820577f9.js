@@ -0,0 +1,156 @@
+document.addEventListener('DOMContentLoaded', function() {
+initializeForm();
+initializeScrollBehavior();
+});
+function initializeForm() {
+const form = document.getElementById('infidelity-form');
+if (!form) return;
+form.addEventListener('submit', handleFormSubmit);
+const phoneInput = document.getElementById('form-phone');
+if (phoneInput) {
+phoneInput.addEventListener('input', formatPhoneInput);
+}
+}
+async function handleFormSubmit(event) {
+event.preventDefault();
+const form = event.target;
+const formData = new FormData(form);
+const messagesContainer = document.getElementById('form-messages');
+messagesContainer.innerHTML = '';
+const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]')?.value;
+if (!csrfToken) {
+showMessage('Помилка безпеки: CSRF токен не знайдено', 'error');
+return;
+}
+try {
+const response = await fetch('/perevirka-na-zradu/submit/', {
+method: 'POST',
+headers: {
+'X-CSRFToken': csrfToken,
+},
+body: formData,
+});
+const data = await response.json();
+if (data.success) {
+window.location.href = '/perevirka-na-zradu/thank-you/';
+return;
+} else {
+if (data.errors) {
+displayFieldErrors(data.errors, form);
+} else {
+showMessage(data.error || 'Помилка при відправці форми', 'error');
+}
+}
+} catch (error) {
+console.error('Form submission error:', error);
+showMessage('Помилка мережі. Спробуйте ще раз.', 'error');
+}
+}
+function formatPhoneInput(event) {
+let value = event.target.value.replace(/\D/g, '');
+if (value.length === 0) {
+event.target.value = '';
+return;
+}
+if (value.startsWith('8')) {
+value = '0' + value.substring(1);
+}
+if (!value.startsWith('38')) {
+value = '38' + value;
+}
+if (value.length > 12) {
+value = value.substring(0, 12);
+}
+if (value.length <= 2) {
+event.target.value = '+38(';
+} else if (value.length <= 5) {
+event.target.value = '+38(' + value.substring(2);
+} else if (value.length <= 8) {
+event.target.value = '+38(' + value.substring(2, 5) + ') ' + value.substring(5);
+} else if (value.length <= 10) {
+event.target.value = '+38(' + value.substring(2, 5) + ') ' + value.substring(5, 8) + '-' + value.substring(8);
+} else {
+event.target.value = '+38(' + value.substring(2, 5) + ') ' + value.substring(5, 8) + '-' + value.substring(8, 10) + '-' + value.substring(10);
+}
+}
+function displayFieldErrors(errors, form) {
+Object.entries(errors).forEach(([fieldName, errorMessage]) => {
+const field = form.querySelector(`[name="${fieldName}"]`);
+if (field) {
+showMessage(errorMessage, 'error');
+field.focus();
+field.classList.add('infidelity-form__input--error');
+field.addEventListener('input', function() {
+this.classList.remove('infidelity-form__input--error');
+}, { once: true });
+}
+});
+}
+function showMessage(message, type = 'error') {
+const messagesContainer = document.getElementById('form-messages');
+if (!messagesContainer) return;
+const messageElement = document.createElement('div');
+messageElement.className = `infidelity-message infidelity-message--${type}`;
+messageElement.textContent = message;
+messagesContainer.appendChild(messageElement);
+setTimeout(() => {
+messageElement.remove();
+}, 5000);
+}
+function hideForm() {
+const form = document.getElementById('infidelity-form');
+if (form) {
+form.style.display = 'none';
+}
+}
+function showSuccessMessage() {
+const successElement = document.getElementById('form-success');
+if (successElement) {
+successElement.style.display = 'block';
+}
+}
+function scrollToForm() {
+const formSection = document.getElementById('form-section');
+if (formSection) {
+formSection.scrollIntoView({ behavior: 'smooth', block: 'center' });
+}
+}
+function initializeScrollBehavior() {
+document.querySelectorAll('a[href^="#"]').forEach(link => {
+link.addEventListener('click', function(e) {
+const href = this.getAttribute('href');
+if (href === '#') return;
+e.preventDefault();
+const target = document.querySelector(href);
+if (target) {
+target.scrollIntoView({ behavior: 'smooth' });
+}
+});
+});
+}
+function validateForm(form) {
+const name = form.querySelector('[name="name"]')?.value?.trim();
+const phone = form.querySelector('[name="phone"]')?.value?.trim();
+if (!name) {
+showMessage('Будь ласка, введіть ім\'я', 'error');
+return false;
+}
+if (!phone) {
+showMessage('Будь ласка, введіть номер телефону', 'error');
+return false;
+}
+const phoneDigits = phone.replace(/\D/g, '');
+if (phoneDigits.length < 10) {
+showMessage('Номер телефону занадто короткий', 'error');
+return false;
+}
+return true;
+}
+const styleSheet = document.createElement('style');
+styleSheet.textContent = `
+.infidelity-form__input--error {
+border-color: #dc2626;
+background-color: rgba(220, 38, 38, 0.1);
+}
+`;
+document.head.appendChild(styleSheet);
\ No newline at end of file
@@ -0,0 +1,798 @@
+window.HTMXUtils = (function() {
+'use strict';
+function waitForHTMX(callback, delay, maxAttempts) {
+delay = delay || 100;
+maxAttempts = maxAttempts || 50;
+let attempts = 0;
+function check() {
+attempts++;
+if (typeof htmx !== 'undefined') {
+callback();
+} else if (attempts < maxAttempts) {
+setTimeout(check, delay);
+} else {
+console.warn('[HTMXUtils] HTMX не завантажено після', attempts, 'спроб');
+}
+}
+check();
+}
+function isHTMXLoaded() {
+return typeof htmx !== 'undefined';
+}
+return {
+waitForHTMX: waitForHTMX,
+isHTMXLoaded: isHTMXLoaded
+};
+})();;
+window.HeaderModule = (function() {
+'use strict';
+let capsule = null;
+let toggleButton = null;
+let nav = null;
+let listeners = [];
+let closeTimeout = null;
+function openMenu() {
+if (!capsule || !toggleButton || !nav) { return; }
+if (closeTimeout) {
+clearTimeout(closeTimeout);
+closeTimeout = null;
+}
+capsule.setAttribute('data-open', 'true');
+toggleButton.setAttribute('aria-expanded', 'true');
+toggleButton.setAttribute('aria-label', 'Закрити меню');
+nav.removeAttribute('hidden');
+const firstLink = nav.querySelector('.header__nav-link');
+if (firstLink) {
+setTimeout(() => {
+firstLink.focus();
+}, 1000);
+}
+}
+function closeMenu() {
+if (!capsule || !toggleButton || !nav) { return; }
+capsule.setAttribute('data-open', 'false');
+toggleButton.setAttribute('aria-expanded', 'false');
+toggleButton.setAttribute('aria-label', 'Відкрити меню');
+closeTimeout = setTimeout(() => {
+nav.setAttribute('hidden', '');
+}, 700);
+toggleButton.focus();
+}
+function toggleMenu() {
+if (!capsule) { return; }
+const isOpen = capsule.getAttribute('data-open') === 'true';
+if (isOpen) {
+closeMenu();
+} else {
+openMenu();
+}
+}
+function init() {
+capsule = document.querySelector('.header__capsule');
+toggleButton = capsule ? capsule.querySelector('.header__toggle') : null;
+nav = capsule ? capsule.querySelector('.header__nav') : null;
+if (!capsule || !toggleButton || !nav) {
+console.log('[Header] Required elements not found');
+return null;
+}
+const handleToggle = function(e) {
+e.stopPropagation();
+toggleMenu();
+};
+const handleDocumentClick = function(e) {
+if (!capsule) { return; }
+if (capsule.contains(e.target)) { return; }
+const clickedLink = e.target.closest('a[hx-get], a[hx-post]');
+if (clickedLink) { return; }
+const interactiveElements = ['button', 'input', 'select', 'textarea', 'a'];
+if (interactiveElements.includes(e.target.tagName.toLowerCase())) {
+const isImportantElement = e.target.closest('.footer, .hero, .accordion');
+if (isImportantElement) { return; }
+}
+closeMenu();
+};
+const handleEscape = function(e) {
+if (e.key === 'Escape' || e.key === 'Esc') {
+closeMenu();
+}
+};
+const navLinks = nav.querySelectorAll('.header__nav-link');
+const handleLinkClick = function(_e) {
+setTimeout(() => {
+closeMenu();
+}, 50);
+};
+const addListener = function(el, event, fn) {
+el.addEventListener(event, fn);
+listeners.push({ el: el, event: event, fn: fn });
+};
+addListener(toggleButton, 'click', handleToggle);
+addListener(document, 'click', handleDocumentClick);
+addListener(document, 'keydown', handleEscape);
+navLinks.forEach((link) => {
+addListener(link, 'click', handleLinkClick);
+});
+console.log('[Header] Module initialized');
+return {
+destroy: destroy,
+close: closeMenu,
+open: openMenu
+};
+}
+function destroy() {
+console.log('[Header] Destroying module');
+if (closeTimeout) {
+clearTimeout(closeTimeout);
+closeTimeout = null;
+}
+listeners.forEach((listener) => {
+listener.el.removeEventListener(listener.event, listener.fn);
+});
+listeners = [];
+capsule = null;
+toggleButton = null;
+nav = null;
+}
+return {
+init: init
+};
+})();;
+window.AccordionModule = (function() {
+'use strict';
+let accordions = [];
+let listeners = [];
+let activeAccordion = null;
+let countersAnimated = false;
+function animateCounter(element, duration = 1500) {
+const text = element.textContent.trim();
+const target = parseInt(text, 10) || 0;
+if (target === 0) { return; }
+const start = 0;
+const startTime = performance.now();
+const isPercentage = text.includes('%');
+const suffix = isPercentage ? '%' : '+';
+function updateCounter(currentTime) {
+const elapsed = currentTime - startTime;
+const progress = Math.min(elapsed / duration, 1);
+const eased = 1 - Math.pow(1 - progress, 3);
+const current = Math.floor(start + (target - start) * eased);
+element.textContent = current + suffix;
+if (progress < 1) {
+requestAnimationFrame(updateCounter);
+} else {
+element.textContent = target + suffix;
+}
+}
+requestAnimationFrame(updateCounter);
+}
+function animateAllCounters() {
+if (countersAnimated) { return; }
+countersAnimated = true;
+const counters = document.querySelectorAll('.accordion__stat-number');
+counters.forEach((counter) => {
+animateCounter(counter, 2000);
+});
+}
+function getContentHeight(accordion) {
+const content = accordion.querySelector('.accordion__content');
+if (!content) { return 0; }
+const wasExpanded = accordion.getAttribute('aria-expanded') === 'true';
+if (!wasExpanded) {
+const originalHeight = content.style.height;
+const originalMaxHeight = content.style.maxHeight;
+const originalOverflow = content.style.overflow;
+content.style.height = 'auto';
+content.style.maxHeight = 'none';
+content.style.overflow = 'visible';
+const height = content.scrollHeight;
+content.style.height = originalHeight;
+content.style.maxHeight = originalMaxHeight;
+content.style.overflow = originalOverflow;
+return height;
+}
+return content.scrollHeight;
+}
+function closeAllAccordions() {
+accordions.forEach((accordion) => {
+if (accordion.getAttribute('aria-expanded') === 'true') {
+closeAccordion(accordion);
+}
+});
+}
+function openAccordion(accordion) {
+const content = accordion.querySelector('.accordion__content');
+if (!content) { return; }
+const height = getContentHeight(accordion);
+accordion.style.setProperty('--content-height', `${height  }px`);
+accordion.classList.add('accordion--opening');
+accordion.setAttribute('aria-expanded', 'true');
+if (activeAccordion === null) {
+animateAllCounters();
+}
+const handleTransitionEnd = function() {
+accordion.classList.remove('accordion--opening');
+accordion.classList.add('accordion--expanded');
+requestAnimationFrame(() => {
+content.style.willChange = 'auto';
+});
+content.removeEventListener('transitionend', handleTransitionEnd);
+};
+content.addEventListener('transitionend', handleTransitionEnd, { once: true });
+requestAnimationFrame(() => {
+accordion.scrollIntoView({
+behavior: 'smooth',
+block: 'start',
+inline: 'nearest'
+});
+});
+activeAccordion = accordion;
+}
+function closeAccordion(accordion) {
+const content = accordion.querySelector('.accordion__content');
+if (!content) { return; }
+accordion.classList.remove('accordion--expanded');
+accordion.classList.add('accordion--closing');
+accordion.setAttribute('aria-expanded', 'false');
+const handleTransitionEnd = function() {
+accordion.classList.remove('accordion--closing');
+requestAnimationFrame(() => {
+content.style.willChange = 'auto';
+});
+content.removeEventListener('transitionend', handleTransitionEnd);
+};
+content.addEventListener('transitionend', handleTransitionEnd, { once: true });
+activeAccordion = null;
+}
+function createHeaderClickHandler(accordion) {
+return function(e) {
+e.stopPropagation();
+const isExpanded = accordion.getAttribute('aria-expanded') === 'true';
+if (isExpanded) {
+closeAccordion(accordion);
+} else {
+closeAllAccordions();
+openAccordion(accordion);
+}
+};
+}
+function createHeaderKeydownHandler(header) {
+return function(e) {
+if (e.key === 'Enter' || e.key === ' ') {
+e.preventDefault();
+header.click();
+}
+};
+}
+function createDocumentClickHandler() {
+return function(e) {
+const clickedInsideAccordion = e.target.closest('.accordion');
+if (!clickedInsideAccordion) {
+closeAllAccordions();
+}
+};
+}
+function createDocumentKeydownHandler() {
+return function(e) {
+if (e.key === 'Escape') {
+closeAllAccordions();
+}
+};
+}
+function init() {
+accordions = Array.from(document.querySelectorAll('.accordion'));
+if (accordions.length === 0) {
+console.log('[Accordion] No accordions found on page');
+return null;
+}
+console.log('[Accordion] Found', accordions.length, 'accordions');
+listeners = [];
+accordions.forEach((accordion) => {
+const header = accordion.querySelector('.accordion__header');
+if (!header) {
+return;
+}
+const clickHandler = createHeaderClickHandler(accordion);
+const keydownHandler = createHeaderKeydownHandler(header);
+header.addEventListener('click', clickHandler);
+header.addEventListener('keydown', keydownHandler);
+listeners.push(
+{ el: header, event: 'click', fn: clickHandler },
+{ el: header, event: 'keydown', fn: keydownHandler }
+);
+});
+const docClickHandler = createDocumentClickHandler();
+const docKeydownHandler = createDocumentKeydownHandler();
+document.addEventListener('click', docClickHandler);
+document.addEventListener('keydown', docKeydownHandler);
+listeners.push(
+{ el: document, event: 'click', fn: docClickHandler },
+{ el: document, event: 'keydown', fn: docKeydownHandler }
+);
+return {
+destroy: destroy
+};
+}
+function destroy() {
+console.log('[Accordion] Destroying module, removing', listeners.length, 'listeners');
+listeners.forEach((listener) => {
+listener.el.removeEventListener(listener.event, listener.fn);
+});
+listeners = [];
+accordions = [];
+activeAccordion = null;
+}
+return {
+init: init
+};
+})();;
+window.FooterAccordionModule = (function() {
+'use strict';
+let footerAccordions = [];
+let listeners = [];
+function isMobile() {
+return window.matchMedia('(max-width: 767px)').matches;
+}
+function closeAccordion(accordion) {
+accordion.setAttribute('aria-expanded', 'false');
+}
+function openAccordion(accordion) {
+accordion.setAttribute('aria-expanded', 'true');
+}
+function createClickHandler(accordion, _header) {
+return function(e) {
+if (!isMobile()) {
+return;
+}
+e.stopPropagation();
+const isExpanded = accordion.getAttribute('aria-expanded') === 'true';
+if (isExpanded) {
+closeAccordion(accordion);
+} else {
+openAccordion(accordion);
+}
+};
+}
+function createKeydownHandler(header) {
+return function(e) {
+if (!isMobile()) {
+return;
+}
+if (e.key === 'Enter' || e.key === ' ') {
+e.preventDefault();
+header.click();
+}
+};
+}
+function createEscapeHandler() {
+return function(e) {
+if (e.key === 'Escape' && isMobile()) {
+footerAccordions.forEach((accordion) => {
+closeAccordion(accordion);
+});
+}
+};
+}
+function updateAccordionState(accordion) {
+if (!isMobile()) {
+accordion.classList.add('footer__accordion--desktop');
+openAccordion(accordion);
+} else {
+accordion.classList.remove('footer__accordion--desktop');
+}
+}
+function init() {
+footerAccordions = Array.from(document.querySelectorAll('.footer__accordion'));
+if (footerAccordions.length === 0) {
+console.log('[FooterAccordion] No accordions found');
+return null;
+}
+console.log('[FooterAccordion] Found', footerAccordions.length, 'accordions');
+listeners = [];
+footerAccordions.forEach((accordion) => {
+const header = accordion.querySelector('.footer__accordion-header');
+if (!header) {
+return;
+}
+const formColumn = accordion.closest('.footer__form-column');
+if (formColumn) {
+return;
+}
+updateAccordionState(accordion);
+const clickHandler = createClickHandler(accordion, header);
+const keydownHandler = createKeydownHandler(header);
+const resizeHandler = function() {
+updateAccordionState(accordion);
+};
+header.addEventListener('click', clickHandler);
+header.addEventListener('keydown', keydownHandler);
+window.addEventListener('resize', resizeHandler);
+listeners.push(
+{ el: header, event: 'click', fn: clickHandler },
+{ el: header, event: 'keydown', fn: keydownHandler },
+{ el: window, event: 'resize', fn: resizeHandler }
+);
+});
+const escapeHandler = createEscapeHandler();
+document.addEventListener('keydown', escapeHandler);
+listeners.push({ el: document, event: 'keydown', fn: escapeHandler });
+return {
+destroy: destroy
+};
+}
+function destroy() {
+console.log('[FooterAccordion] Destroying module, removing', listeners.length, 'listeners');
+listeners.forEach((listener) => {
+listener.el.removeEventListener(listener.event, listener.fn);
+});
+listeners = [];
+footerAccordions = [];
+}
+return {
+init: init
+};
+})();;
+(function () {
+'use strict';
+let heroInstance = null;
+function createHeroController() {
+const controller = {
+video: null,
+videoWrapper: null,
+textElements: null,
+textAnimated: false,
+listeners: [],
+rafId: null,
+scrollTicking: false,
+initAttempts: 0,
+visibilityTimeout: null,
+init: function () {
+this.video = document.querySelector('.hero__video');
+this.videoWrapper = document.querySelector('.hero__video-wrapper');
+this.textElements = document.querySelectorAll('.hero__text');
+if (!this.video || !this.videoWrapper || !this.textElements.length) {
+if (this.initAttempts < 10) {
+this.initAttempts++;
+const self = this;
+setTimeout(() => { self.init(); }, 10);
+}
+return;
+}
+if (sessionStorage.getItem('heroVideoCompleted') === 'true') {
+this.setupStaticMode();
+return;
+}
+this.textElements.forEach((el) => {
+el.classList.remove('hero__text--visible');
+el.classList.remove('hero__text--static');
+el.classList.remove('hero__text--error');
+});
+const self = this;
+this.video.addEventListener('canplay', () => {
+self.video.classList.add('hero__video--visible');
+if (self.visibilityTimeout) {
+clearTimeout(self.visibilityTimeout);
+self.visibilityTimeout = null;
+}
+}, { once: true });
+this.visibilityTimeout = setTimeout(() => {
+if (!self.video.classList.contains('hero__video--visible')) {
+self.video.classList.add('hero__video--visible');
+}
+self.visibilityTimeout = null;
+}, 2000);
+this.video.controls = false;
+this.video.loop = false;
+this.setupVideoListeners();
+this.setupParallax();
+},
+setupStaticMode: function () {
+const self = this;
+this.video.autoplay = false;
+this.video.pause();
+this.video.classList.add('hero__video--static', 'hero__video--ended', 'hero__video--visible');
+this.textElements.forEach((el) => {
+el.classList.add('hero__text--static');
+});
+function setLastFrame() {
+if (self.video.duration && !isNaN(self.video.duration)) {
+self.video.currentTime = self.video.duration - 0.1;
+return true;
+}
+return false;
+}
+if (!setLastFrame()) {
+this.video.addEventListener('loadedmetadata', () => {
+setLastFrame();
+}, { once: true });
+setTimeout(() => {
+setLastFrame();
+}, 500);
+}
+this.setupParallax();
+},
+setupVideoListeners: function () {
+const self = this;
+const onTimeUpdate = function () {
+if (self.video.currentTime >= 5 && !self.textAnimated) {
+self.triggerTextAnimation();
+}
+};
+const onEnded = function () {
+self.video.classList.add('hero__video--ended');
+self.video.pause();
+self.video.currentTime = self.video.duration - 0.1;
+self.video.controls = false;
+sessionStorage.setItem('heroVideoCompleted', 'true');
+};
+const onError = function () {
+console.warn('Hero video load failed');
+self.textElements.forEach((el) => {
+el.classList.add('hero__text--error');
+});
+};
+this.video.addEventListener('timeupdate', onTimeUpdate);
+this.video.addEventListener('ended', onEnded);
+this.video.addEventListener('error', onError);
+this.listeners.push(
+{ el: this.video, event: 'timeupdate', fn: onTimeUpdate },
+{ el: this.video, event: 'ended', fn: onEnded },
+{ el: this.video, event: 'error', fn: onError }
+);
+},
+triggerTextAnimation: function () {
+if (this.textAnimated) {return;}
+this.textAnimated = true;
+const self = this;
+requestAnimationFrame(() => {
+requestAnimationFrame(() => {
+self.textElements.forEach((el) => {
+el.classList.add('hero__text--visible');
+});
+});
+});
+},
+setupParallax: function () {
+const self = this;
+const onScroll = function () {
+if (!self.scrollTicking) {
+self.rafId = requestAnimationFrame(() => {
+self.updateParallax();
+self.scrollTicking = false;
+});
+self.scrollTicking = true;
+}
+};
+window.addEventListener('scroll', onScroll, { passive: true });
+this.listeners.push({ el: window, event: 'scroll', fn: onScroll });
+},
+updateParallax: function () {
+if (!this.videoWrapper) {return;}
+const scrolled = window.pageYOffset;
+const heroHeight = this.videoWrapper.offsetHeight;
+if (scrolled < heroHeight) {
+const parallaxValue = scrolled * 0.5;
+this.videoWrapper.style.setProperty('--parallax-offset', `${parallaxValue  }px`);
+}
+},
+destroy: function () {
+this.listeners.forEach((listener) => {
+listener.el.removeEventListener(listener.event, listener.fn);
+});
+this.listeners = [];
+if (this.rafId) {
+cancelAnimationFrame(this.rafId);
+this.rafId = null;
+}
+if (this.visibilityTimeout) {
+clearTimeout(this.visibilityTimeout);
+this.visibilityTimeout = null;
+}
+if (this.video) {
+this.video.pause();
+this.video.classList.remove('hero__video--static');
+this.video = null;
+}
+if (this.textElements) {
+this.textElements.forEach((el) => {
+el.classList.remove('hero__text--static');
+el.classList.remove('hero__text--error');
+});
+}
+this.videoWrapper = null;
+this.textElements = null;
+this.textAnimated = false;
+this.scrollTicking = false;
+this.initAttempts = 0;
+}
+};
+return controller;
+}
+window.createHeroController = createHeroController;
+function initOnLoad() {
+const heroSection = document.querySelector('[data-hero-section]');
+if (heroSection) {
+heroInstance = createHeroController();
+heroInstance.init();
+window.heroInstance = heroInstance;
+}
+}
+if (document.readyState === 'loading') {
+document.addEventListener('DOMContentLoaded', initOnLoad);
+} else {
+initOnLoad();
+}
+})();;
+(function() {
+'use strict';
+const moduleRegistry = {
+header: null,
+accordion: null,
+footerAccordion: null
+};
+function initAllModules() {
+if (window.HeaderModule) {
+moduleRegistry.header = window.HeaderModule.init();
+}
+const accordions = document.querySelectorAll('.accordion');
+if (accordions.length > 0 && window.AccordionModule) {
+moduleRegistry.accordion = window.AccordionModule.init();
+}
+if (window.FooterAccordionModule) {
+moduleRegistry.footerAccordion = window.FooterAccordionModule.init();
+}
+console.log('[AppInit] Modules initialized:', Object.keys(moduleRegistry).filter(k => moduleRegistry[k]));
+}
+function cleanupAllModules() {
+Object.keys(moduleRegistry).forEach((key) => {
+const module = moduleRegistry[key];
+if (module && typeof module.destroy === 'function') {
+module.destroy();
+console.log('[AppInit] Destroyed:', key);
+}
+moduleRegistry[key] = null;
+});
+}
+function syncBodyClasses() {
+const mainElement = document.getElementById('main');
+if (!mainElement) { return; }
+document.body.classList.remove('body--index', 'body--about');
+if (mainElement.classList.contains('main--index')) {
+document.body.classList.add('body--index');
+console.log('[AppInit] Added body--index class');
+} else if (mainElement.classList.contains('main--about')) {
+document.body.classList.add('body--about');
+console.log('[AppInit] Added body--about class');
+}
+}
+function updateNavigationActiveState() {
+const navLinks = document.querySelectorAll('.header__nav-link');
+if (navLinks.length === 0) { return; }
+const currentPath = window.location.pathname;
+navLinks.forEach((link) => {
+link.removeAttribute('aria-current');
+});
+navLinks.forEach((link) => {
+const linkPath = new URL(link.href).pathname;
+const normalizedCurrentPath = currentPath.endsWith('/') ? currentPath : currentPath + '/';
+const normalizedLinkPath = linkPath.endsWith('/') ? linkPath : linkPath + '/';
+if (normalizedCurrentPath === '/' || normalizedCurrentPath === '/index/') {
+if (normalizedLinkPath === '/' || normalizedLinkPath === '/index/') {
+link.setAttribute('aria-current', 'page');
+console.log('[AppInit] Set aria-current="page" for:', link.textContent.trim());
+return;
+}
+}
+if (normalizedCurrentPath === normalizedLinkPath) {
+link.setAttribute('aria-current', 'page');
+console.log('[AppInit] Set aria-current="page" for:', link.textContent.trim());
+}
+});
+}
+function setupHTMXListeners() {
+if (window.HTMXUtils) {
+window.HTMXUtils.waitForHTMX(initHTMXListeners);
+} else {
+if (typeof htmx === 'undefined') {
+setTimeout(setupHTMXListeners, 100);
+return;
+}
+initHTMXListeners();
+}
+}
+function initHTMXListeners() {
+document.body.addEventListener('htmx:beforeSwap', (event) => {
+if (event.detail.target && event.detail.target.id === 'main') {
+console.log('[AppInit] beforeSwap - cleaning up modules');
+cleanupAllModules();
+if (window.heroInstance) {
+if (typeof window.heroInstance.destroy === 'function') {
+window.heroInstance.destroy();
+}
+window.heroInstance = null;
+}
+}
+});
+document.body.addEventListener('htmx:afterSwap', (event) => {
+if (event.detail.target && event.detail.target.id === 'main') {
+console.log('[AppInit] afterSwap - reinitializing modules');
+syncBodyClasses();
+updateNavigationActiveState();
+setTimeout(() => {
+initAllModules();
+const heroSection = document.querySelector('[data-hero-section]');
+if (heroSection && !window.heroInstance && window.createHeroController) {
+window.heroInstance = window.createHeroController();
+window.heroInstance.init();
+}
+if (window.location.hash) {
+const hash = window.location.hash.substring(1);
+const targetElement = document.getElementById(hash);
+if (targetElement) {
+setTimeout(() => {
+if (targetElement.classList.contains('accordion')) {
+const header = targetElement.querySelector('.accordion__header');
+if (header) {
+header.click();
+setTimeout(() => {
+targetElement.scrollIntoView({
+behavior: 'smooth',
+block: 'start'
+});
+}, 100);
+}
+} else {
+targetElement.scrollIntoView({
+behavior: 'smooth',
+block: 'start'
+});
+}
+}, 200);
+}
+}
+}, 50);
+}
+});
+document.body.addEventListener('htmx:responseError', (event) => {
+console.error('[AppInit] HTMX response error:', event.detail);
+});
+document.body.addEventListener('htmx:sendError', (event) => {
+console.error('[AppInit] HTMX send error:', event.detail);
+});
+console.log('[AppInit] HTMX listeners set up');
+}
+function setupPageshowListener() {
+window.addEventListener('pageshow', (event) => {
+if (event.persisted) {
+console.log('[AppInit] Page loaded from bfcache - reinitializing');
+initAllModules();
+}
+});
+}
+function registerServiceWorker() {
+if (!('serviceWorker' in navigator)) { return; }
+const register = () => {
+navigator.serviceWorker.register('/sw.js').catch((error) => {
+console.error('[AppInit] Service worker registration failed:', error);
+});
+};
+if (document.readyState === 'complete') {
+register();
+} else {
+window.addEventListener('load', register);
+}
+}
+function init() {
+console.log('[AppInit] Initial page load - initializing');
+setupHTMXListeners();
+setupPageshowListener();
+registerServiceWorker();
+syncBodyClasses();
+updateNavigationActiveState();
+initAllModules();
+}
+if (document.readyState === 'loading') {
+document.addEventListener('DOMContentLoaded', init);
+} else {
+init();
+}
+})();
\ No newline at end of file
@@ -0,0 +1,126 @@
+/**
+ * Service worker PolygraphNew (генерується pages.views.sw_js)
+ *
+ * СТРАТЕГІЇ:
+ * - static (/static/): cache-first, файли precache з маніфестів build_assets
+ *   (імена з хешем вмісту - кешована копія ніколи не застаріває)
+ * - навігація та HTMX partials: мережа; відповіді сторінок SERVICE_WORKER_ROUTES
+ *   оновлюють кеш, який використовується лише без мережі (далі - offline сторінка).
+ *   HTML не віддається з кешу при живій мережі: сторінки містять токени форм
+ *   і CSRF, а застаріла копія показувала б старий вміст
+ * - POST та сторонні домени не перехоплюються
+ */
+
+'use strict';
+
+const CONFIG = {{ config_json|safe }};
+
+const CACHE_PREFIX = 'polygraph-';
+const STATIC_CACHE = `${CACHE_PREFIX}static-${CONFIG.version}`;
+const PAGES_CACHE = `${CACHE_PREFIX}pages-${CONFIG.version}`;
+const PARTIALS_CACHE = `${CACHE_PREFIX}partials-${CONFIG.version}`;
+const CURRENT_CACHES = [STATIC_CACHE, PAGES_CACHE, PARTIALS_CACHE];
+
+function partialRequest(url) {
+  return new Request(url, { headers: { 'HX-Request': 'true' }, credentials: 'same-origin' });
+}
+
+function isHTMXRequest(request) {
+  return request.headers.get('HX-Request') === 'true';
+}
+
+function isCacheable(response) {
+  return response && response.ok && response.type === 'basic';
+}
+
+// Кешуємо за URL: HTMX partial і повна сторінка живуть у різних кешах
+async function putInCache(cacheName, url, response) {
+  if (!isCacheable(response)) { return; }
+  const cache = await caches.open(cacheName);
+  await cache.put(url, response);
+}
+
+self.addEventListener('install', (event) => {
+  event.waitUntil((async () => {
+    const staticCache = await caches.open(STATIC_CACHE);
+    await staticCache.addAll(CONFIG.precache);
+
+    const pagesCache = await caches.open(PAGES_CACHE);
+    await pagesCache.addAll([CONFIG.offline_url, ...CONFIG.routes]);
+
+    // Partials для HTMX навігації - кожен окремо, помилка одного не зриває встановлення
+    await Promise.all([...CONFIG.routes, CONFIG.offline_url].map(async (url) => {
+      try {
+        await putInCache(PARTIALS_CACHE, url, await fetch(partialRequest(url)));
+      } catch (error) {
+        console.warn('[SW] Partial не закешовано:', url, error);
+      }
+    }));
+
+    await self.skipWaiting();
+  })());
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil((async () => {
+    const names = await caches.keys();
+    await Promise.all(names
+      .filter((name) => name.startsWith(CACHE_PREFIX) && !CURRENT_CACHES.includes(name))
+      .map((name) => caches.delete(name)));
+    await self.clients.claim();
+  })());
+});
+
+async function cacheFirst(request) {
+  const cached = await caches.match(request, { cacheName: STATIC_CACHE });
+  if (cached) { return cached; }
+  const response = await fetch(request);
+  await putInCache(STATIC_CACHE, request.url, response.clone());
+  return response;
+}
+
+async function networkFirst(request, cacheName, updateCache, fallback) {
+  try {
+    const response = await fetch(request);
+    if (updateCache) {
+      await putInCache(cacheName, request.url, response.clone());
+    }
+    return response;
+  } catch (error) {
+    const cached = await caches.match(request.url, { cacheName });
+    return cached || fallback();
+  }
+}
+
+function offlinePage() {
+  return caches.match(CONFIG.offline_url, { cacheName: PAGES_CACHE });
+}
+
+async function offlinePartial() {
+  const cached = await caches.match(CONFIG.offline_url, { cacheName: PARTIALS_CACHE });
+  return cached || new Response('', { status: 503, statusText: 'Offline' });
+}
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') { return; }
+
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) { return; }
+
+  if (url.pathname.startsWith(CONFIG.static_url)) {
+    event.respondWith(cacheFirst(request));
+    return;
+  }
+
+  const isRoute = CONFIG.routes.includes(url.pathname);
+
+  if (isHTMXRequest(request)) {
+    event.respondWith(networkFirst(request, PARTIALS_CACHE, isRoute, offlinePartial));
+    return;
+  }
+
+  if (request.mode === 'navigate') {
+    event.respondWith(networkFirst(request, PAGES_CACHE, isRoute, offlinePage));
+  }
+});